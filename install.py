@@ -14,8 +14,6 @@ import os
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import shutil
-
 from scripts import config
 from scripts.install import ArgumentsDefiner
 from scripts.install.colors_definer import ColorsDefiner
@@ -23,6 +21,7 @@ from scripts.install.global_theme_installer import GlobalThemeInstaller
 from scripts.install.local_theme_installer import LocalThemeInstaller
 from scripts.utils.gnome import apply_gnome_theme
 from scripts.utils.logger.console import Console
+from scripts.utils.workspace import Workspace
 
 
 def main():
@@ -49,7 +48,5 @@ def main():
 
 
 if __name__ == "__main__":
-    try:
-        main()
-    finally:
-        shutil.rmtree(config.temp_folder, ignore_errors=True)
\ No newline at end of file
+    with Workspace():
+        main()
\ No newline at end of file
@@ -3,12 +3,14 @@ from tempfile import gettempdir
 
 # folder definitions
 marble_folder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# replaced with a unique folder for every run, see scripts/utils/workspace.py
 temp_folder = os.path.join(gettempdir(), 'marble')
 temp_tests_folder = os.path.join(temp_folder, 'tests')
 gdm_folder = "gdm"
 tweaks_folder = "tweaks"
 themes_folder = os.path.expanduser("~/.themes")
 raw_theme_folder = "theme"
+cache_folder = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "marble")
 
 # GDM definitions
 global_gnome_shell_theme = "/usr/share/gnome-shell"
@@ -20,4 +22,12 @@ extracted_gdm_folder = "theme"
 tweak_file = f"./{tweaks_folder}/*/tweak.py"
 colors_json = os.path.join(marble_folder, "colors.json")
 
+# cache definitions
+output_cache_folder = os.path.join(cache_folder, "themes")
+output_cache_size = 128 * 1024 * 1024
+gdm_stock_cache_folder = os.path.join(cache_folder, "gdm")
+gdm_stock_cache_size = 64 * 1024 * 1024
+gdm_image_cache_folder = os.path.join(cache_folder, "gdm-images")
+gdm_image_cache_size = 128 * 1024 * 1024
+
 user_themes_extension = "/org/gnome/shell/extensions/user-theme/name"
@@ -1,4 +1,5 @@
 import argparse
+import os
 import textwrap
 from typing import Any
 
@@ -7,6 +8,7 @@ from scripts.tweaks_manager import TweaksManager
 
 class ArgumentsDefiner:
     def __init__(self, colors: dict[str, Any]):
+        self._colors = colors
         self._parser = argparse.ArgumentParser(prog="python install.py",
                                                formatter_class=argparse.RawDescriptionHelpFormatter,
                                                epilog=self._get_epilog())
@@ -16,11 +18,35 @@ class ArgumentsDefiner:
         self._define_custom_color_arguments()
         self._define_theme_styles_arguments()
         self._define_color_tweaks_arguments()
-        self._define_gdm_arguments()
+        self._define_gdm_arguments(colors)
+        self._define_performance_arguments()
         self._define_tweaks_arguments()
 
-    def parse(self) -> argparse.Namespace:
-        return self._parser.parse_args()
+    def parse(self, args: list[str] | None = None) -> argparse.Namespace:
+        parsed = self._parser.parse_args(args)
+        self._validate_gdm_arguments(parsed)
+        return parsed
+
+    def _validate_gdm_arguments(self, args: argparse.Namespace):
+        """
+        Several colors are compiled into separate files, which must not be left in the system folder.
+        Only one of them can be activated.
+        """
+        if args.gdm_activate and not args.gdm:
+            self._parser.error("--gdm-activate requires --gdm")
+        if not args.gdm or args.remove:
+            return
+
+        selected_colors = [] if args.hue else [color for color in self._colors
+                                               if args.all or getattr(args, color, False)]
+        is_batch = len(selected_colors) > 1
+        if is_batch and not args.gdm_output:
+            self._parser.error("--gdm-output is required when several colors are selected with --gdm")
+        if args.gdm_activate and not is_batch:
+            self._parser.error("--gdm-activate is used only when several colors are selected with --gdm")
+        if args.gdm_activate and args.gdm_activate not in selected_colors:
+            self._parser.error(f"--gdm-activate {args.gdm_activate} is not one of the selected colors: "
+                               f"{', '.join(selected_colors)}")
 
     @staticmethod
     def _get_epilog():
@@ -63,10 +89,36 @@ class ArgumentsDefiner:
                                   help='custom color saturation (<100%% - reduce, >100%% - increase)',
                                   metavar='(0 - 250)')
 
-    def _define_gdm_arguments(self):
+    def _define_gdm_arguments(self, colors: dict[str, Any]):
         gdm_theming = self._parser.add_argument_group('GDM theming')
         gdm_theming.add_argument('--gdm', action='store_true', help='install GDM theme. \
                                             Requires root privileges. You must specify a specific color.')
+        gdm_theming.add_argument('--gdm-output', metavar='FOLDER',
+                                 help='folder for gnome-shell-theme-<color>.gresource files. '
+                                      'Required if several colors are selected')
+        gdm_theming.add_argument('--gdm-prune-resources', action='store_true',
+                                 help='leave out stock resources which are not referenced by theme styles. '
+                                      'Resources loaded only by GNOME Shell code are left out too')
+        gdm_theming.add_argument('--gdm-activate', choices=list(colors), metavar='COLOR',
+                                 help='color which is set as the GDM theme, if several colors are selected')
+
+    def _define_performance_arguments(self):
+        performance = self._parser.add_argument_group('Installation performance')
+        performance.add_argument('--processes', type=self._positive_int, nargs='?', const=os.cpu_count() or 1, metavar='N',
+                                 help='render colors in N separate processes (default: number of CPUs). '
+                                      'For GDM, extract stock resources in N parallel jobs')
+        performance.add_argument('--no-cache', action='store_true',
+                                 help='build themes from sources, even if the same themes are cached or already installed')
+
+    @staticmethod
+    def _positive_int(value: str) -> int:
+        try:
+            number = int(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid int value: {value}")
+        if number < 1:
+            raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+        return number
 
     def _define_tweaks_arguments(self):
         tweaks_manager = TweaksManager()
@@ -1,5 +1,7 @@
 import json
 
+from scripts.types.palette import Palette
+
 
 class ColorsDefiner:
     # TODO: Create a class for each replacer
@@ -10,8 +12,10 @@ class ColorsDefiner:
     ]
     # TODO: Create a class for each color
     colors: dict[str, dict[str, int]]
+    palette: Palette
 
     def __init__(self, filename):
         colors_dict = json.load(open(filename))
         self.replacers = colors_dict["elements"]
         self.colors = colors_dict["colors"]
+        self.palette = Palette.from_replacers(self.replacers)
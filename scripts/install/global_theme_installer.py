@@ -1,12 +1,40 @@
+import argparse
+import hashlib
+import json
+import os
+
+from scripts.install.colors_definer import ColorsDefiner
 from scripts.install.theme_installer import ThemeInstaller
 from scripts.utils.global_theme.gdm import GDMTheme
 from scripts.utils.global_theme.gdm_builder import GDMThemeBuilder
+from scripts.utils import hash_file
 from scripts.utils.logger.console import Console, Color, Format
+from scripts.utils.monitors import get_largest_monitor_resolution
 
 
 class GlobalThemeInstaller(ThemeInstaller):
+    """
+    Installs GDM theme.
+    If several colors are selected, every color is compiled into its own gresource file
+    in the output folder and only the color from --gdm-activate is installed.
+    """
     theme: GDMTheme
 
+    def __init__(self, args: argparse.Namespace, colors: ColorsDefiner):
+        super().__init__(args, colors)
+        self._batch_files: dict[str, str] = {}
+
+    def install(self):
+        """Install GDM theme unless the same build is already installed"""
+        build_id = self._get_build_id()
+        is_up_to_date = not self._is_batch() and self.theme.is_up_to_date(build_id)
+        if not getattr(self.args, "no_cache", False) and is_up_to_date:
+            Console.Line().success("GDM theme is already installed with the same options.")
+            return
+
+        self.theme.with_build_id(build_id)
+        super().install()
+
     def remove(self):
         gdm_rm_status = self.theme.remove()
         if gdm_rm_status == 0:
@@ -16,14 +44,51 @@ class GlobalThemeInstaller(ThemeInstaller):
         gdm_builder = GDMThemeBuilder(self.colors)
         gdm_builder.with_mode(self.args.mode)
         gdm_builder.with_filled(self.args.filled)
+        gdm_builder.with_resource_pruning(getattr(self.args, "gdm_prune_resources", False))
+        gdm_builder.with_extract_jobs(getattr(self.args, "processes", None))
+        if getattr(self.args, "no_cache", False):
+            gdm_builder.with_stock_cache(None)
         self.theme = gdm_builder.build()
 
     def _apply_tweaks_to_theme(self):
         for theme in self.theme.themes:
             self._apply_tweaks(theme.theme)
 
+    def _is_batch(self) -> bool:
+        return len(self._get_colors_to_install()) > 1
+
+    def _run_concurrent_installation(self, colors_to_install):
+        """All colors are compiled into separate files, since only one GDM theme can be installed"""
+        if len(colors_to_install) == 1:
+            self.theme.install(*colors_to_install[0])
+            return
+
+        self._batch_files = self.theme.install_batch(colors_to_install, self.args.gdm_output,
+                                                     getattr(self.args, "gdm_activate", None))
+
+    def _get_build_id(self) -> str:
+        """Hash of sources, options, selected colors and background image content"""
+        serialized = json.dumps([self._build_digest, self._get_colors_to_install(), self.args.mode,
+                                 self._get_image_options()])
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def _get_image_options(self) -> list | None:
+        """Background image content and options which change the processed image"""
+        image = getattr(self.args, "gdm_image", None)
+        if not image or not os.path.isfile(image):
+            return None
+
+        resolution = getattr(self.args, "gdm_image_resolution", None) or get_largest_monitor_resolution()
+        return [hash_file(image), resolution,
+                *(getattr(self.args, option, None) for option in ("gdm_blur", "gdm_darken", "gdm_lighten"))]
+
     def _after_install(self):
         print()
+        if self._batch_files:
+            self._log_batch_files()
+            if not getattr(self.args, "gdm_activate", None):
+                return
+
         Console.Line().update(
             Console.format("GDM theme installed successfully.", color=Color.GREEN, format_type=Format.BOLD),
             icon="🥳"
@@ -31,4 +96,16 @@ class GlobalThemeInstaller(ThemeInstaller):
         Console.Line().update("You need to restart GDM to apply changes.", icon="ℹ️ ")
 
         formatted_command = Console.format("systemctl restart gdm.service", color=Color.YELLOW, format_type=Format.BOLD)
-        Console.Line().update(f"Run {formatted_command} to restart GDM.", icon="🔄")
\ No newline at end of file
+        Console.Line().update(f"Run {formatted_command} to restart GDM.", icon="🔄")
+
+    def _log_batch_files(self):
+        Console.Line().update(
+            Console.format(f"Compiled {len(self._batch_files)} GDM themes:", color=Color.GREEN,
+                           format_type=Format.BOLD),
+            icon="📦"
+        )
+        for color, path in self._batch_files.items():
+            Console.Line().update(f"{color}: {path}", icon="  ")
+        if not getattr(self.args, "gdm_activate", None):
+            formatted_option = Console.format("--gdm-activate COLOR", color=Color.YELLOW, format_type=Format.BOLD)
+            Console.Line().update(f"Use {formatted_option} to set one of them as the GDM theme.", icon="ℹ️ ")
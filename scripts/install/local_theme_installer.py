@@ -1,12 +1,42 @@
+import concurrent.futures
+import contextlib
+import multiprocessing
+import os
+
+from scripts import config
 from scripts.install.theme_installer import ThemeInstaller
+from scripts.utils.file_system.memory_file_system import MemoryFileSystem
 from scripts.utils.theme.gnome_shell_theme_builder import GnomeShellThemeBuilder
 from scripts.utils.theme.theme import Theme
+from scripts.utils.theme.theme_installer import InstallationLogger
+from scripts.utils.theme.theme_output_cache import ThemeOutputCache
+from scripts.utils.theme.theme_path_provider import ThemePathProvider
+from scripts.utils.theme.theme_template import RenderStats
 from scripts.utils import remove_files
 from scripts.utils.logger.console import Console, Color, Format
 
+# Theme shared with forked worker processes. Set right before the pool is created.
+_process_theme: Theme | None = None
+
+
+def _install_in_process(hue: int, color: str, sat: int | None) -> RenderStats:
+    """Install one color in a worker process. Console output is left to the parent process."""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        return _process_theme.install(hue, color, sat)
+
 
 class LocalThemeInstaller(ThemeInstaller):
     theme: Theme
+    output_cache: ThemeOutputCache | None
+
+    def install(self):
+        """Restore all requested variants from the output cache or build them and fill the cache"""
+        if self._install_from_cache():
+            self._after_install()
+            return
+
+        super().install()
+        self._store_in_cache()
 
     def remove(self):
         colors = self.colors.colors
@@ -16,12 +46,92 @@ class LocalThemeInstaller(ThemeInstaller):
         theme_builder = GnomeShellThemeBuilder(self.colors)
         theme_builder.with_mode(self.args.mode)
         theme_builder.filled(self.args.filled)
+        theme_builder.with_file_system(MemoryFileSystem())
         self.theme = theme_builder.build()
 
+        use_cache = not getattr(self.args, "no_cache", False)
+        self.output_cache = ThemeOutputCache(config.output_cache_folder, config.output_cache_size) if use_cache else None
+
     def _apply_tweaks_to_theme(self):
         self._apply_tweaks(self.theme)
 
+    def _run_concurrent_installation(self, colors_to_install):
+        processes = getattr(self.args, "processes", None)
+        if not processes or "fork" not in multiprocessing.get_all_start_methods():
+            super()._run_concurrent_installation(colors_to_install)
+            return
+
+        self._run_process_installation(colors_to_install, processes)
+
+    def _run_process_installation(self, colors_to_install, processes: int):
+        """
+        Render colors in forked processes.
+        Workers inherit the prepared and compiled theme via copy-on-write and return only the color name.
+        """
+        global _process_theme
+        self.theme.compile()
+        _process_theme = self.theme
+
+        loggers = {color: InstallationLogger(color, self.theme.modes, Console())
+                   for _, color, _ in colors_to_install}
+        context = multiprocessing.get_context("fork")
+
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=processes, mp_context=context) as executor:
+                futures = {executor.submit(_install_in_process, hue, color, sat): color
+                           for hue, color, sat in colors_to_install}
+
+                for future in concurrent.futures.as_completed(futures):
+                    color = futures[future]
+                    try:
+                        loggers[color].success(future.result())
+                    except Exception as err:
+                        loggers[color].error(str(err))
+                        raise
+        finally:
+            _process_theme = None
+
+    def _install_from_cache(self) -> bool:
+        """
+        Copy requested variants from the output cache.
+        Nothing is copied unless every variant is cached, otherwise the theme is built as usual.
+        """
+        if self.output_cache is None:
+            return False
+
+        colors_to_install = self._get_colors_to_install()
+        variants = self._get_cached_variants(colors_to_install)
+        if not colors_to_install or not all(self.output_cache.contains(key) for key, _ in variants):
+            return False
+
+        for color_to_install in colors_to_install:
+            logger = InstallationLogger(color_to_install[1], self.theme.modes, Console())
+            stats = RenderStats()
+            for key, destination in self._get_cached_variants([color_to_install]):
+                stats += self.output_cache.restore(key, destination)
+            logger.success(stats)
+        return True
+
+    def _store_in_cache(self):
+        if self.output_cache is None:
+            return
+
+        for key, destination in self._get_cached_variants(self._get_colors_to_install()):
+            self.output_cache.store(key, destination)
+
+    def _get_cached_variants(self, colors_to_install) -> list[tuple[str, str]]:
+        """
+        :param colors_to_install: list of (hue, theme name, saturation)
+        :return: list of (cache key, destination folder) for every color and mode
+        """
+        return [
+            (ThemeOutputCache.get_key(self._build_digest, hue, sat, mode),
+             ThemePathProvider.get_theme_path(self.theme.destination_folder, color, mode, self.theme.theme_name))
+            for hue, color, sat in colors_to_install
+            for mode in self.theme.modes
+        ]
+
     def _after_install(self):
         print()
         formatted_output = Console.format("Theme installed successfully.", color=Color.GREEN, format_type=Format.BOLD)
-        Console.Line().update(formatted_output, icon="🥳")
\ No newline at end of file
+        Console.Line().update(formatted_output, icon="🥳")
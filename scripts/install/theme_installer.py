@@ -1,16 +1,27 @@
 import argparse
 import concurrent.futures
+import hashlib
+import json
+import os
 from abc import ABC, abstractmethod
+from functools import cached_property
 
+from scripts import config
 from scripts.install.colors_definer import ColorsDefiner
 from scripts.types.theme_base import ThemeBase
 from scripts.tweaks_manager import TweaksManager
+from scripts.utils import hash_files
+from scripts.utils.gnome import gnome_version
 
 
 class ThemeInstaller(ABC):
     """Base class for theme installers"""
     theme: ThemeBase
 
+    # arguments which select variants instead of changing their content
+    _variant_arguments = {"remove", "reinstall", "all", "hue", "name", "sat", "mode", "processes", "no_cache",
+                          "gdm_output", "gdm_activate"}
+
     def __init__(self, args: argparse.Namespace, colors: ColorsDefiner):
         self.args = args
         self.colors = colors
@@ -47,6 +58,26 @@ class ThemeInstaller(ABC):
         tweaks_manager = TweaksManager()
         tweaks_manager.apply_tweaks(self.args, theme, self.colors)
 
+    @cached_property
+    def _build_digest(self) -> str:
+        """
+        Hash of everything shared by all installed variants:
+        theme, tweaks and installer sources, colors.json, tweak arguments and GNOME version
+        """
+        sources = [os.path.join(config.marble_folder, folder)
+                   for folder in (config.raw_theme_folder, config.tweaks_folder, "scripts")]
+        arguments = {name: value for name, value in vars(self.args).items()
+                     if name not in self._variant_arguments and name not in self.colors.colors}
+
+        try:
+            version = gnome_version()
+        except OSError:
+            version = None
+
+        serialized = json.dumps([hash_files(*sources, config.colors_json), arguments, version],
+                                sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
     def _apply_colors(self):
         if self.args.hue:
             self._apply_custom_color()
@@ -58,14 +89,33 @@ class ThemeInstaller(ABC):
         raise Exception('No color arguments specified. Use -h or --help to see the available options.')
 
     def _apply_custom_color(self):
+        self.theme.install(*self._get_custom_color())
+
+    def _apply_default_color(self) -> bool:
+        colors_to_install = self._get_default_colors()
+        if not colors_to_install:
+            return False
+        self._run_concurrent_installation(colors_to_install)
+        return True
+
+    def _get_colors_to_install(self) -> list[tuple[int, str, int | None]]:
+        """
+        Colors selected by arguments
+        :return: list of (hue, theme name, saturation)
+        """
+        if self.args.hue:
+            return [self._get_custom_color()]
+        return self._get_default_colors()
+
+    def _get_custom_color(self) -> tuple[int, str, int | None]:
         name = self.args.name
         hue = self.args.hue
         sat = self.args.sat
 
         theme_name = name if name else f'hue{hue}'
-        self.theme.install(hue, theme_name, sat)
+        return hue, theme_name, sat
 
-    def _apply_default_color(self) -> bool:
+    def _get_default_colors(self) -> list[tuple[int, str, int | None]]:
         colors = self.colors.colors
         args = self.args
 
@@ -75,11 +125,7 @@ class ThemeInstaller(ABC):
                 hue = values.get('h')
                 sat = values.get('s', args.sat)
                 colors_to_install.append((hue, color, sat))
-
-        if not colors_to_install:
-            return False
-        self._run_concurrent_installation(colors_to_install)
-        return True
+        return colors_to_install
 
     def _run_concurrent_installation(self, colors_to_install):
         with concurrent.futures.ThreadPoolExecutor() as executor:
@@ -0,0 +1,74 @@
+import hashlib
+import json
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Mapping
+
+
+@dataclass(frozen=True, slots=True)
+class ColorDefinition:
+    saturation: float
+    """Saturation in range 0-1"""
+    lightness: float
+    """Lightness in range 0-1"""
+    alpha: int | float
+    """Alpha as written in colors.json"""
+
+
+@dataclass(frozen=True, slots=True)
+class Palette:
+    """
+    Immutable color definitions loaded from colors.json.
+
+    Default aliases are resolved once, and definitions are stored per mode
+    in the same order as elements, so the element index is also the definition index.
+    Can be shared between threads and processes without copying.
+    """
+    elements: tuple[str, ...]
+    definitions: Mapping[str, tuple[ColorDefinition, ...]]
+    key: str = field(compare=False)
+    """Hash of all definitions. Equal palettes have equal keys."""
+
+    @classmethod
+    def from_replacers(cls, replacers: dict[str, dict[str, Any]]) -> "Palette":
+        """
+        Create a palette from the "elements" section of colors.json.
+        A mode is available only if it is defined (directly or through a default alias) for every element.
+        """
+        elements = tuple(replacers)
+        modes = {mode for replacer in replacers.values() for mode, value in replacer.items() if isinstance(value, dict)}
+
+        definitions = {}
+        for mode in sorted(modes):
+            try:
+                definitions[mode] = tuple(cls._resolve(replacers, element, mode) for element in elements)
+            except KeyError:
+                continue
+
+        key = hashlib.sha256(json.dumps(
+            [elements, {mode: [(d.saturation, d.lightness, d.alpha) for d in defs] for mode, defs in definitions.items()}]
+        ).encode()).hexdigest()
+
+        return cls(elements, MappingProxyType(definitions), key)
+
+    @staticmethod
+    def _resolve(replacers: dict[str, dict[str, Any]], element: str, mode: str) -> ColorDefinition:
+        visited = set()
+
+        while mode not in replacers[element]:
+            visited.add(element)
+            element = replacers[element]["default"]
+            if element in visited:
+                raise KeyError(f"Circular default alias for {element}")
+
+        color_def = replacers[element][mode]
+        return ColorDefinition(saturation=int(color_def["s"]) / 100,
+                               lightness=int(color_def["l"]) / 100,
+                               alpha=color_def["a"])
+
+    def get_definitions(self, mode: str) -> tuple[ColorDefinition, ...]:
+        """
+        Get definitions of all elements for the mode.
+        :raises KeyError: if the mode is not defined
+        """
+        return self.definitions[mode]
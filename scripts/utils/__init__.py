@@ -1,6 +1,9 @@
 from .copy_files import copy_files
+from .filter_styles import filter_styles, filter_styles_content
 from .generate_file import generate_file
+from .hash_files import hash_file, hash_files
 from .remove_files import remove_files
 from .remove_keywords import remove_keywords
 from .remove_properties import remove_properties
-from .replace_keywords import replace_keywords
\ No newline at end of file
+from .replace_keywords import replace_keywords
+from .write_if_changed import write_if_changed, copy_if_changed, copy_file_if_changed
\ No newline at end of file
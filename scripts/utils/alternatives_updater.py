@@ -1,11 +1,48 @@
 import functools
+import os
 import subprocess
+from dataclasses import dataclass, field
 from typing import TypeAlias
 
 from scripts.utils.logger.console import Console
 
 PathString: TypeAlias = str | bytes
 
+
+@dataclass(frozen=True)
+class AlternativeState:
+    """Current state of an alternative reported by update-alternatives --query"""
+    link: str | None = None
+    value: str | None = None
+    status: str | None = None
+    priorities: dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def parse(cls, output: str) -> "AlternativeState":
+        fields = {}
+        priorities = {}
+        alternative = None
+
+        for line in output.splitlines():
+            key, _, value = line.partition(":")
+            value = value.strip()
+            if key == "Alternative":
+                alternative = value
+            elif key == "Priority" and alternative is not None:
+                priorities[alternative] = int(value)
+            elif key in ("Link", "Value", "Status"):
+                fields[key.lower()] = value
+
+        return cls(priorities=priorities, **fields)
+
+    def is_installed(self, link: PathString, path: PathString, priority: int) -> bool:
+        return self.link == os.fsdecode(link) and self.priorities.get(os.fsdecode(path)) == priority
+
+    def is_set(self, path: PathString) -> bool:
+        """Path is selected manually, as update-alternatives --set does"""
+        return self.value == os.fsdecode(path) and self.status == "manual"
+
+
 class AlternativesUpdater:
     """
     Manages update-alternatives for Ubuntu.
@@ -29,8 +66,30 @@ class AlternativesUpdater:
     @staticmethod
     @ubuntu_specific
     def install_and_set(link: PathString, name: str, path: PathString, priority: int = 0):
-        AlternativesUpdater.install(link, name, path, priority)
-        AlternativesUpdater.set(name, path)
+        """
+        Install and set the alternative.
+        Steps which are already done according to update-alternatives --query are skipped.
+        """
+        state = AlternativesUpdater.query(name) or AlternativeState()
+        if not state.is_installed(link, path, priority):
+            AlternativesUpdater.install(link, name, path, priority)
+        if not state.is_set(path):
+            AlternativesUpdater.set(name, path)
+
+    @staticmethod
+    @ubuntu_specific
+    def query(name: str) -> AlternativeState | None:
+        """
+        Get the current state of the alternative
+        :param name: Name of the alternative
+        :return: None if the alternative does not exist
+        """
+        result = subprocess.run([
+            "update-alternatives", "--query", name
+        ], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        if result.returncode != 0:
+            return None
+        return AlternativeState.parse(result.stdout)
 
     @staticmethod
     @ubuntu_specific
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Iterable
 
 
 class ColorConverter(ABC):
@@ -24,3 +25,14 @@ class ColorConverter(ABC):
         :return: Tuple of RGB values (red, green, blue) in range(0-255).
         """
         pass
+
+    @staticmethod
+    @abstractmethod
+    def hsl_to_rgb_many(colors: Iterable[tuple[float, float, float]]) -> list[tuple[int, int, int]]:
+        """
+        Converts many HSL colors to RGB format in one call.
+        :param colors: Iterable of (hue (0-360), saturation (0-1), lightness (0-1)).
+        :return: List of RGB tuples (red, green, blue) in range(0-255), in the same order.
+        :raises ValueError: If any of the values is out of range.
+        """
+        pass
@@ -1,9 +1,18 @@
 import colorsys
+from typing import Iterable
 
 from scripts.utils.color_converter.color_converter import ColorConverter
 
+try:
+    import numpy
+except ImportError:  # NumPy is optional, pure Python is used without it
+    numpy = None
+
 
 class ColorConverterImpl(ColorConverter):
+    numpy_threshold = 256
+    """Minimal number of colors for which NumPy is faster than pure Python"""
+
     @staticmethod
     def hex_to_rgba(hex_color):
         try:
@@ -31,6 +40,24 @@ class ColorConverterImpl(ColorConverter):
 
     @staticmethod
     def hsl_to_rgb(hue, saturation, lightness):
+        ColorConverterImpl._validate_hsl(hue, saturation, lightness)
+
+        h = hue / 360
+        red, green, blue = [round(item * 255) for item in colorsys.hls_to_rgb(h, lightness, saturation)]
+        return red, green, blue
+
+    @staticmethod
+    def hsl_to_rgb_many(colors: Iterable[tuple[float, float, float]]) -> list[tuple[int, int, int]]:
+        colors = list(colors)
+
+        if numpy is not None and len(colors) >= ColorConverterImpl.numpy_threshold:
+            return _hsl_to_rgb_numpy(colors)
+
+        return [ColorConverterImpl.hsl_to_rgb(hue, saturation, lightness)
+                for hue, saturation, lightness in colors]
+
+    @staticmethod
+    def _validate_hsl(hue, saturation, lightness):
         if hue > 360 or hue < 0:
             raise ValueError(f'Hue must be between 0 and 360, not {hue}')
         if saturation > 1 or saturation < 0:
@@ -38,6 +65,38 @@ class ColorConverterImpl(ColorConverter):
         if lightness > 1 or lightness < 0:
             raise ValueError(f'Lightness must be between 0 and 1, not {lightness}')
 
-        h = hue / 360
-        red, green, blue = [round(item * 255) for item in colorsys.hls_to_rgb(h, lightness, saturation)]
-        return red, green, blue
+
+def _hsl_to_rgb_numpy(colors: list[tuple[float, float, float]]) -> list[tuple[int, int, int]]:
+    """Vectorized version of colorsys.hls_to_rgb with the same operations, so results are identical"""
+    array = numpy.asarray(colors, dtype=numpy.float64).reshape(-1, 3)
+    hue, saturation, lightness = array[:, 0], array[:, 1], array[:, 2]
+
+    invalid = (hue > 360) | (hue < 0) | (saturation > 1) | (saturation < 0) | (lightness > 1) | (lightness < 0)
+    if invalid.any():
+        ColorConverterImpl._validate_hsl(*colors[int(numpy.argmax(invalid))])
+
+    h = hue / 360
+    m2 = numpy.where(lightness <= 0.5,
+                     lightness * (1.0 + saturation),
+                     lightness + saturation - (lightness * saturation))
+    m1 = 2.0 * lightness - m2
+
+    rgb = numpy.stack([
+        _hue_to_channel(m1, m2, h + 1.0 / 3.0),
+        _hue_to_channel(m1, m2, h),
+        _hue_to_channel(m1, m2, h - 1.0 / 3.0),
+    ], axis=1)
+    gray = saturation == 0.0
+    rgb[gray] = lightness[gray, None]
+
+    # numpy.rint rounds half to even, the same as round()
+    return [tuple(color) for color in numpy.rint(rgb * 255).astype(int).tolist()]
+
+
+def _hue_to_channel(m1, m2, hue):
+    hue = numpy.mod(hue, 1.0)
+    return numpy.select(
+        [hue < 1.0 / 6.0, hue < 0.5, hue < 2.0 / 3.0],
+        [m1 + (m2 - m1) * hue * 6.0, m2, m1 + (m2 - m1) * (2.0 / 3.0 - hue) * 6.0],
+        default=m1
+    )
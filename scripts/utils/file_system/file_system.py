@@ -0,0 +1,86 @@
+from abc import ABC, abstractmethod
+
+
+class FileSystem(ABC):
+    """
+    Storage used by the theme build pipeline (temp folder, combined styles, labels).
+    Sources from the repository and final outputs always live on the disk.
+    """
+
+    @abstractmethod
+    def read_text(self, path: str) -> str:
+        pass
+
+    @abstractmethod
+    def write_text(self, path: str, content: str):
+        """Write content to the file, creating parent folders if needed."""
+        pass
+
+    @abstractmethod
+    def append_text(self, path: str, content: str):
+        """
+        Append content to the existing file.
+        :raises FileNotFoundError: if the file does not exist.
+        """
+        pass
+
+    @abstractmethod
+    def read_bytes(self, path: str) -> bytes:
+        pass
+
+    @abstractmethod
+    def write_bytes(self, path: str, content: bytes):
+        """Write content to the file, creating parent folders if needed."""
+        pass
+
+    @abstractmethod
+    def exists(self, path: str) -> bool:
+        pass
+
+    @abstractmethod
+    def is_file(self, path: str) -> bool:
+        pass
+
+    @abstractmethod
+    def listdir(self, path: str) -> list[str]:
+        """
+        List names of files and folders in the folder.
+        :raises FileNotFoundError: if the folder does not exist.
+        """
+        pass
+
+    @abstractmethod
+    def walk_files(self, path: str) -> list[str]:
+        """List paths of all files in the folder recursively, relative to the folder."""
+        pass
+
+    @abstractmethod
+    def stat(self, path: str) -> tuple[int, int]:
+        """
+        Get the file size and modification marker.
+        The marker changes every time the file is written.
+        """
+        pass
+
+    @abstractmethod
+    def makedirs(self, path: str):
+        pass
+
+    @abstractmethod
+    def rename(self, source: str, destination: str):
+        pass
+
+    @abstractmethod
+    def remove_tree(self, path: str):
+        """Remove the folder with all its content. Does nothing if the folder does not exist."""
+        pass
+
+    @abstractmethod
+    def copy_from_disk(self, source: str, destination: str):
+        """
+        Copy a file or folder from the disk.
+        If the source is a folder, its content is merged into the destination folder.
+        :param source: path on the disk
+        :param destination: path in this file system
+        """
+        pass
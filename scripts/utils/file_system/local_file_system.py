@@ -0,0 +1,72 @@
+import os
+import shutil
+
+from scripts.utils.file_system.file_system import FileSystem
+
+
+class LocalFileSystem(FileSystem):
+    def read_text(self, path: str) -> str:
+        with open(path, "r") as file:
+            return file.read()
+
+    def write_text(self, path: str, content: str):
+        self._make_parent_dirs(path)
+        with open(path, "w") as file:
+            file.write(content)
+
+    def append_text(self, path: str, content: str):
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"The file {path} does not exist.")
+        with open(path, "a") as file:
+            file.write(content)
+
+    def read_bytes(self, path: str) -> bytes:
+        with open(path, "rb") as file:
+            return file.read()
+
+    def write_bytes(self, path: str, content: bytes):
+        self._make_parent_dirs(path)
+        with open(path, "wb") as file:
+            file.write(content)
+
+    def exists(self, path: str) -> bool:
+        return os.path.exists(path)
+
+    def is_file(self, path: str) -> bool:
+        return os.path.isfile(path)
+
+    def listdir(self, path: str) -> list[str]:
+        return os.listdir(path)
+
+    def walk_files(self, path: str) -> list[str]:
+        return [
+            os.path.relpath(os.path.join(root, filename), path)
+            for root, _, filenames in os.walk(path)
+            for filename in filenames
+        ]
+
+    def stat(self, path: str) -> tuple[int, int]:
+        stat = os.stat(path)
+        return stat.st_size, stat.st_mtime_ns
+
+    def makedirs(self, path: str):
+        os.makedirs(path, exist_ok=True)
+
+    def rename(self, source: str, destination: str):
+        os.rename(source, destination)
+
+    def remove_tree(self, path: str):
+        shutil.rmtree(path, ignore_errors=True)
+
+    def copy_from_disk(self, source: str, destination: str):
+        if os.path.isfile(source):
+            self._make_parent_dirs(destination)
+            shutil.copy(source, destination)
+        else:
+            shutil.copytree(source, destination, dirs_exist_ok=True)
+
+    @staticmethod
+    def _make_parent_dirs(path: str):
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
@@ -0,0 +1,142 @@
+import itertools
+import os
+import threading
+
+from scripts.utils.file_system.file_system import FileSystem
+
+
+class MemoryFileSystem(FileSystem):
+    """
+    File system which keeps all files in RAM.
+    Used to prepare themes without touching the disk until the final output is rendered.
+    """
+
+    def __init__(self):
+        self._files: dict[str, bytes] = {}
+        self._versions: dict[str, int] = {}
+        self._dirs: set[str] = {os.sep}
+        self._counter = itertools.count(1)
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _normalize(path: str) -> str:
+        return os.path.normpath(os.path.abspath(os.path.expanduser(path)))
+
+    def read_text(self, path: str) -> str:
+        return self.read_bytes(path).decode("utf-8")
+
+    def write_text(self, path: str, content: str):
+        self.write_bytes(path, content.encode("utf-8"))
+
+    def append_text(self, path: str, content: str):
+        with self._lock:
+            self.write_bytes(path, self.read_bytes(path) + content.encode("utf-8"))
+
+    def read_bytes(self, path: str) -> bytes:
+        path = self._normalize(path)
+        with self._lock:
+            if path not in self._files:
+                raise FileNotFoundError(f"The file {path} does not exist.")
+            return self._files[path]
+
+    def write_bytes(self, path: str, content: bytes):
+        path = self._normalize(path)
+        with self._lock:
+            if path in self._dirs:
+                raise IsADirectoryError(f"{path} is a directory.")
+            self.makedirs(os.path.dirname(path))
+            self._files[path] = bytes(content)
+            self._versions[path] = next(self._counter)
+
+    def exists(self, path: str) -> bool:
+        path = self._normalize(path)
+        with self._lock:
+            return path in self._files or path in self._dirs
+
+    def is_file(self, path: str) -> bool:
+        with self._lock:
+            return self._normalize(path) in self._files
+
+    def listdir(self, path: str) -> list[str]:
+        path = self._normalize(path)
+        with self._lock:
+            if path not in self._dirs:
+                raise FileNotFoundError(f"The folder {path} does not exist.")
+            return [
+                os.path.basename(entry)
+                for entry in itertools.chain(self._dirs, self._files)
+                if entry != path and os.path.dirname(entry) == path
+            ]
+
+    def walk_files(self, path: str) -> list[str]:
+        path = self._normalize(path)
+        with self._lock:
+            return [
+                os.path.relpath(file, path)
+                for file in self._files
+                if self._is_inside(file, path)
+            ]
+
+    def stat(self, path: str) -> tuple[int, int]:
+        path = self._normalize(path)
+        with self._lock:
+            return len(self.read_bytes(path)), self._versions[path]
+
+    def makedirs(self, path: str):
+        path = self._normalize(path)
+        with self._lock:
+            if path in self._files:
+                raise FileExistsError(f"{path} is a file.")
+            while path not in self._dirs:
+                self._dirs.add(path)
+                path = os.path.dirname(path)
+
+    def rename(self, source: str, destination: str):
+        source = self._normalize(source)
+        destination = self._normalize(destination)
+        with self._lock:
+            if source in self._dirs:
+                self._move_tree(source, destination)
+                return
+            content = self.read_bytes(source)
+            del self._files[source]
+            del self._versions[source]
+            self.write_bytes(destination, content)
+
+    def _move_tree(self, source: str, destination: str):
+        for directory in [d for d in self._dirs if self._is_inside(d, source)]:
+            self._dirs.remove(directory)
+            self.makedirs(os.path.join(destination, os.path.relpath(directory, source)))
+        for file in [f for f in self._files if self._is_inside(f, source)]:
+            content = self._files.pop(file)
+            del self._versions[file]
+            self.write_bytes(os.path.join(destination, os.path.relpath(file, source)), content)
+
+    def remove_tree(self, path: str):
+        path = self._normalize(path)
+        with self._lock:
+            self._dirs = {d for d in self._dirs if not self._is_inside(d, path) or d == os.sep}
+            for file in [f for f in self._files if self._is_inside(f, path)]:
+                del self._files[file]
+                del self._versions[file]
+
+    def copy_from_disk(self, source: str, destination: str):
+        if os.path.isfile(source):
+            with open(source, "rb") as file:
+                self.write_bytes(destination, file.read())
+            return
+        if not os.path.isdir(source):
+            raise FileNotFoundError(f"The file {source} does not exist.")
+
+        self.makedirs(destination)
+        for root, dirs, filenames in os.walk(source):
+            relative_root = os.path.relpath(root, source)
+            for directory in dirs:
+                self.makedirs(os.path.join(destination, relative_root, directory))
+            for filename in filenames:
+                with open(os.path.join(root, filename), "rb") as file:
+                    self.write_bytes(os.path.join(destination, relative_root, filename), file.read())
+
+    @staticmethod
+    def _is_inside(path: str, folder: str) -> bool:
+        return path == folder or path.startswith(folder.rstrip(os.sep) + os.sep)
@@ -2,6 +2,9 @@ import os
 from abc import ABC, abstractmethod
 from typing import Tuple, TypeAlias
 
+from scripts.utils.file_system.file_system import FileSystem
+from scripts.utils.file_system.local_file_system import LocalFileSystem
+
 LabeledFileGroup: TypeAlias = Tuple[str, str]
 
 
@@ -17,12 +20,14 @@ class FilesLabelerFactoryImpl(FilesLabelerFactory):
 
 
 class FilesLabeler:
-    def __init__(self, directory: str, *files_to_update_references: str):
+    def __init__(self, directory: str, *files_to_update_references: str, file_system: FileSystem | None = None):
         """
         Initialize the working directory and files to change
+        :param file_system: file system where the directory is stored (disk by default)
         """
         self.directory = directory
         self.files = files_to_update_references
+        self.file_system = file_system or LocalFileSystem()
 
     def append_label(self, label: str):
         """
@@ -34,7 +39,7 @@ class FilesLabeler:
 
     def _label_files(self, label: str) -> list[LabeledFileGroup]:
         labeled_files = []
-        for filename in os.listdir(self.directory):
+        for filename in self.file_system.listdir(self.directory):
             if label in filename: continue
 
             name, extension = os.path.splitext(filename)
@@ -42,20 +47,16 @@ class FilesLabeler:
 
             old_filepath = os.path.join(self.directory, filename)
             new_filepath = os.path.join(self.directory, new_filename)
-            os.rename(old_filepath, new_filepath)
+            self.file_system.rename(old_filepath, new_filepath)
 
             labeled_files.append((filename, new_filename))
         return labeled_files
 
     def _update_references(self, labeled_files: list[LabeledFileGroup]):
         for file_path in self.files:
-            with open(file_path, 'r') as file:
-                file_content = file.read()
-
+            file_content = self.file_system.read_text(file_path)
             file_content = self._update_references_in_file(file_content, labeled_files)
-
-            with open(file_path, 'w') as file:
-                file.write(file_content)
+            self.file_system.write_text(file_path, file_content)
 
     @staticmethod
     def _update_references_in_file(file_content: str, labeled_files: list[LabeledFileGroup]) -> str:
@@ -0,0 +1,34 @@
+from typing import Iterable
+
+from .stylesheet import Stylesheet
+
+
+def filter_styles(file, keywords: Iterable[str] = (), properties: Iterable[str] = ()):
+    """
+    Remove keywords and properties from a styles file.
+    The file is read and written only once for all filters.
+    :param file: file name
+    :param keywords: keywords to remove
+    :param properties: properties to remove
+    """
+    with open(file, "r") as read_file:
+        content = read_file.read()
+
+    with open(file, "w") as write_file:
+        write_file.write(filter_styles_content(content, keywords, properties))
+
+
+def filter_styles_content(content: str, keywords: Iterable[str] = (), properties: Iterable[str] = ()) -> str:
+    """
+    Remove keywords and properties from styles.
+    Styles are parsed once, so declarations are removed by exact property names
+    regardless of how rules are split into lines.
+    :param content: styles content
+    :param keywords: keywords to remove. Comments and strings are not changed
+    :param properties: properties to remove
+    :return: filtered styles
+    """
+    stylesheet = Stylesheet.parse(content)
+    stylesheet.remove_keywords(*keywords)
+    stylesheet.remove_properties(*properties)
+    return stylesheet.serialize()
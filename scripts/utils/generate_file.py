@@ -1,21 +1,24 @@
 import os
-import shutil
+from .file_system.file_system import FileSystem
+from .file_system.local_file_system import LocalFileSystem
 from .gnome import gnome_version
 from .get_version_folder import get_version_folders
 
-def generate_file(folder, temp_folder, final_file):
+def generate_file(folder, temp_folder, final_file, file_system: FileSystem | None = None):
     """
     Combines all files in a folder into a single file
     :param folder: source folder
     :param temp_folder: temporary folder
     :param final_file: location where file will be created
+    :param file_system: file system where the temporary folder is stored (disk by default)
     """
-    opened_file = open(final_file, "w")
+    file_system = file_system or LocalFileSystem()
+    contents = []
     css_folder = f"{folder}/.css/"
 
     for file in os.listdir(css_folder):
         with open(os.path.join(css_folder, file)) as f:
-            opened_file.write(f.read() + '\n')
+            contents.append(f.read() + '\n')
 
     version = gnome_version()
 
@@ -30,10 +33,11 @@ def generate_file(folder, temp_folder, final_file):
             if os.path.exists(css_path):
                 for css_file in os.listdir(css_path):
                     with open(os.path.join(css_path, css_file)) as f:
-                        opened_file.write(f.read() + '\n')
+                        contents.append(f.read() + '\n')
 
             for file in os.listdir(version_path):
                 if file.endswith('.svg'):
-                    shutil.copy(os.path.join(version_path, file), temp_folder)
+                    file_system.copy_from_disk(os.path.join(version_path, file),
+                                               os.path.join(temp_folder, file))
 
-    opened_file.close()
\ No newline at end of file
+    file_system.write_text(final_file, "".join(contents))
@@ -44,6 +44,22 @@ class GDMTheme(ThemeBase):
             self.preparer.use_backup_as_source()
         self.themes = self.preparer.prepare()
 
+    def with_build_id(self, build_id: str) -> "GDMTheme":
+        """
+        Embed the build id into installed styles next to the installation trigger.
+        :param build_id: hash of sources and options of the installation
+        """
+        self.installer.build_id = build_id
+        return self
+
+    def is_up_to_date(self, build_id: str) -> bool:
+        """
+        Check if the installed theme was built from the same sources with the same options,
+        so the whole installation can be skipped.
+        :param build_id: hash of sources and options of the installation
+        """
+        return self._is_installed() and self.installer.is_up_to_date(build_id)
+
     def _is_installed(self) -> bool:
         """
         Check if a GDM theme is currently installed.
@@ -75,6 +91,30 @@ class GDMTheme(ThemeBase):
 
         self.installer.install()
 
+    def install_batch(self, colors: list[tuple[int, str, int | None]], output_folder: str,
+                      active_color: str | None = None) -> dict[str, str]:
+        """
+        Compile the prepared theme for every color into separate gresource files.
+        Useful for shipping all variants, e.g. in an OS image, and switching between them later.
+
+        :param colors: list of (hue, color name, saturation)
+        :param output_folder: folder for gresource files named like gnome-shell-theme-<color>.gresource
+        :param active_color: color which is also installed as the active theme (none by default)
+        :return: color name -> path of the compiled gresource file
+        :raises ValueError: if the active color is not one of the colors
+        """
+        if active_color is not None and active_color not in (name for _, name, _ in colors):
+            raise ValueError(f"Active color {active_color} is not one of the compiled colors.")
+
+        gresource_files = self.installer.compile_batch(self.themes, colors, output_folder)
+
+        if active_color is not None:
+            if not self._is_installed():
+                self.installer.backup()
+            self.installer.install(gresource_files[active_color])
+
+        return gresource_files
+
     def remove(self):
         """
         Remove the installed theme and restore the original GDM theme.
@@ -16,6 +16,7 @@ from scripts.utils.gresource.gresource import Gresource
 from scripts.utils.logger.console import Console
 from scripts.utils.logger.logger import LoggerFactory
 from scripts.utils.theme.gnome_shell_theme_builder import GnomeShellThemeBuilder
+from scripts.utils.theme.theme_output_cache import ThemeOutputCache
 
 
 class GDMThemeBuilder:
@@ -38,10 +39,14 @@ class GDMThemeBuilder:
         self._temp_folder: PathString = os.path.join(config.temp_folder, config.gdm_folder)
         self._mode: Optional[InstallationMode] = None
         self._is_filled: bool = False
+        self._prune_unused_resources: bool = False
+        self._extract_jobs: Optional[int] = None
 
         self._logger_factory: Optional[LoggerFactory] = None
         self._gresource: Optional[Gresource] = None
         self._ubuntu_gdm_alternatives_updater: Optional[UbuntuGDMAlternativesUpdater] = None
+        self._stock_cache: Optional[ThemeOutputCache] = None
+        self._is_stock_cache_set: bool = False
 
         self._preparer: Optional[GDMThemePreparer] = None
         self._installer: Optional[GDMThemeInstaller] = None
@@ -57,6 +62,16 @@ class GDMThemeBuilder:
         self._is_filled = is_filled
         return self
 
+    def with_resource_pruning(self, enabled=True) -> 'GDMThemeBuilder':
+        """Leave out stock resources which are not referenced by the theme styles."""
+        self._prune_unused_resources = enabled
+        return self
+
+    def with_extract_jobs(self, jobs: int | None) -> 'GDMThemeBuilder':
+        """Set maximum number of concurrent resource extractions (default if None)."""
+        self._extract_jobs = jobs
+        return self
+
     def with_logger_factory(self, logger_factory: LoggerFactory) -> 'GDMThemeBuilder':
         """Inject a logger factory for logging purposes."""
         self._logger_factory = logger_factory
@@ -72,6 +87,12 @@ class GDMThemeBuilder:
         self._ubuntu_gdm_alternatives_updater = alternatives_updater
         return self
 
+    def with_stock_cache(self, stock_cache: ThemeOutputCache | None) -> 'GDMThemeBuilder':
+        """Inject a cache of extracted stock themes. None disables caching."""
+        self._stock_cache = stock_cache
+        self._is_stock_cache_set = True
+        return self
+
     def with_preparer(self, preparer: GDMThemePreparer) -> 'GDMThemeBuilder':
         """Inject a preparer for preparing the theme."""
         self._preparer = preparer
@@ -100,6 +121,7 @@ class GDMThemeBuilder:
         self._resolve_logger_factory()
         self._resolve_gresource()
         self._resolve_ubuntu_gdm_alternatives_updater()
+        self._resolve_stock_cache()
 
         self._resolve_preparer()
         self._resolve_installer()
@@ -129,7 +151,9 @@ class GDMThemeBuilder:
             temp_folder=temp_folder,
             destination=destination,
             logger_factory=self._logger_factory,
-            runner=runner
+            runner=runner,
+            extract_jobs=self._extract_jobs,
+            prune_unused=self._prune_unused_resources
         )
 
     def _resolve_ubuntu_gdm_alternatives_updater(self):
@@ -138,6 +162,11 @@ class GDMThemeBuilder:
         alternatives_updater = AlternativesUpdater()
         self._ubuntu_gdm_alternatives_updater = UbuntuGDMAlternativesUpdater(alternatives_updater)
 
+    def _resolve_stock_cache(self):
+        """Create a persistent cache of stock themes if not explicitly provided."""
+        if self._is_stock_cache_set: return
+        self._stock_cache = ThemeOutputCache(config.gdm_stock_cache_folder, config.gdm_stock_cache_size)
+
     def _resolve_preparer(self):
         """Create a GDMThemePreparer if not explicitly provided."""
         if self._preparer: return
@@ -151,6 +180,7 @@ class GDMThemeBuilder:
             theme_builder=theme_builder,
             logger_factory=self._logger_factory,
             files_labeler_factory=files_labeler_factory,
+            stock_cache=self._stock_cache,
         )
 
     def _resolve_installer(self):
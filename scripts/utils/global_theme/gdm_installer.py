@@ -1,3 +1,8 @@
+import concurrent.futures
+import os
+import shutil
+import tempfile
+
 from scripts.utils.global_theme.gdm_theme_prepare import GDMThemePrepare
 from scripts.utils.global_theme.ubuntu_alternatives_updater import UbuntuGDMAlternativesUpdater
 from scripts.utils.gresource.gresource import Gresource
@@ -12,16 +17,27 @@ class GDMThemeInstaller:
     - Creating backups of original system files
     - Installing compiled themes via the alternatives system
     - Detecting if a theme is already installed
+
+    Theme variants are generated concurrently. Each variant is rendered
+    into its own staging folder, which are then moved to the gresource folder
+    in the order of variants, so variants never write the same file at the same time.
+
+    Several colors are compiled in a batch. Every color gets an isolated workspace
+    with links to the extracted resources and is compiled into its own gresource file.
     """
-    def __init__(self, gresource: Gresource, alternatives_updater: UbuntuGDMAlternativesUpdater):
+    def __init__(self, gresource: Gresource, alternatives_updater: UbuntuGDMAlternativesUpdater,
+                 jobs: int | None = None):
         """
         :param gresource: Handler for gresource operations
         :param alternatives_updater: Handler for update-alternatives operations
+        :param jobs: Maximum number of variants generated in parallel (CPU count by default)
         """
         self.gresource = gresource
         self.alternatives_updater = alternatives_updater
+        self.jobs = jobs or os.cpu_count() or 1
 
         self._is_installed_trigger = "\n/* Marble theme */\n"
+        self.build_id: str | None = None
 
     def is_installed(self) -> bool:
         """
@@ -30,6 +46,17 @@ class GDMThemeInstaller:
         """
         return self.gresource.has_trigger(self._is_installed_trigger)
 
+    def is_up_to_date(self, build_id: str) -> bool:
+        """
+        Check if the installed theme was built with the same build id.
+        :param build_id: hash of sources and options of the installation
+        """
+        return self.gresource.has_trigger(self._get_build_trigger(build_id))
+
+    @staticmethod
+    def _get_build_trigger(build_id: str) -> str:
+        return f"/* Marble build: {build_id} */\n"
+
     def compile(self, themes: list[GDMThemePrepare], hue: int, color: str, sat: int = None):
         """
         Prepares themes for gresource and compiles them.
@@ -38,29 +65,128 @@ class GDMThemeInstaller:
         :param color: the color name. in GDM will only be shown in logger
         :param sat: saturation value for the theme
         """
-        self._generate_themes(themes, hue, color, sat)
+        self._prepare_sources(themes)
+        self._generate_themes(themes, hue, color, sat, self.gresource.temp_folder)
         self.gresource.compile()
 
-    def _generate_themes(self, themes: list[GDMThemePrepare], hue: int, color: str, sat: int = None):
-        """Generate theme files for further compiling by gresource"""
+    def compile_batch(self, themes: list[GDMThemePrepare], colors: list[tuple[int, str, int | None]],
+                      output_folder: str) -> dict[str, str]:
+        """
+        Compile every color into its own gresource file in the output folder.
+        Colors are compiled in parallel, each in an isolated workspace, so builds never share files.
+        :param themes: themes to be compiled
+        :param colors: list of (hue, color name, saturation)
+        :param output_folder: folder for compiled gresource files
+        :return: color name -> path of the compiled gresource file
+        """
+        self._prepare_sources(themes)
+        os.makedirs(self.gresource.temp_folder, exist_ok=True)
+        os.makedirs(output_folder, exist_ok=True)
+        workspaces_root = tempfile.mkdtemp(prefix=".batch-", dir=os.path.dirname(self.gresource.temp_folder))
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(self.jobs, len(colors)) or 1) as executor:
+                futures = {
+                    color: executor.submit(self._compile_color, themes, hue, color, sat,
+                                           os.path.join(workspaces_root, color), output_folder)
+                    for hue, color, sat in colors
+                }
+                return {color: future.result() for color, future in futures.items()}
+        finally:
+            shutil.rmtree(workspaces_root, ignore_errors=True)
+
+    def get_batch_file_name(self, color: str) -> str:
+        """Name of the gresource file of the color, e.g. gnome-shell-theme-blue.gresource"""
+        name, extension = os.path.splitext(self.gresource.gresource_file)
+        return f"{name}-{color}{extension}"
+
+    def _compile_color(self, themes: list[GDMThemePrepare], hue: int, color: str, sat: int | None,
+                       workspace: str, output_folder: str) -> str:
+        self._link_resources(self.gresource.temp_folder, workspace)
+        self._generate_themes(themes, hue, color, sat, workspace)
+
+        # compiled under a temporary name, so the output folder never has a partially written file
+        target_file = os.path.join(output_folder, self.get_batch_file_name(color))
+        temp_file = os.path.join(output_folder, f".{os.path.basename(target_file)}.tmp")
+        try:
+            self.gresource.compile(workspace, temp_file)
+            os.chmod(temp_file, 0o644)
+            os.replace(temp_file, target_file)
+        finally:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+        return target_file
+
+    def _link_resources(self, source: str, destination: str):
+        """
+        Create a workspace with extracted resources without copying their content.
+        Generated files replace the links, so the extracted resources are never modified.
+        """
+        compiled_files = (self.gresource.gresource_file, f"{self.gresource.gresource_file}.xml")
+        shutil.copytree(source, destination, copy_function=self._link_or_copy,
+                        ignore=shutil.ignore_patterns(*compiled_files))
+
+    @staticmethod
+    def _link_or_copy(source: str, destination: str):
+        try:
+            os.link(source, destination)
+        except OSError:
+            shutil.copy2(source, destination)
+
+    def _prepare_sources(self, themes: list[GDMThemePrepare]):
+        """Label the themes and add the installation trigger. Done once for all colors"""
+        trigger = self._is_installed_trigger
+        if self.build_id:
+            trigger += self._get_build_trigger(self.build_id)
+
         for theme_prepare in themes:
             if theme_prepare.label is not None:
                 theme_prepare.label_theme()
+            theme_prepare.prepend_source_styles(trigger)
+
+    def _generate_themes(self, themes: list[GDMThemePrepare], hue: int, color: str, sat: int | None,
+                         destination: str):
+        """Generate theme files for further compiling by gresource"""
+        if not themes:
+            return
+
+        os.makedirs(destination, exist_ok=True)
+        staging_root = tempfile.mkdtemp(prefix=".staging-", dir=os.path.dirname(self.gresource.temp_folder))
+        try:
+            staging_folders = [os.path.join(staging_root, str(i)) for i in range(len(themes))]
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(self.jobs, len(themes))) as executor:
+                futures = [executor.submit(self._generate_theme, theme_prepare, hue, color, sat, staging_folder)
+                           for theme_prepare, staging_folder in zip(themes, staging_folders)]
+                for future in futures:
+                    future.result()
+
+            for staging_folder in staging_folders:
+                self._move_generated_files(staging_folder, destination)
+        finally:
+            shutil.rmtree(staging_root, ignore_errors=True)
 
-            theme_prepare.remove_keywords("!important")
-            theme_prepare.remove_properties("background-color", "color", "box-shadow", "border-radius")
-            theme_prepare.prepend_source_styles(self._is_installed_trigger)
+    @staticmethod
+    def _generate_theme(theme_prepare: GDMThemePrepare, hue: int, color: str, sat: int | None,
+                        destination: str):
+        theme_prepare.install(hue, color, sat, destination=destination)
 
-            theme_prepare.install(hue, color, sat, destination=self.gresource.temp_folder)
+    @staticmethod
+    def _move_generated_files(source: str, destination: str):
+        """Move generated files replacing files which were already in the destination"""
+        for root, _, files in os.walk(source):
+            target_root = os.path.join(destination, os.path.relpath(root, source))
+            os.makedirs(target_root, exist_ok=True)
+            for file in files:
+                os.replace(os.path.join(root, file), os.path.join(target_root, file))
 
     def backup(self):
         """Backup the current gresource file."""
         self.gresource.backup()
 
-    def install(self):
+    def install(self, gresource_file: str | None = None):
         """
         Install the theme globally by moving the compiled gresource file to the destination.
         Also updates the alternatives for the gdm theme.
+        :param gresource_file: compiled gresource file (the one compiled by compile() by default)
         """
-        self.gresource.move()
+        self.gresource.move(gresource_file)
         self.alternatives_updater.install_and_set()
\ No newline at end of file
@@ -1,10 +1,14 @@
 import os
 
+from scripts import config
+from scripts.utils import filter_styles, hash_file, hash_files
 from scripts.utils.files_labeler import FilesLabelerFactory
 from scripts.utils.global_theme.gdm_theme_prepare import GDMThemePrepare
 from scripts.utils.gresource.gresource import Gresource
 from scripts.utils.logger.logger import LoggerFactory
 from scripts.utils.theme.gnome_shell_theme_builder import GnomeShellThemeBuilder
+from scripts.utils.theme.theme import Theme
+from scripts.utils.theme.theme_output_cache import ThemeOutputCache
 
 
 class GDMThemePreparer:
@@ -16,12 +20,24 @@ class GDMThemePreparer:
 
     The main class, GDMThemePreparer, orchestrates the extraction process
     and creates GDMThemePrepare objects representing processable themes.
+
+    Extracted stock styles are cleaned from properties Marble overrides.
+    If a stock cache is provided, the cleaned stock theme is cached by hash
+    of the source gresource, so it is extracted only once per GNOME Shell update.
+
+    Marble theme is prepared only for the first stock style,
+    other variants copy its prepared files instead of combining the sources again.
     """
+    stock_styles = {"gnome-shell-dark.css", "gnome-shell-light.css", "gnome-shell.css"}
+    stock_keywords = ("!important",)
+    stock_properties = ("background-color", "color", "box-shadow", "border-radius")
+
     def __init__(self, temp_folder: str, default_mode: str | None, is_filled: bool,
                  gresource: Gresource,
                  theme_builder: GnomeShellThemeBuilder,
                  logger_factory: LoggerFactory,
-                 files_labeler_factory: FilesLabelerFactory):
+                 files_labeler_factory: FilesLabelerFactory,
+                 stock_cache: ThemeOutputCache | None = None):
         """
         :param temp_folder: Temporary folder for extracted theme files
         :param default_mode: Default theme mode to use if not specified in CSS filename
@@ -30,6 +46,7 @@ class GDMThemePreparer:
         :param theme_builder: Theme builder instance for creating themes
         :param logger_factory: Logger factory for logging messages
         :param files_labeler_factory: Factory for creating FilesLabeler instances
+        :param stock_cache: Optional cache of extracted and cleaned stock themes
         """
         self.temp_folder = temp_folder
         self.gresource_temp_folder = gresource.temp_folder
@@ -41,6 +58,7 @@ class GDMThemePreparer:
         self.theme_builder = theme_builder
         self.logger_factory = logger_factory
         self.files_labeler_factory = files_labeler_factory
+        self.stock_cache = stock_cache
 
     def use_backup_as_source(self):
         """Use backup gresource file for extraction"""
@@ -52,29 +70,63 @@ class GDMThemePreparer:
         Extract and prepare GDM themes for processing.
         :return: List of prepared theme objects ready for compilation
         """
+        stock_styles = self._extract_stock_theme()
+
+        themes = []
+        for file_name in stock_styles:
+            prepared_theme = themes[0].theme if themes else None
+            themes.append(self._create_theme(file_name, prepared_theme))
+        return themes
+
+    def _extract_stock_theme(self) -> list[str]:
+        """
+        Extract and clean stock theme or restore it from the cache
+        :return: names of stock styles files
+        """
+        cache_key = self._get_stock_cache_key() if self.stock_cache else None
+        if cache_key and self.stock_cache.restore(cache_key, self.gresource_temp_folder):
+            self.logger_factory.create_logger().success("Restored stock GDM theme from cache.")
+            return self._get_stock_styles()
+
         self.gresource.extract()
-        return self._find_themes()
+        stock_styles = self._get_stock_styles()
+        self._clean_stock_styles(stock_styles)
+
+        if cache_key:
+            self.stock_cache.store(cache_key, self.gresource_temp_folder)
+        return stock_styles
+
+    def _get_stock_cache_key(self) -> str:
+        """Cleaned theme depends on the source gresource and on the code which cleans it"""
+        scripts_folder = os.path.join(config.marble_folder, "scripts")
+        return ThemeOutputCache.get_key(hash_file(self.gresource.source_gresource), hash_files(scripts_folder),
+                                        self.stock_keywords, self.stock_properties)
 
-    def _find_themes(self) -> list[GDMThemePrepare]:
+    def _get_stock_styles(self) -> list[str]:
         extracted_files = os.listdir(self.gresource_temp_folder)
-        allowed_css = {"gnome-shell-dark.css", "gnome-shell-light.css", "gnome-shell.css"}
+        return [file_name for file_name in extracted_files if file_name in self.stock_styles]
 
-        themes = [
-            self._create_theme(file_name)
-            for file_name in extracted_files
-            if file_name in allowed_css
-        ]
-        return themes
+    def _clean_stock_styles(self, stock_styles: list[str]):
+        """Remove keywords and properties which would override Marble styles"""
+        for file_name in stock_styles:
+            theme_file = os.path.join(self.gresource_temp_folder, file_name)
+            filter_styles(theme_file, keywords=self.stock_keywords, properties=self.stock_properties)
 
-    def _create_theme(self, file_name: str) -> GDMThemePrepare:
-        """Helper to create and prepare a theme"""
+    def _create_theme(self, file_name: str, prepared_theme: Theme | None = None) -> GDMThemePrepare:
+        """
+        Helper to create and prepare a theme
+        :param prepared_theme: already prepared theme to copy files from
+        """
         mode = file_name.split("-")[-1].replace(".css", "")
         mode = mode if mode in {"dark", "light"} else self.default_mode
 
         self._setup_theme_builder(file_name, mode)
 
         theme = self.theme_builder.build()
-        theme.prepare()
+        if prepared_theme is None:
+            theme.prepare()
+        else:
+            theme.prepare_from(prepared_theme)
 
         theme_file = os.path.join(self.gresource_temp_folder, file_name)
         files_labeler = self.files_labeler_factory.create(
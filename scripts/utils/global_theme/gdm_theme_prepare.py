@@ -1,4 +1,3 @@
-from scripts.utils import remove_keywords, remove_properties
 from scripts.utils.files_labeler import FilesLabeler
 from scripts.utils.theme.theme import Theme
 
@@ -9,7 +8,7 @@ class GDMThemePrepare:
 
     This class handles:
     - Theme file labeling for dark/light variants
-    - CSS property and keyword removal for customization
+    - Prepending cleaned stock styles and the installation trigger
     - Theme installation with color adjustments
     """
     def __init__(self, theme: Theme, theme_file: str, label: str | None,
@@ -36,14 +35,6 @@ class GDMThemePrepare:
 
         self.files_labeler.append_label(self.label)
 
-    def remove_keywords(self, *args: str):
-        """Remove specific keywords from the theme file"""
-        remove_keywords(self.theme_file, *args)
-
-    def remove_properties(self, *args: str):
-        """Remove specific properties from the theme file"""
-        remove_properties(self.theme_file, *args)
-
     def prepend_source_styles(self, trigger: str):
         """
         Add source styles and installation trigger to the theme file.
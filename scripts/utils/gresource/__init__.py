@@ -19,3 +19,16 @@ def raise_gresource_error(tool: str, e: Exception):
     print(" - For Ubuntu/Debian: sudo apt install libglib2.0-dev")
     print(" - For Arch: sudo pacman -S glib2-devel")
     raise MissingDependencyError("glib2-devel") from e
+
+
+class GresourceFormatError(ValueError):
+    def __init__(self, gresource_path: str, reason: str):
+        super().__init__(f"Unsupported gresource file {gresource_path}: {reason}")
+        self.gresource_path = gresource_path
+
+
+class GresourceExtractionError(Exception):
+    def __init__(self, gresource_path: str, errors: dict[str, Exception]):
+        failed = "\n".join(f" - {resource}: {error}" for resource, error in sorted(errors.items()))
+        super().__init__(f"Failed to extract {len(errors)} resource(s) from {gresource_path}:\n{failed}")
+        self.errors = errors
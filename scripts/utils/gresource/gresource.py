@@ -6,6 +6,8 @@ from scripts.utils.gresource.gresource_backuper import GresourceBackuperManager
 from scripts.utils.gresource.gresource_compiler import GresourceCompiler
 from scripts.utils.gresource.gresource_extractor import GresourceExtractor
 from scripts.utils.gresource.gresource_mover import GresourceMover
+from scripts.utils.gresource.gresource_policy import GresourcePolicy
+from scripts.utils.gresource.gresource_pruner import GresourcePruner
 from scripts.utils.logger.logger import LoggerFactory
 
 
@@ -14,12 +16,17 @@ class Gresource:
 
     def __init__(
             self, gresource_file: str, temp_folder: PathString, destination: PathString,
-            logger_factory: LoggerFactory, runner: CommandRunner
+            logger_factory: LoggerFactory, runner: CommandRunner, extract_jobs: int | None = None,
+            compile_policy: GresourcePolicy | None = None, prune_unused: bool = False
     ):
         """
         :param gresource_file: The name of the gresource file to be processed.
         :param temp_folder: The temporary folder where resources will be extracted.
         :param destination: The destination folder where the compiled gresource file will be saved.
+        :param extract_jobs: Maximum number of concurrent extractions if `gresource` tool is used.
+        :param compile_policy: Compression and preprocessing of compiled resources (default policy if None).
+        :param prune_unused: Leave out resources which are not referenced by the theme styles.
+            Off by default, since GNOME Shell code can load resources which no style references.
         """
         self.gresource_file = gresource_file
         self.temp_folder = temp_folder
@@ -27,6 +34,9 @@ class Gresource:
 
         self.logger_factory = logger_factory
         self.runner = runner
+        self.extract_jobs = extract_jobs
+        self.compile_policy = compile_policy
+        self.prune_unused = prune_unused
 
         self._temp_gresource = os.path.join(temp_folder, gresource_file)
         self._destination_gresource = os.path.join(destination, gresource_file)
@@ -35,6 +45,11 @@ class Gresource:
         self._backuper = GresourceBackuperManager(self._destination_gresource,
                                                   logger_factory=self.logger_factory)
 
+    @property
+    def source_gresource(self) -> str:
+        """The gresource file which resources are extracted from (installed file or its backup)"""
+        return self._active_source_gresource
+
     def has_trigger(self, trigger: str) -> bool:
         """
         Check if the trigger is present in the gresource file.
@@ -50,12 +65,19 @@ class Gresource:
 
     def extract(self):
         extractor = GresourceExtractor(self._active_source_gresource, self.temp_folder,
-                           logger_factory=self.logger_factory, runner=self.runner)
+                           logger_factory=self.logger_factory, runner=self.runner, jobs=self.extract_jobs)
         extractor.extract()
 
-    def compile(self):
-        compiler = GresourceCompiler(self.temp_folder, self._temp_gresource,
-                                     logger_factory=self.logger_factory, runner=self.runner)
+    def compile(self, source_folder: PathString | None = None, target_file: str | None = None):
+        """
+        Compile resources into the gresource file.
+        :param source_folder: folder with resources (temp folder by default)
+        :param target_file: compiled gresource file (file in the temp folder by default)
+        """
+        compiler = GresourceCompiler(source_folder or self.temp_folder, target_file or self._temp_gresource,
+                                     logger_factory=self.logger_factory, runner=self.runner,
+                                     policy=self.compile_policy,
+                                     pruner=GresourcePruner() if self.prune_unused else None)
         compiler.compile()
 
     def backup(self):
@@ -65,7 +87,12 @@ class Gresource:
         self._backuper.restore()
         self._active_source_gresource = self._destination_gresource
 
-    def move(self):
-        mover = GresourceMover(self._temp_gresource, self._destination_gresource,
+    def move(self, source_file: str | None = None) -> bool:
+        """
+        Copy compiled gresource to the destination.
+        :param source_file: compiled gresource file (file in the temp folder by default)
+        :return: False if the destination already had the same content
+        """
+        mover = GresourceMover(source_file or self._temp_gresource, self._destination_gresource,
                                logger_factory=self.logger_factory)
-        mover.move()
+        return mover.move()
@@ -1,9 +1,13 @@
 import os
 import shutil
 
-from scripts.utils.gresource import GresourceBackupNotFoundError
+from scripts.utils.gresource import GresourceBackupNotFoundError, GresourceFormatError
+from scripts.utils.gresource.gresource_reader import GresourceReader
 from scripts.utils.logger.logger import LoggerFactory
 
+# (path, trigger, file identity) -> trigger found. File identity changes when the file is replaced or modified.
+_trigger_cache: dict[tuple, bool] = {}
+
 
 class GresourceBackuperManager:
     def __init__(self, destination_file: str, logger_factory: LoggerFactory):
@@ -25,14 +29,56 @@ class GresourceBackuperManager:
 
 
 class GresourceBackuper:
+    theme_resources = (
+        "/org/gnome/shell/theme/gnome-shell.css",
+        "/org/gnome/shell/theme/gnome-shell-dark.css",
+        "/org/gnome/shell/theme/gnome-shell-light.css",
+    )
+    chunk_size = 1024 * 1024
+
     def __init__(self, destination_file: str, backup_file: str, logger_factory: LoggerFactory):
         self.destination_file = destination_file
         self.backup_file = backup_file
         self.logger_factory = logger_factory
 
     def has_trigger(self, trigger: str) -> bool:
+        """
+        Check if the trigger is in the theme styles of the gresource file.
+        Only theme styles are read through the memory-mapped file. If they can't be located,
+        the whole file is searched in chunks. Result is cached until the file changes.
+        """
+        stat = os.stat(self.destination_file)
+        key = (os.path.abspath(self.destination_file), trigger,
+               stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+        if key not in _trigger_cache:
+            found = self._find_trigger_in_styles(trigger.encode())
+            if found is None:
+                found = self._find_trigger_in_file(trigger.encode())
+            _trigger_cache[key] = found
+        return _trigger_cache[key]
+
+    def _find_trigger_in_styles(self, trigger: bytes) -> bool | None:
+        """:return: None if theme styles can't be read"""
+        try:
+            with GresourceReader(self.destination_file) as reader:
+                resources = [resource for resource in self.theme_resources if resource in reader.list_resources()]
+                if not resources:
+                    return None
+                return any(trigger in reader.read(resource) for resource in resources)
+        except GresourceFormatError:
+            return None
+
+    def _find_trigger_in_file(self, trigger: bytes) -> bool:
+        """Search the file in chunks, keeping the tail of the previous chunk for matches on the boundary"""
+        tail = b""
         with open(self.destination_file, "rb") as f:
-            return trigger.encode() in f.read()
+            for chunk in iter(lambda: f.read(self.chunk_size), b""):
+                window = tail + chunk
+                if trigger in window:
+                    return True
+                tail = window[max(0, len(window) - len(trigger) + 1):]
+        return False
 
     def get_backup(self) -> str:
         if not os.path.exists(self.backup_file):
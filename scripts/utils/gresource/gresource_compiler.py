@@ -1,31 +1,115 @@
+import os
 import textwrap
 from pathlib import Path
 
 from scripts.utils.command_runner.command_runner import CommandRunner
 from scripts.utils.gresource import raise_gresource_error
+from scripts.utils.gresource.gresource_policy import GresourcePolicy
+from scripts.utils.gresource.gresource_pruner import GresourcePruner
+from scripts.utils.gresource.gresource_writer import GresourceWriter
 from scripts.utils.logger.logger import LoggerFactory
 
 
 class GresourceCompiler:
+    """
+    Compiles files of the source folder into the gresource file.
+
+    By default, the file is serialized in process by GresourceWriter.
+    `glib-compile-resources` with an XML manifest is used only if use_cli is set.
+    Resources are compressed and preprocessed according to the policy.
+    If a pruner is set, resources which are not used by the theme are not compiled.
+    """
+
+    prefix = "/org/gnome/shell/theme"
+
     def __init__(
             self, source_folder: str, target_file: str,
-            logger_factory: LoggerFactory, runner: CommandRunner
+            logger_factory: LoggerFactory, runner: CommandRunner,
+            use_cli: bool = False, policy: GresourcePolicy | None = None,
+            pruner: GresourcePruner | None = None
     ):
+        """
+        :param use_cli: compile with glib-compile-resources instead of the built-in writer
+        :param policy: compression and preprocessing of resources by extension
+        :param pruner: finds unused resources which are left out (all files are compiled if None)
+        """
         self.source_folder = source_folder
         self.target_file = target_file
         self.gresource_xml = target_file + ".xml"
 
         self.logger_factory = logger_factory
         self.runner = runner
+        self.use_cli = use_cli
+        self.policy = policy or GresourcePolicy()
+        self.pruner = pruner
+        self._pruned_count = 0
 
     def compile(self):
         compile_line = self.logger_factory.create_logger()
         compile_line.update("Compiling gnome-shell theme...")
 
-        self._create_gresource_xml()
-        self._compile_resources()
+        source_size = self._get_source_size()
+        if self.use_cli:
+            self._create_gresource_xml()
+            self._compile_resources()
+        else:
+            self._write_resources()
+
+        compile_line.success(f"Compiled gnome-shell theme{self._get_size_report(source_size)}.")
 
-        compile_line.success("Compiled gnome-shell theme.")
+    def _write_resources(self):
+        resources = {path: self.policy.preprocess(path, content)
+                     for path, content in self._read_resources().items()}
+        compressed = [path for path in resources if self.policy.get_options(path).compressed]
+        GresourceWriter(resources, compressed=compressed).write(self.target_file)
+
+    def _read_resources(self) -> dict[str, bytes]:
+        """
+        Read all files from the source folder as resources under the theme prefix.
+        Target gresource and its manifest are skipped, since they can be stored in the source folder.
+        """
+        source_path = Path(self.source_folder)
+        return {
+            f"{self.prefix}/{file.relative_to(source_path).as_posix()}": file.read_bytes()
+            for file in self._get_included_files()
+        }
+
+    def _get_included_files(self) -> list[Path]:
+        """Source files without the unused ones"""
+        files = self._get_source_files()
+        if self.pruner is None:
+            return files
+
+        source_path = Path(self.source_folder)
+        relative_paths = {file: file.relative_to(source_path).as_posix() for file in files}
+        unused = self.pruner.get_unused(relative_paths.values(),
+                                        read=lambda path: (source_path / path).read_bytes())
+        self._pruned_count = len(unused)
+        return [file for file in files if relative_paths[file] not in unused]
+
+    def _get_source_files(self) -> list[Path]:
+        """Files of the source folder except the target gresource and its manifest"""
+        excluded = {os.path.abspath(self.target_file), os.path.abspath(self.gresource_xml)}
+        return [file for file in sorted(Path(self.source_folder).glob('**/*'))
+                if file.is_file() and os.path.abspath(file) not in excluded]
+
+    def _get_source_size(self) -> int:
+        return sum(file.stat().st_size for file in self._get_source_files())
+
+    def _get_size_report(self, source_size: int) -> str:
+        """Size of source files and of the compiled gresource"""
+        try:
+            compiled_size = os.path.getsize(self.target_file)
+        except OSError:
+            return ""
+        report = f"{self._format_size(source_size)} -> {self._format_size(compiled_size)}"
+        if self._pruned_count:
+            report += f", {self._pruned_count} unused resources left out"
+        return f" ({report})"
+
+    @staticmethod
+    def _format_size(size: int) -> str:
+        return f"{size / 1024:.1f} KiB"
 
     def _create_gresource_xml(self):
         with open(self.gresource_xml, 'w') as gresource_xml:
@@ -46,11 +130,19 @@ class GresourceCompiler:
     def _get_files_to_include(self):
         source_path = Path(self.source_folder)
         return [
-            f"<file>{file.relative_to(source_path)}</file>"
-            for file in source_path.glob('**/*')
-            if file.is_file()
+            f"<file{self._get_file_attributes(file.name)}>{file.relative_to(source_path)}</file>"
+            for file in self._get_included_files()
         ]
 
+    def _get_file_attributes(self, file_name: str) -> str:
+        options = self.policy.get_options(file_name)
+        attributes = ""
+        if options.compressed:
+            attributes += ' compressed="true"'
+        if options.preprocess:
+            attributes += f' preprocess="{options.preprocess}"'
+        return attributes
+
     def _compile_resources(self):
         try:
             self._try_compile_resources()
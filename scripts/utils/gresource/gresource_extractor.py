@@ -1,19 +1,36 @@
+import concurrent.futures
 import os
 
 from scripts.utils.command_runner.command_runner import CommandRunner
-from scripts.utils.gresource import raise_gresource_error
+from scripts.utils.gresource import raise_gresource_error, GresourceFormatError, GresourceExtractionError
+from scripts.utils.gresource.gresource_reader import GresourceReader
 from scripts.utils.logger.logger import LoggerFactory
 
 
 class GresourceExtractor:
+    """
+    Extracts theme resources from the gresource file.
+
+    Resources are read in process by GresourceReader.
+    If the file can't be read natively, `gresource` command line tool is used instead,
+    running up to `jobs` extractions at once.
+    """
+
+    prefix = "/org/gnome/shell/theme/"
+
     def __init__(
             self, gresource_path: str, extract_folder: str,
-            logger_factory: LoggerFactory, runner: CommandRunner
+            logger_factory: LoggerFactory, runner: CommandRunner,
+            jobs: int | None = None
     ):
+        """
+        :param jobs: maximum number of concurrent `gresource extract` processes (number of CPUs by default)
+        """
         self.gresource_path = gresource_path
         self.extract_folder = extract_folder
         self.logger_factory = logger_factory
         self.runner = runner
+        self.jobs = jobs or os.cpu_count() or 1
 
     def extract(self):
         extract_line = self.logger_factory.create_logger()
@@ -24,6 +41,32 @@ class GresourceExtractor:
         extract_line.success("Extracted gresource files.")
 
     def _try_extract_resources(self):
+        reader = self._open_reader()
+        if reader is not None:
+            with reader:
+                self._extract_with_reader(reader)
+            return
+
+        self._try_extract_with_cli()
+
+    def _open_reader(self) -> GresourceReader | None:
+        reader = GresourceReader(self.gresource_path)
+        try:
+            reader.open()
+        except (OSError, GresourceFormatError):
+            return None
+        return reader
+
+    def _extract_with_reader(self, reader: GresourceReader):
+        try:
+            for resource, content in reader.resources():
+                output_path = self._get_output_path(resource)
+                with open(output_path, 'wb') as f:
+                    f.write(content)
+        except GresourceFormatError as e:
+            raise Exception(f"gresource could not process the theme file: {self.gresource_path}") from e
+
+    def _try_extract_with_cli(self):
         try:
             resources = self._get_resources_list()
             self._extract_resources(resources)
@@ -32,6 +75,8 @@ class GresourceExtractor:
             if "gresource" in str(e):
                 raise_gresource_error("gresource", e)
             raise
+        except GresourceExtractionError:
+            raise
         except Exception as e:
             raise Exception(f"gresource could not process the theme file: {self.gresource_path}") from e
 
@@ -43,14 +88,40 @@ class GresourceExtractor:
         return resources_list_response.stdout.strip().split("\n")
 
     def _extract_resources(self, resources: list[str]):
-        prefix = "/org/gnome/shell/theme/"
-        for resource in resources:
-            resource_path = resource.replace(prefix, "")
-            output_path = os.path.join(self.extract_folder, resource_path)
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-
-            with open(output_path, 'wb') as f:
-                self.runner.run(
-                    ["gresource", "extract", self.gresource_path, resource],
-                    stdout=f, check=True
-                )
+        """
+        Extract resources concurrently. Every resource is streamed straight into its output file.
+        All failures are collected and reported together.
+        """
+        if not resources:
+            return
+
+        errors = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(self.jobs, len(resources))) as executor:
+            futures = {executor.submit(self._extract_resource, resource): resource for resource in resources}
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    errors[futures[future]] = e
+
+        missing_tool_error = next((e for e in errors.values() if isinstance(e, FileNotFoundError)), None)
+        if missing_tool_error:
+            raise missing_tool_error
+        if errors:
+            raise GresourceExtractionError(self.gresource_path, errors)
+
+    def _extract_resource(self, resource: str):
+        output_path = self._get_output_path(resource)
+
+        with open(output_path, 'wb') as f:
+            self.runner.run(
+                ["gresource", "extract", self.gresource_path, resource],
+                stdout=f, check=True
+            )
+
+    def _get_output_path(self, resource: str) -> str:
+        """Map resource path to the extract folder and create its parent folders"""
+        resource_path = resource.replace(self.prefix, "")
+        output_path = os.path.join(self.extract_folder, resource_path)
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        return output_path
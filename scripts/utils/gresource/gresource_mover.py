@@ -1,21 +1,45 @@
 import os
 import shutil
 
+from scripts.utils import hash_file
 from scripts.utils.logger.logger import LoggerFactory
 
 
 class GresourceMover:
+    """
+    Copies compiled gresource file to the system folder.
+    The copy is skipped if the installed file already has the same content.
+    """
     def __init__(self, source_file: str, destination_file: str, logger_factory: LoggerFactory):
         self.source_file = source_file
         self.destination_file = destination_file
         self.logger_factory = logger_factory
 
-    def move(self):
+    def move(self) -> bool:
+        """
+        :return: False if the installed file is already the same and nothing was changed
+        """
         move_line = self.logger_factory.create_logger()
         move_line.update("Moving gresource files...")
 
+        if self._is_destination_up_to_date():
+            move_line.success("Gresource files are already up to date.")
+            return False
+
         os.makedirs(os.path.dirname(self.destination_file), exist_ok=True)
         shutil.copyfile(self.source_file, self.destination_file)
         os.chmod(self.destination_file, 0o644)
 
         move_line.success("Moved gresource files.")
+        return True
+
+    def _is_destination_up_to_date(self) -> bool:
+        try:
+            destination_stat = os.stat(self.destination_file)
+            if destination_stat.st_mode & 0o777 != 0o644:
+                return False
+            if destination_stat.st_size != os.path.getsize(self.source_file):
+                return False
+            return hash_file(self.source_file) == hash_file(self.destination_file)
+        except OSError:
+            return False
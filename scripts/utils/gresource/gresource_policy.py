@@ -0,0 +1,69 @@
+import os
+import re
+from dataclasses import dataclass
+from typing import Mapping
+
+
+@dataclass(frozen=True)
+class ResourceOptions:
+    """
+    Options of a single resource, same as attributes of <file> in the gresource XML manifest.
+    :param compressed: store the resource compressed with zlib
+    :param preprocess: preprocessing of the resource content ("xml-stripblanks" is supported)
+    """
+    compressed: bool = False
+    preprocess: str | None = None
+
+
+class GresourcePolicy:
+    """
+    Compression and preprocessing policy of resources by file extension.
+
+    By default, styles and SVGs are compressed and blanks between SVG tags are stripped.
+    Images in already compressed formats (PNG, JPEG) are stored as is.
+
+    Example:
+        policy = GresourcePolicy({".css": ResourceOptions(compressed=True)})
+        policy.get_options("gnome-shell.css").compressed  # True
+    """
+
+    strip_blanks = "xml-stripblanks"
+    default_options = {
+        ".css": ResourceOptions(compressed=True),
+        ".svg": ResourceOptions(compressed=True, preprocess=strip_blanks),
+    }
+
+    _blanks_between_tags = re.compile(rb">\s*\n\s*<")
+    _whitespace_sensitive = re.compile(rb"<text\b|xml:space")
+
+    def __init__(self, options: Mapping[str, ResourceOptions] | None = None):
+        """
+        :param options: lowercase extension with dot -> options. Other files are stored uncompressed as is
+        """
+        self.options = dict(self.default_options if options is None else options)
+
+    def get_options(self, path: str) -> ResourceOptions:
+        extension = os.path.splitext(path)[1].lower()
+        return self.options.get(extension, ResourceOptions())
+
+    def preprocess(self, path: str, content: bytes) -> bytes:
+        """
+        Apply preprocessing of the resource
+        :raises ValueError: if the preprocessing is not supported
+        """
+        preprocess = self.get_options(path).preprocess
+        if preprocess is None:
+            return content
+        if preprocess == self.strip_blanks:
+            return self._strip_blanks(content)
+        raise ValueError(f"Unsupported preprocessing {preprocess} of {path}")
+
+    @classmethod
+    def _strip_blanks(cls, content: bytes) -> bytes:
+        """
+        Remove indentation between tags.
+        Documents with text elements are kept as is, because line breaks there render as spaces.
+        """
+        if cls._whitespace_sensitive.search(content):
+            return content
+        return cls._blanks_between_tags.sub(b"><", content)
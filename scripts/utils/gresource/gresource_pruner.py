@@ -0,0 +1,79 @@
+import fnmatch
+import posixpath
+import re
+from typing import Callable, Iterable
+
+
+class GresourcePruner:
+    """
+    Finds resources which are not used by the theme.
+
+    Resources matching the allowlist are always kept, because GNOME Shell loads them by path
+    (styles are selected by name, the spinner is loaded from code).
+    Other resources are kept only if they are reachable from the kept ones
+    through url(...) in styles or href attributes in SVGs.
+    The allowlist is not derived from the shell code, so resources which are loaded only by code
+    and not listed here are left out. That's why pruning is opt-in.
+
+    Example:
+        pruner = GresourcePruner()
+        unused = pruner.get_unused(["gnome-shell.css", "old-toggle.svg"], read=read_resource)
+    """
+
+    default_allowlist = ("*.css", "process-working*.svg", "icons/*")
+    resource_prefix = "resource:///org/gnome/shell/theme/"
+
+    _url_pattern = re.compile(rb"""url\(\s*(?:"([^"]*)"|'([^']*)'|([^)"'\s]*))\s*\)""", re.IGNORECASE)
+    _href_pattern = re.compile(rb"""href\s*=\s*(?:"([^"]*)"|'([^']*)')""", re.IGNORECASE)
+    _referencing_extensions = (".css", ".svg")
+
+    def __init__(self, allowlist: Iterable[str] = default_allowlist):
+        """
+        :param allowlist: glob patterns of relative resource paths which are always kept
+        """
+        self.allowlist = tuple(allowlist)
+
+    def get_unused(self, paths: Iterable[str], read: Callable[[str], bytes]) -> set[str]:
+        """
+        :param paths: relative resource paths, e.g. "icons/toggle.svg"
+        :param read: function returning content of the resource. Only reachable styles and SVGs are read
+        :return: relative paths of resources which are not reachable from the allowlisted ones
+        """
+        paths = set(paths)
+        reachable = {path for path in paths if self._is_allowed(path)}
+        pending = list(reachable)
+
+        while pending:
+            path = pending.pop()
+            for reference in self._get_references(path, read):
+                if reference in paths and reference not in reachable:
+                    reachable.add(reference)
+                    pending.append(reference)
+
+        return paths - reachable
+
+    def _is_allowed(self, path: str) -> bool:
+        return any(fnmatch.fnmatch(path, pattern) for pattern in self.allowlist)
+
+    def _get_references(self, path: str, read: Callable[[str], bytes]) -> set[str]:
+        """Relative paths of resources referenced by the file"""
+        if not path.lower().endswith(self._referencing_extensions):
+            return set()
+
+        content = read(path)
+        matches = list(self._url_pattern.finditer(content)) + list(self._href_pattern.finditer(content))
+        references = set()
+        for match in matches:
+            url = next(group for group in match.groups() if group is not None).decode("utf-8", "replace")
+            reference = self._resolve(path, url)
+            if reference:
+                references.add(reference)
+        return references
+
+    def _resolve(self, path: str, url: str) -> str | None:
+        url = url.split("#", 1)[0].split("?", 1)[0]
+        if url.startswith(self.resource_prefix):
+            return posixpath.normpath(url[len(self.resource_prefix):])
+        if not url or ":" in url or url.startswith("/"):
+            return None
+        return posixpath.normpath(posixpath.join(posixpath.dirname(path), url))
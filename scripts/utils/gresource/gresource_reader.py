@@ -0,0 +1,153 @@
+import mmap
+import struct
+import zlib
+from typing import Iterator
+
+from scripts.utils.gresource import GresourceFormatError
+
+
+class GresourceReader:
+    """
+    Pure Python reader of gresource files (GVDB format).
+
+    The file is memory-mapped, so resources are read without spawning
+    `gresource` processes and without loading the whole file at once.
+    Compressed resources are decompressed in process.
+
+    Example:
+        with GresourceReader("/usr/share/gnome-shell/gnome-shell-theme.gresource") as reader:
+            for path, content in reader.resources():
+                ...
+    """
+
+    _header = struct.Struct("<8sIIII")
+    _table_header = struct.Struct("<II")
+    _item = struct.Struct("<IIIHcxII")
+
+    _signature = b"GVariant"
+    _compressed_flag = 1
+    _no_parent = 0xffffffff
+    _bloom_words_mask = (1 << 27) - 1
+
+    def __init__(self, gresource_path: str):
+        self.gresource_path = gresource_path
+        self._file = None
+        self._data: mmap.mmap | None = None
+        self._values: dict[str, tuple[int, int]] | None = None
+
+    def __enter__(self) -> "GresourceReader":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def open(self):
+        self._file = open(self.gresource_path, "rb")
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._values = self._read_values()
+        except GresourceFormatError:
+            self.close()
+            raise
+        except (ValueError, struct.error) as e:
+            # empty files can't be mapped, truncated ones fail to unpack
+            self.close()
+            raise GresourceFormatError(self.gresource_path, str(e)) from e
+
+    def close(self):
+        if self._data is not None:
+            self._data.close()
+            self._data = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._values = None
+
+    def list_resources(self) -> list[str]:
+        """Return sorted paths of all resources, e.g. /org/gnome/shell/theme/gnome-shell.css"""
+        return sorted(self._get_values())
+
+    def read(self, resource: str) -> bytes:
+        """
+        Return uncompressed content of the resource
+        :raises KeyError: if the resource is not found
+        """
+        start, end = self._get_values()[resource]
+        return self._read_value(resource, start, end)
+
+    def resources(self) -> Iterator[tuple[str, bytes]]:
+        """Iterate over (path, content) of all resources in one pass over the file"""
+        for resource, (start, end) in sorted(self._get_values().items(), key=lambda value: value[1]):
+            yield resource, self._read_value(resource, start, end)
+
+    def _get_values(self) -> dict[str, tuple[int, int]]:
+        if self._values is None:
+            raise ValueError("Gresource file is not opened")
+        return self._values
+
+    def _read_values(self) -> dict[str, tuple[int, int]]:
+        """Read hash table of the root and map resource paths to value locations"""
+        signature, version, _, root_start, root_end = self._header.unpack_from(self._data, 0)
+        if signature != self._signature:
+            raise GresourceFormatError(self.gresource_path, "invalid signature")
+        if version != 0:
+            raise GresourceFormatError(self.gresource_path, f"unsupported version {version}")
+        self._check_range(root_start, root_end)
+
+        bloom_words, buckets = self._table_header.unpack_from(self._data, root_start)
+        items_start = root_start + self._table_header.size + 4 * (bloom_words & self._bloom_words_mask) + 4 * buckets
+        items_count = (root_end - items_start) // self._item.size
+        if items_count < 0:
+            raise GresourceFormatError(self.gresource_path, "invalid hash table")
+
+        items = [self._item.unpack_from(self._data, items_start + i * self._item.size) for i in range(items_count)]
+        names: dict[int, str] = {}
+        values = {}
+
+        for index, (_, _, _, _, item_type, value_start, value_end) in enumerate(items):
+            if item_type != b"v":
+                continue
+            self._check_range(value_start, value_end)
+            values[self._get_name(items, index, names)] = (value_start, value_end)
+
+        return values
+
+    def _get_name(self, items: list[tuple], index: int, names: dict[int, str], depth: int = 0) -> str:
+        """Build full name of the item, keys of items are stored relative to their parents"""
+        if index in names:
+            return names[index]
+        if index >= len(items) or depth > len(items):
+            raise GresourceFormatError(self.gresource_path, "invalid item parent")
+
+        _, parent, key_start, key_size, _, _, _ = items[index]
+        self._check_range(key_start, key_start + key_size)
+        prefix = "" if parent == self._no_parent else self._get_name(items, parent, names, depth + 1)
+
+        names[index] = prefix + self._data[key_start:key_start + key_size].decode("utf-8")
+        return names[index]
+
+    def _read_value(self, resource: str, start: int, end: int) -> bytes:
+        """
+        Values are variants holding (uuay): uncompressed size, flags and content.
+        Uncompressed content is stored with a trailing zero byte.
+        """
+        value = self._data[start:end]
+        type_separator = value.rfind(b"\0")
+        if type_separator < 8 or value[type_separator + 1:] != b"(uuay)":
+            raise GresourceFormatError(self.gresource_path, f"invalid value of {resource}")
+
+        size, flags = struct.unpack_from("<II", value, 0)
+        content = value[8:type_separator]
+        if flags & self._compressed_flag:
+            try:
+                content = zlib.decompress(content)
+            except zlib.error as e:
+                raise GresourceFormatError(self.gresource_path, f"invalid compressed value of {resource}") from e
+        if len(content) < size:
+            raise GresourceFormatError(self.gresource_path, f"truncated value of {resource}")
+        return content[:size]
+
+    def _check_range(self, start: int, end: int):
+        if not 0 <= start <= end <= len(self._data):
+            raise GresourceFormatError(self.gresource_path, "pointer out of file bounds")
@@ -0,0 +1,141 @@
+import struct
+import zlib
+from typing import Iterable, Mapping
+
+
+class GresourceWriter:
+    """
+    Pure Python writer of gresource files (GVDB format).
+
+    Serializes a mapping of resource paths to contents into the same format
+    glib-compile-resources produces, so no external tool or XML manifest is needed.
+
+    Example:
+        writer = GresourceWriter({"/org/gnome/shell/theme/gnome-shell.css": b"..."},
+                                 compressed=["/org/gnome/shell/theme/gnome-shell.css"])
+        writer.write("/tmp/gnome-shell-theme.gresource")
+    """
+
+    _header = struct.Struct("<8sIIII")
+    _table_header = struct.Struct("<II")
+    _item = struct.Struct("<IIIHcxII")
+
+    _signature = b"GVariant"
+    _compressed_flag = 1
+    _no_parent = 0xffffffff
+    _value_type = b"(uuay)"
+
+    def __init__(self, resources: Mapping[str, bytes], compressed: Iterable[str] = ()):
+        """
+        :param resources: absolute resource path -> content, e.g. /org/gnome/shell/theme/gnome-shell.css
+        :param compressed: resource paths which should be compressed with zlib
+        """
+        for path in resources:
+            if not path.startswith("/") or path.endswith("/"):
+                raise ValueError(f"Invalid resource path: {path}")
+
+        self.resources = resources
+        self.compressed = set(compressed)
+
+    def write(self, target_file: str):
+        with open(target_file, "wb") as f:
+            f.write(self.serialize())
+
+    def serialize(self) -> bytes:
+        parents = self._get_parents()
+        keys = self._sort_by_bucket(list(parents))
+        indexes = {key: index for index, key in enumerate(keys)}
+        children = self._get_children(parents)
+
+        data = bytearray(self._header.size)
+        table_size = self._table_header.size + 4 * len(keys) + self._item.size * len(keys)
+        table_start = self._append(data, bytes(table_size), alignment=4)
+
+        items = []
+        for key in keys:
+            parent = parents[key]
+            name = (key[len(parent):] if parent is not None else key).encode("utf-8")
+            key_start = self._append(data, name)
+
+            if key.endswith("/"):
+                item_type = b"L"
+                value = b"".join(struct.pack("<I", indexes[child]) for child in children.get(key, []))
+                value_start = self._append(data, value, alignment=4)
+            else:
+                item_type = b"v"
+                value = self._serialize_value(key)
+                value_start = self._append(data, value, alignment=8)
+
+            items.append(self._item.pack(
+                self._hash(key), indexes[parent] if parent is not None else self._no_parent,
+                key_start, len(name), item_type, value_start, value_start + len(value)
+            ))
+
+        table = (self._table_header.pack(0, len(keys)) +
+                 b"".join(struct.pack("<I", bucket) for bucket in self._get_buckets(keys)) +
+                 b"".join(items))
+        data[table_start:table_start + table_size] = table
+        data[:self._header.size] = self._header.pack(self._signature, 0, 0, table_start, table_start + table_size)
+        return bytes(data)
+
+    def _get_parents(self) -> dict[str, str | None]:
+        """Map every resource and its parent folders to their parent folders"""
+        parents: dict[str, str | None] = {"/": None}
+        for path in self.resources:
+            while path not in parents:
+                parent = path[:path.rstrip("/").rfind("/") + 1]
+                parents[path] = parent
+                path = parent
+        return parents
+
+    @staticmethod
+    def _get_children(parents: dict[str, str | None]) -> dict[str, list[str]]:
+        children = {}
+        for key, parent in sorted(parents.items()):
+            if parent is not None:
+                children.setdefault(parent, []).append(key)
+        return children
+
+    def _sort_by_bucket(self, keys: list[str]) -> list[str]:
+        return sorted(keys, key=lambda key: (self._hash(key) % len(keys), key))
+
+    def _get_buckets(self, keys: list[str]) -> list[int]:
+        """Index of the first item in each bucket, items are sorted by bucket"""
+        counts = [0] * len(keys)
+        for key in keys:
+            counts[self._hash(key) % len(keys)] += 1
+
+        buckets, first_item = [], 0
+        for count in counts:
+            buckets.append(first_item)
+            first_item += count
+        return buckets
+
+    def _serialize_value(self, path: str) -> bytes:
+        """
+        Serialize resource as variant holding (uuay): uncompressed size, flags and content.
+        Uncompressed content is followed by a zero byte, like glib-compile-resources does.
+        Resources which do not get smaller are stored uncompressed.
+        """
+        content = self.resources[path]
+        flags, stored = 0, content + b"\0"
+        if path in self.compressed:
+            compressed = zlib.compress(content, 9)
+            if len(compressed) < len(content):
+                flags, stored = self._compressed_flag, compressed
+        return struct.pack("<II", len(content), flags) + stored + b"\0" + self._value_type
+
+    @staticmethod
+    def _append(data: bytearray, chunk: bytes, alignment: int = 1) -> int:
+        data.extend(bytes(-len(data) % alignment))
+        start = len(data)
+        data.extend(chunk)
+        return start
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        """djb hash over signed chars, as used by GVDB"""
+        value = 5381
+        for char in key.encode("utf-8"):
+            value = (value * 33 + (char - 256 if char > 127 else char)) & 0xffffffff
+        return value
@@ -0,0 +1,46 @@
+import hashlib
+import os
+
+ignored_folders = {"__pycache__", ".git"}
+
+
+def hash_file(path: str) -> str:
+    """
+    Calculate SHA-256 hash of the file content
+    :param path: path to the file
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_files(*paths: str) -> str:
+    """
+    Calculate SHA-256 hash of files and folders (recursively).
+    Both file names and contents are hashed, so renaming a file changes the hash.
+    Python caches and git folders are skipped.
+    :param paths: files or folders to hash
+    """
+    digest = hashlib.sha256()
+
+    for path in paths:
+        digest.update(os.path.basename(path).encode() + b"\0")
+        for file_path in _list_files(path):
+            digest.update(os.path.relpath(file_path, path).encode() + b"\0")
+            digest.update(hash_file(file_path).encode())
+
+    return digest.hexdigest()
+
+
+def _list_files(path: str) -> list[str]:
+    if os.path.isfile(path):
+        return [path]
+
+    files = []
+    for root, dirs, filenames in os.walk(path):
+        dirs[:] = sorted(d for d in dirs if d not in ignored_folders)
+        files.extend(os.path.join(root, filename) for filename in sorted(filenames)
+                     if not filename.endswith(".pyc"))
+    return files
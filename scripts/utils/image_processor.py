@@ -0,0 +1,200 @@
+import importlib.util
+import os
+import shutil
+import subprocess
+import tempfile
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+
+from scripts.utils.command_runner.command_runner import CommandRunner
+from scripts.utils.command_runner.subprocess_command_runner import SubprocessCommandRunner
+from scripts.utils.hash_files import hash_file
+from scripts.utils.theme.theme_output_cache import ThemeOutputCache
+
+
+@dataclass(frozen=True)
+class ImageEffects:
+    """
+    Effects applied to an image
+    :param blur: gaussian blur radius (sigma) in pixels of the source image
+    :param resolution: (width, height) the image is downscaled to cover, keeping the aspect ratio.
+                       Smaller images are never upscaled
+    """
+    blur: int | None = None
+    resolution: tuple[int, int] | None = None
+
+    def __bool__(self):
+        return any(asdict(self).values())
+
+
+class ImageProcessor(ABC):
+    """
+    Applies effects to an image and writes the result in the format of the destination extension.
+    Metadata (EXIF, comments, color profiles) is not copied to the result.
+    """
+    name: str
+
+    @abstractmethod
+    def process(self, source: str, destination: str, effects: ImageEffects):
+        """
+        :raises OSError: if the image can't be read or written
+        :raises subprocess.CalledProcessError: if an external tool fails
+        """
+        pass
+
+    def is_cached(self, source: str, destination: str, effects: ImageEffects) -> bool:
+        """Check if the result is already available, so processing is fast"""
+        return False
+
+    def get_size(self, path: str) -> tuple[int, int] | None:
+        """
+        Get dimensions of the image
+        :return: (width, height) or None if the image can't be read
+        """
+        return None
+
+
+def get_cover_scale(size: tuple[int, int], resolution: tuple[int, int] | None) -> float:
+    """
+    Scale of the image which covers the resolution, like background-size: cover
+    :return: 1 if the image should be kept as is (no resolution or the image is smaller)
+    """
+    if not resolution:
+        return 1
+    scale = max(resolution[0] / size[0], resolution[1] / size[1])
+    return min(scale, 1)
+
+
+class PillowImageProcessor(ImageProcessor):
+    """In-process image processing with Pillow (optional dependency)"""
+    name = "pillow"
+
+    quality = 90
+
+    _orientation_tag = 0x0112
+    _rotated_orientations = (5, 6, 7, 8)
+
+    @staticmethod
+    def is_available() -> bool:
+        return importlib.util.find_spec("PIL") is not None
+
+    def process(self, source: str, destination: str, effects: ImageEffects):
+        from PIL import Image, ImageFilter, ImageOps
+
+        with Image.open(source) as image:
+            # multi-picture JPEGs from phones are saved as the primary picture only
+            image_format = "JPEG" if image.format == "MPO" else image.format
+            result = image
+            # orientation is stored in EXIF, which is not copied to the result
+            if image.getexif().get(self._orientation_tag, 1) != 1:
+                result = ImageOps.exif_transpose(result)
+            if result.mode in ("P", "1"):
+                result = result.convert("RGBA")
+
+            scale = get_cover_scale(result.size, effects.resolution)
+            if scale < 1:
+                size = (max(1, round(result.width * scale)), max(1, round(result.height * scale)))
+                result = result.resize(size, Image.Resampling.LANCZOS)
+            if effects.blur:
+                # blurring the downscaled image looks the same as downscaling the blurred one and is much faster
+                result = result.filter(ImageFilter.GaussianBlur(radius=effects.blur * scale))
+
+            # untouched JPEGs keep their quantization tables, so re-encoding only drops metadata
+            quality = "keep" if result is image and image.format == "JPEG" else self.quality
+            result.save(destination, format=image_format, optimize=True, quality=quality,
+                        exif=b"", icc_profile=None)
+
+    def get_size(self, path: str) -> tuple[int, int] | None:
+        from PIL import Image
+
+        try:
+            with Image.open(path) as image:
+                width, height = image.size
+                if image.getexif().get(self._orientation_tag, 1) in self._rotated_orientations:
+                    return height, width
+                return width, height
+        except OSError:
+            return None
+
+
+class MagickImageProcessor(ImageProcessor):
+    """Image processing with ImageMagick command line tool"""
+    name = "magick"
+
+    def __init__(self, runner: CommandRunner | None = None):
+        self.runner = runner or SubprocessCommandRunner()
+
+    @staticmethod
+    def is_available() -> bool:
+        return shutil.which("magick") is not None
+
+    def process(self, source: str, destination: str, effects: ImageEffects):
+        command = ["magick", source, "-auto-orient"]
+        if effects.blur:
+            command.extend(["-blur", f"0x{effects.blur}"])
+        if effects.resolution:
+            width, height = effects.resolution
+            # ^ covers the resolution, > only shrinks larger images
+            command.extend(["-resize", f"{width}x{height}^>"])
+        command.extend(["-strip", "-quality", str(PillowImageProcessor.quality), destination])
+        self.runner.run(command, check=True)
+
+    def get_size(self, path: str) -> tuple[int, int] | None:
+        try:
+            result = self.runner.run(["magick", "identify", "-format", "%wx%h", f"{path}[0]"],
+                                     check=True, capture_output=True, text=True)
+            width, height = result.stdout.strip().split("x")
+            return int(width), int(height)
+        except (OSError, ValueError, AttributeError, subprocess.CalledProcessError):
+            return None
+
+
+class CachedImageProcessor(ImageProcessor):
+    """
+    Stores processed images in a persistent cache,
+    keyed by hash of the source image, the effects and the processor which applied them.
+
+    Example:
+        processor = CachedImageProcessor(PillowImageProcessor(), ThemeOutputCache(folder, max_size))
+        processor.process("wallpaper.jpg", "/tmp/gdm-image.jpg", ImageEffects(blur=40))
+    """
+
+    def __init__(self, processor: ImageProcessor, cache: ThemeOutputCache):
+        self.processor = processor
+        self.cache = cache
+        self.name = processor.name
+
+    def is_cached(self, source: str, destination: str, effects: ImageEffects) -> bool:
+        return self.cache.contains(self._get_key(source, destination, effects))
+
+    def process(self, source: str, destination: str, effects: ImageEffects):
+        key = self._get_key(source, destination, effects)
+        with tempfile.TemporaryDirectory() as entry_folder:
+            entry_file = os.path.join(entry_folder, "image" + self._get_extension(destination))
+            if not self.cache.restore(key, entry_folder):
+                self.processor.process(source, entry_file, effects)
+                self.cache.store(key, entry_folder)
+            shutil.copyfile(entry_file, destination)
+
+    def get_size(self, path: str) -> tuple[int, int] | None:
+        return self.processor.get_size(path)
+
+    def _get_key(self, source: str, destination: str, effects: ImageEffects) -> str:
+        return ThemeOutputCache.get_key(hash_file(source), self._get_extension(destination),
+                                        self.processor.name, asdict(effects))
+
+    @staticmethod
+    def _get_extension(path: str) -> str:
+        return os.path.splitext(path)[1].lower()
+
+
+def get_image_processor() -> ImageProcessor | None:
+    """
+    Get the best available image processor: Pillow in process, else ImageMagick.
+    :return: None if neither is available
+    """
+    if PillowImageProcessor.is_available():
+        return PillowImageProcessor()
+    if MagickImageProcessor.is_available():
+        return MagickImageProcessor()
+    return None
@@ -0,0 +1,68 @@
+import re
+from typing import Iterable
+
+from scripts.utils.file_system.file_system import FileSystem
+from scripts.utils.file_system.local_file_system import LocalFileSystem
+
+
+class KeywordsReplacer:
+    """
+    Replaces many keywords in a single scan of the content.
+
+    All keywords are compiled into one regex alternation, ordered from the longest
+    to the shortest, so a keyword never matches a prefix of a longer one
+    (e.g. ACCENT-COLOR inside ACCENT-COLOR-SECONDARY).
+    Build it once per replacement set and reuse it for every file.
+
+    Example:
+        replacer = KeywordsReplacer(("ACCENT-COLOR", "rgba(...)"), ("ACCENT_HOVER", "rgba(...)"))
+        replacer.replace_in_file("gnome-shell.css")
+    """
+
+    supported_extensions = ('.css', '.scss', '.svg')
+
+    def __init__(self, *replacements: tuple[str, str]):
+        """
+        :param replacements: (keyword, replacement), (...), ...
+        If the keyword is repeated, the first replacement is used.
+        """
+        self.replacements: dict[str, str] = {}
+        for keyword, replacement in replacements:
+            if keyword:
+                self.replacements.setdefault(keyword, replacement)
+
+        self.pattern = compile_keywords_pattern(self.replacements)
+
+    def replace(self, content: str) -> str:
+        """Replace all keywords in the content"""
+        if self.pattern is None:
+            return content
+
+        replacements = self.replacements
+        return self.pattern.sub(lambda match: replacements[match.group(0)], content)
+
+    def replace_in_file(self, file: str, file_system: FileSystem | None = None):
+        """
+        Replace all keywords in the file.
+        Files which are not styles or SVGs are skipped.
+        :param file_system: file system where the file is stored (disk by default)
+        """
+        if not file.lower().endswith(self.supported_extensions):
+            return
+
+        file_system = file_system or LocalFileSystem()
+        content = file_system.read_text(file)
+        file_system.write_text(file, self.replace(content))
+
+
+def compile_keywords_pattern(keywords: Iterable[str]) -> re.Pattern | None:
+    """
+    Compile keywords into a single regex alternation with one capturing group.
+    Longer keywords are tried first, so the longest keyword always wins.
+    :return: compiled pattern or None if there are no keywords
+    """
+    keywords = sorted({keyword for keyword in keywords if keyword}, key=len, reverse=True)
+    if not keywords:
+        return None
+
+    return re.compile("(" + "|".join(re.escape(keyword) for keyword in keywords) + ")")
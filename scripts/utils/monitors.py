@@ -0,0 +1,41 @@
+import glob
+import os
+
+Resolution = tuple[int, int]
+
+
+def get_largest_monitor_resolution(drm_folder: str = "/sys/class/drm") -> Resolution | None:
+    """
+    Get the largest preferred resolution of connected monitors.
+    Monitors are read from the kernel DRM connectors, so no display server is needed (e.g. under sudo).
+    :param drm_folder: sysfs folder with DRM connectors
+    :return: (width, height) or None if no connected monitor is found
+    """
+    resolutions = []
+    for connector in glob.glob(os.path.join(drm_folder, "card*-*")):
+        try:
+            with open(os.path.join(connector, "status")) as status:
+                if status.read().strip() != "connected":
+                    continue
+            with open(os.path.join(connector, "modes")) as modes:
+                preferred_mode = modes.readline().strip()
+        except OSError:
+            continue
+
+        resolution = parse_resolution(preferred_mode)
+        if resolution:
+            resolutions.append(resolution)
+
+    return max(resolutions, key=lambda size: size[0] * size[1], default=None)
+
+
+def parse_resolution(value: str) -> Resolution | None:
+    """
+    Parse resolution like 1920x1080 (mode suffixes like 1920x1080i are ignored)
+    :return: (width, height) or None if the value is not a resolution
+    """
+    width, _, height = value.lower().partition("x")
+    height = height.rstrip("abcdefghijklmnopqrstuvwxyz")
+    if not (width.isdigit() and height.isdigit()) or int(width) == 0 or int(height) == 0:
+        return None
+    return int(width), int(height)
@@ -1,19 +1,20 @@
-def replace_keywords(file, *args: tuple[str, str]):
+from functools import lru_cache
+
+from .file_system.file_system import FileSystem
+from .keywords_replacer import KeywordsReplacer
+
+
+def replace_keywords(file, *args: tuple[str, str], file_system: FileSystem | None = None):
     """
     Replace file with several keywords
     :param file: file name where keywords must be replaced
     :param args: (keyword, replacement), (...), ...
+    :param file_system: file system where the file is stored (disk by default)
     """
+    _get_replacer(tuple(args)).replace_in_file(file, file_system)
 
-    # skip binary files in project
-    if not file.lower().endswith(('.css', '.scss', '.svg')):
-        return
-
-    with open(file, "r") as read_file:
-        content = read_file.read()
-
-    for keyword, replacement in args:
-        content = content.replace(keyword, replacement)
 
-    with open(file, "w") as write_file:
-        write_file.write(content)
+@lru_cache(maxsize=16)
+def _get_replacer(replacements: tuple[tuple[str, str], ...]) -> KeywordsReplacer:
+    """Reuse compiled replacers for repeated replacement sets"""
+    return KeywordsReplacer(*replacements)
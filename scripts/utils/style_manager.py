@@ -1,40 +1,45 @@
-import os
-
 from scripts.utils import generate_file
+from scripts.utils.file_system.file_system import FileSystem
+from scripts.utils.file_system.local_file_system import LocalFileSystem
+from scripts.utils.keywords_replacer import KeywordsReplacer
 
 
 class StyleManager:
     """Manages the style files for the theme."""
 
-    def __init__(self, output_file: str):
+    def __init__(self, output_file: str, file_system: FileSystem | None = None):
         """
         :param output_file: The path to the output file where styles will be combined.
+        :param file_system: File system where the output file is stored (disk by default).
         """
         self.output_file = output_file
+        self.file_system = file_system or LocalFileSystem()
 
     def append_content(self, content: str):
         """
         Append content to the output file.
         :raises FileNotFoundError: if the file does not exist.
         """
-        if not os.path.exists(self.output_file):
-            raise FileNotFoundError(f"The file {self.output_file} does not exist.")
-        with open(self.output_file, 'a') as output:
-            output.write('\n' + content)
+        self.file_system.append_text(self.output_file, '\n' + content)
 
     def prepend_content(self, content: str):
         """
         Prepend content to the output file.
         :raises FileNotFoundError: if the file does not exist.
         """
-        with open(self.output_file, 'r') as output:
-            main_content = output.read()
-        with open(self.output_file, 'w') as output:
-            output.write(content + '\n' + main_content)
+        main_content = self.file_system.read_text(self.output_file)
+        self.file_system.write_text(self.output_file, content + '\n' + main_content)
+
+    def replace_keywords(self, *args: tuple[str, str]):
+        """
+        Replace keywords in the output file.
+        :param args: (keyword, replacement), (...), ...
+        """
+        KeywordsReplacer(*args).replace_in_file(self.output_file, self.file_system)
 
     def generate_combined_styles(self, sources_location: str, temp_folder: str):
         """
         Generate the combined styles file
         by merging all styles from the source location.
         """
-        generate_file(sources_location, temp_folder, self.output_file)
\ No newline at end of file
+        generate_file(sources_location, temp_folder, self.output_file, self.file_system)
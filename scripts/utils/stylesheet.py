@@ -0,0 +1,217 @@
+import re
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, TypeAlias
+
+from .keywords_replacer import compile_keywords_pattern
+
+_TOKEN_PATTERN = re.compile(r"""
+      (?P<comment>/\*.*?(?:\*/|$))
+    | (?P<string>"(?:\\.|[^"\\\n])*"?|'(?:\\.|[^'\\\n])*'?)
+    | (?P<url>url\([^)]*\)?)
+    | (?P<punct>[{};])
+    | (?P<text>[^{};/"'u]+|.)
+""", re.VERBOSE | re.DOTALL | re.IGNORECASE)
+
+_COMMENT_PATTERN = re.compile(r"/\*.*?(?:\*/|$)", re.DOTALL)
+_STRING_PATTERN = re.compile(r""""(?:\\.|[^"\\\n])*"?|'(?:\\.|[^'\\\n])*'?""")
+
+
+def tokenize_css(content: str) -> Iterator[tuple[str, str]]:
+    """
+    Split styles into tokens without changing any character.
+    Comments, strings and url() are single tokens, so braces and semicolons inside them are ignored.
+    :return: (kind, text), where kind is "comment", "string", "url", "punct" or "text"
+    """
+    for match in _TOKEN_PATTERN.finditer(content):
+        yield match.lastgroup, match.group()
+
+
+@dataclass
+class CssRaw:
+    """Comment, whitespace or stray text which is kept as is"""
+    text: str
+
+    def serialize(self, parts: list[str]):
+        parts.append(self.text)
+
+
+@dataclass
+class CssDeclaration:
+    """
+    Property declaration inside a rule or statement (e.g. @import) outside of rules.
+    Text keeps leading whitespace and the declaration as written, without the semicolon.
+    """
+    text: str
+    terminated: bool = True
+
+    @property
+    def name(self) -> str:
+        """Lowercase property name or empty string if the declaration is not a property"""
+        text = _COMMENT_PATTERN.sub("", self.text)
+        if ":" not in text:
+            return ""
+        return text.split(":", 1)[0].strip().lower()
+
+    def serialize(self, parts: list[str]):
+        parts.append(self.text)
+        if self.terminated:
+            parts.append(";")
+
+
+@dataclass
+class CssRule:
+    """Rule or at-rule block (e.g. @media) with declarations and nested rules"""
+    prelude: str
+    children: list["CssNode"] = field(default_factory=list)
+    closing: str = ""
+    closed: bool = True
+
+    def serialize(self, parts: list[str]):
+        parts.append(self.prelude)
+        parts.append("{")
+        for child in self.children:
+            child.serialize(parts)
+        parts.append(self.closing)
+        if self.closed:
+            parts.append("}")
+
+
+CssNode: TypeAlias = CssRaw | CssDeclaration | CssRule
+
+
+class Stylesheet:
+    """
+    Lightweight model of a styles file, parsed once for all transformations.
+
+    Parsing keeps every character of the source, so serializing an unchanged
+    stylesheet returns the original content and filters change only what they remove.
+
+    Example:
+        stylesheet = Stylesheet.parse(content)
+        stylesheet.remove_keywords(" !important")
+        stylesheet.remove_properties("color", "box-shadow")
+        content = stylesheet.serialize()
+    """
+
+    def __init__(self, children: list[CssNode] | None = None):
+        self.children: list[CssNode] = children if children is not None else []
+
+    @classmethod
+    def parse(cls, content: str) -> "Stylesheet":
+        root = CssRule("")
+        stack = [root]
+        pending: list[str] = []
+        pending_is_blank = True
+
+        for kind, text in tokenize_css(content):
+            block = stack[-1]
+
+            if kind == "comment" and pending_is_blank:
+                block.children.append(CssRaw("".join(pending) + text))
+                pending.clear()
+                continue
+            if kind != "punct":
+                pending.append(text)
+                pending_is_blank = pending_is_blank and kind == "text" and text.isspace()
+                continue
+
+            if text == "{":
+                rule = CssRule("".join(pending))
+                block.children.append(rule)
+                stack.append(rule)
+                pending.clear()
+            elif text == ";":
+                block.children.append(CssDeclaration("".join(pending)))
+                pending.clear()
+            elif len(stack) > 1:
+                cls._close_block(block, "".join(pending))
+                stack.pop()
+                pending.clear()
+            else:
+                pending.append(text)
+                pending_is_blank = False
+                continue
+            pending_is_blank = True
+
+        rest = "".join(pending)
+        while len(stack) > 1:
+            block = stack.pop()
+            cls._close_block(block, rest)
+            block.closed = False
+            rest = ""
+        if rest:
+            root.children.append(CssRaw(rest))
+
+        return cls(root.children)
+
+    @staticmethod
+    def _close_block(block: CssRule, pending: str):
+        """Text before the closing brace is either whitespace or the last declaration without semicolon"""
+        if pending.strip():
+            block.children.append(CssDeclaration(pending, terminated=False))
+        else:
+            block.closing = pending
+
+    def rules(self) -> Iterator[CssRule]:
+        """Iterate over all rules including the nested ones"""
+        blocks = [self.children]
+        while blocks:
+            for node in blocks.pop():
+                if isinstance(node, CssRule):
+                    yield node
+                    blocks.append(node.children)
+
+    def remove_properties(self, *properties: str) -> "Stylesheet":
+        """
+        Remove declarations of the properties from all rules.
+        Property names are compared exactly, so "color" does not remove "background-color".
+        """
+        properties = {prop.strip().lower() for prop in properties}
+        if not properties:
+            return self
+
+        for rule in self.rules():
+            rule.children = [node for node in rule.children
+                             if not (isinstance(node, CssDeclaration) and node.name in properties)]
+        return self
+
+    def remove_keywords(self, *keywords: str) -> "Stylesheet":
+        """Remove keywords from selectors and declarations. Comments and strings are left untouched."""
+        keywords_pattern = compile_keywords_pattern(keywords)
+        if keywords_pattern is None:
+            return self
+
+        pattern = re.compile(f"({_COMMENT_PATTERN.pattern}|{_STRING_PATTERN.pattern})|{keywords_pattern.pattern}",
+                             re.DOTALL)
+
+        def remove(text: str) -> str:
+            return pattern.sub(lambda match: match.group(1) or "", text)
+
+        for nodes in self._walk_children():
+            for node in nodes:
+                if isinstance(node, CssDeclaration):
+                    node.text = remove(node.text)
+                elif isinstance(node, CssRule):
+                    node.prelude = remove(node.prelude)
+        return self
+
+    def prepend(self, content: str) -> "Stylesheet":
+        """Insert styles at the beginning"""
+        self.children[:0] = Stylesheet.parse(content).children
+        return self
+
+    def append(self, content: str) -> "Stylesheet":
+        """Add styles to the end"""
+        self.children.extend(Stylesheet.parse(content).children)
+        return self
+
+    def serialize(self) -> str:
+        parts: list[str] = []
+        for node in self.children:
+            node.serialize(parts)
+        return "".join(parts)
+
+    def _walk_children(self) -> Iterable[list[CssNode]]:
+        yield self.children
+        for rule in self.rules():
+            yield rule.children
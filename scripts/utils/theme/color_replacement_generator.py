@@ -1,35 +1,80 @@
-import copy
-
 from scripts.install.colors_definer import ColorsDefiner
 from scripts.types.installation_color import InstallationMode, InstallationColor
 from scripts.utils.color_converter.color_converter import ColorConverter
+from scripts.utils.theme.replacements_cache import ReplacementsCache, replacements_cache
 
 
 class ColorReplacementGenerator:
-    def __init__(self, colors_provider: ColorsDefiner, color_converter: ColorConverter):
-        self.colors = copy.deepcopy(colors_provider)
+    def __init__(self, colors_provider: ColorsDefiner, color_converter: ColorConverter,
+                 cache: ReplacementsCache | None = None):
+        """
+        :param colors_provider: color definitions. Its palette is immutable, so it is shared without copying
+        :param color_converter: converter used to calculate colors
+        :param cache: cache for finished replacement tables (shared process-wide cache by default)
+        """
+        self.palette = colors_provider.palette
         self.color_converter = color_converter
+        self.cache = cache or replacements_cache
+
+    @property
+    def keywords(self) -> list[str]:
+        """Keywords which will be replaced by the generated colors"""
+        return list(self.palette.elements)
 
     def convert(self, mode: InstallationMode, theme_color: InstallationColor) -> list[tuple[str, str]]:
         """Generate a list of color replacements for the given theme color and mode"""
-        return [
-            (element, self._create_rgba_value(element, mode, theme_color))
-            for element in self.colors.replacers
-        ]
+        return self.convert_many([(mode, theme_color)])[0]
+
+    def convert_many(self, variants: list[tuple[InstallationMode, InstallationColor]]) -> list[list[tuple[str, str]]]:
+        """
+        Generate color replacements for many theme colors and modes at once.
+        Tables are taken from the cache if possible,
+        all other colors are converted in one batch call.
+        :param variants: list of (mode, theme color)
+        :return: list of replacements for each variant, in the same order
+        """
+        keys = [self._get_cache_key(mode, theme_color) for mode, theme_color in variants]
+        tables = [self.cache.get(key) for key in keys]
+
+        missing = [i for i, table in enumerate(tables) if table is None]
+        if not missing:
+            return tables
+
+        computed = self._compute_many([variants[i] for i in missing])
+        for i, table in zip(missing, computed):
+            self.cache.put(keys[i], table)
+            tables[i] = table
+
+        return tables
 
-    def _create_rgba_value(self, element: str, mode: str, theme_color: InstallationColor) -> str:
-        """Create RGBA value for the specified element"""
-        color_def = self._get_color_definition(element, mode)
+    def _get_cache_key(self, mode: InstallationMode, theme_color: InstallationColor) -> tuple:
+        """
+        Filled style is not a part of the key:
+        it changes keywords in the theme files, not the replacement table.
+        """
+        return self.palette.key, theme_color.hue, theme_color.saturation, mode
 
-        lightness = int(color_def["l"]) / 100
-        saturation = int(color_def["s"]) / 100
-        saturation = self._adjust_saturation(saturation, theme_color)
-        alpha = color_def["a"]
+    def _compute_many(self, variants: list[tuple[InstallationMode, InstallationColor]]) -> list[list[tuple[str, str]]]:
+        elements = self.palette.elements
+        hsl_colors = []
+        alphas = []
 
-        red, green, blue = self.color_converter.hsl_to_rgb(
-            theme_color.hue, saturation, lightness
-        )
+        for mode, theme_color in variants:
+            hue = theme_color.hue
+            for color_def in self.palette.get_definitions(mode):
+                saturation = self._adjust_saturation(color_def.saturation, theme_color)
+                hsl_colors.append((hue, saturation, color_def.lightness))
+                alphas.append(color_def.alpha)
 
+        rgb_colors = iter(zip(self.color_converter.hsl_to_rgb_many(hsl_colors), alphas))
+        return [
+            [(element, self._format_rgba(*next(rgb_colors))) for element in elements]
+            for _ in variants
+        ]
+
+    @staticmethod
+    def _format_rgba(rgb: tuple[int, int, int], alpha) -> str:
+        red, green, blue = rgb
         return f"rgba({red}, {green}, {blue}, {alpha})"
 
     @staticmethod
@@ -40,13 +85,3 @@ class ColorReplacementGenerator:
 
         adjusted = base_saturation * (theme_color.saturation / 100)
         return min(adjusted, 1.0)
-
-    def _get_color_definition(self, element: str, mode: str) -> dict:
-        """Get color definition for element, handling defaults if needed"""
-        replacer = self.colors.replacers[element]
-
-        if mode not in replacer and replacer["default"]:
-            default_element = replacer["default"]
-            return self.colors.replacers[default_element][mode]
-
-        return replacer[mode]
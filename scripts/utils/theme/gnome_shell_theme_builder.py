@@ -3,6 +3,8 @@ import os.path
 from scripts import config
 from scripts.install.colors_definer import ColorsDefiner
 from scripts.utils.color_converter.color_converter_impl import ColorConverterImpl
+from scripts.utils.file_system.file_system import FileSystem
+from scripts.utils.file_system.local_file_system import LocalFileSystem
 from scripts.utils.logger.console import Console
 from scripts.utils.logger.logger import LoggerFactory
 from scripts.utils.style_manager import StyleManager
@@ -40,6 +42,7 @@ class GnomeShellThemeBuilder:
         self.main_styles = os.path.join(self.temp_folder, f"{self.theme_name}.css")
 
         self.logger_factory: LoggerFactory | None = None
+        self.file_system: FileSystem | None = None
         self.preparation: ThemePreparation | None = None
         self.installer: ThemeInstaller | None = None
 
@@ -73,6 +76,14 @@ class GnomeShellThemeBuilder:
         self.logger_factory = logger_factory
         return self
 
+    def with_file_system(self, file_system: FileSystem | None):
+        """
+        Inject a file system for the temporary folder.
+        Use MemoryFileSystem to prepare the theme in RAM.
+        """
+        self.file_system = file_system
+        return self
+
     def with_preparation(self, preparation: ThemePreparation | None):
         """Inject a preparation instance for preparing the theme."""
         self.preparation = preparation
@@ -100,15 +111,20 @@ class GnomeShellThemeBuilder:
 
         :return: Theme instance ready for preparation and installation
         """
+        self._resolve_file_system()
         self._resolve_preparation()
         self._resolve_installer()
         return Theme(self.preparation, self.installer, self.mode, self.is_filled)
 
+    def _resolve_file_system(self):
+        if self.file_system: return
+        self.file_system = LocalFileSystem()
+
     def _resolve_preparation(self):
         if self.preparation: return
 
-        file_manager = ThemeTempManager(self.temp_folder)
-        style_manager = StyleManager(self.main_styles)
+        file_manager = ThemeTempManager(self.temp_folder, file_system=self.file_system)
+        style_manager = StyleManager(self.main_styles, file_system=self.file_system)
         self.preparation = ThemePreparation(self.source_folder,
                                             file_manager=file_manager, style_manager=style_manager)
 
@@ -125,4 +141,5 @@ class GnomeShellThemeBuilder:
         self.installer = ThemeInstaller(self.theme_name, self.temp_folder, self.destination_folder,
                                         logger_factory=logger_factory,
                                         color_applier=color_applier,
-                                        path_provider=path_provider)
\ No newline at end of file
+                                        path_provider=path_provider,
+                                        file_system=self.file_system)
\ No newline at end of file
@@ -0,0 +1,73 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable
+
+
+@dataclass(frozen=True)
+class ReplacementsCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+
+class ReplacementsCache:
+    """
+    Bounded LRU cache of finished replacement tables.
+
+    One instance (replacements_cache) is shared by all ColorReplacementGenerator objects in the process,
+    so repeated colors (e.g. GDM variants with the same hue) are computed only once.
+    """
+
+    def __init__(self, max_size: int = 256):
+        """
+        :param max_size: maximal number of tables kept in the cache
+        """
+        if max_size < 1:
+            raise ValueError(f"Cache size must be positive, not {max_size}")
+
+        self.max_size = max_size
+        self._tables: OrderedDict[Hashable, tuple[tuple[str, str], ...]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> list[tuple[str, str]] | None:
+        """Get a copy of the cached table and mark it as recently used. Counts a hit or a miss."""
+        with self._lock:
+            table = self._tables.get(key)
+            if table is None:
+                self._misses += 1
+                return None
+
+            self._tables.move_to_end(key)
+            self._hits += 1
+            return list(table)
+
+    def put(self, key: Hashable, table: list[tuple[str, str]]):
+        """Store the table, evicting the least recently used ones if the cache is full"""
+        with self._lock:
+            self._tables[key] = tuple(table)
+            self._tables.move_to_end(key)
+
+            while len(self._tables) > self.max_size:
+                self._tables.popitem(last=False)
+                self._evictions += 1
+
+    def stats(self) -> ReplacementsCacheStats:
+        with self._lock:
+            return ReplacementsCacheStats(hits=self._hits, misses=self._misses, evictions=self._evictions,
+                                          size=len(self._tables), max_size=self.max_size)
+
+    def clear(self):
+        """Remove all tables and reset counters"""
+        with self._lock:
+            self._tables.clear()
+            self._hits = self._misses = self._evictions = 0
+
+
+replacements_cache = ReplacementsCache()
@@ -68,6 +68,14 @@ class Theme(ThemeBase):
         self._preparation.add_to_start(content)
         return self
 
+    def replace_keywords(self, *args: tuple[str, str]) -> "Theme":
+        """
+        Replaces keywords in the main styles file.
+        :param args: (keyword, replacement), (...), ...
+        """
+        self._preparation.replace_keywords(*args)
+        return self
+
     def add_from_file(self, content) -> "Theme":
         """
         Adds content from a file to the main styles file.
@@ -82,6 +90,24 @@ class Theme(ThemeBase):
         if self.is_filled:
             self._preparation.replace_filled_keywords()
 
+    def prepare_from(self, prepared: "Theme"):
+        """
+        Reuse files of an already prepared theme instead of preparing the theme again.
+        Filled keywords are replaced only if the prepared theme was not filled.
+        :param prepared: theme with the same sources which was already prepared
+        """
+        self._preparation.prepare_from(prepared._preparation)
+        if self.is_filled and not prepared.is_filled:
+            self._preparation.replace_filled_keywords()
+
+    def compile(self):
+        """
+        Compile the prepared theme into a template, so every color
+        is rendered without reading and scanning the theme files again.
+        Should be called after tweaks are applied.
+        """
+        self._installer.compile_template()
+
     def install(self, hue, name: str, sat: float | None = None, destination: str | None = None):
         """
         Installs the theme by applying the specified accent color and copying the finalized files
@@ -92,10 +118,13 @@ class Theme(ThemeBase):
             name: The name of the theme.
             sat: The saturation value for the accent color.
             destination: The custom folder where the theme will be installed.
+
+        Returns:
+            Number of written and skipped (already up to date) files.
         """
         theme_color = InstallationColor(
             hue=hue,
             saturation=sat,
             modes=self.modes
         )
-        self._installer.install(theme_color, name, destination)
\ No newline at end of file
+        return self._installer.install(theme_color, name, destination)
\ No newline at end of file
@@ -1,8 +1,9 @@
 import os
 
 from scripts.types.installation_color import InstallationColor, InstallationMode
-from scripts.utils import replace_keywords
+from scripts.utils.keywords_replacer import KeywordsReplacer
 from scripts.utils.theme.color_replacement_generator import ColorReplacementGenerator
+from scripts.utils.theme.theme_template import RenderStats, ThemeTemplate
 
 
 class ThemeColorApplier:
@@ -11,10 +12,22 @@ class ThemeColorApplier:
     def __init__(self, color_replacement_generator: ColorReplacementGenerator):
         self.color_replacement_generator = color_replacement_generator
 
+    @property
+    def keywords(self) -> list[str]:
+        """Keywords which are replaced with theme colors"""
+        return self.color_replacement_generator.keywords
+
     def apply(self, theme_color: InstallationColor, destination: str, mode: InstallationMode):
         """Apply theme colors to all files in the directory"""
         replacements = self.color_replacement_generator.convert(mode, theme_color)
+        replacer = KeywordsReplacer(*replacements)
 
         for filename in os.listdir(destination):
             file_path = os.path.join(destination, filename)
-            replace_keywords(file_path, *replacements)
+            replacer.replace_in_file(file_path)
+
+    def render(self, template: ThemeTemplate, theme_color: InstallationColor, destination: str,
+               mode: InstallationMode) -> RenderStats:
+        """Render the compiled theme with theme colors into the destination directory"""
+        replacements = self.color_replacement_generator.convert(mode, theme_color)
+        return template.render(destination, dict(replacements))
@@ -1,22 +1,32 @@
+import os
+import threading
+
 from scripts.types.installation_color import InstallationColor, InstallationMode
-from scripts.utils import copy_files
+from scripts.utils.file_system.file_system import FileSystem
+from scripts.utils.file_system.local_file_system import LocalFileSystem
 from scripts.utils.logger.console import Console, Color, Format
 from scripts.utils.logger.logger import LoggerFactory
 from scripts.utils.theme.theme_color_applier import ThemeColorApplier
 from scripts.utils.theme.theme_path_provider import ThemePathProvider
+from scripts.utils.theme.theme_template import RenderStats, ThemeTemplate
 
 
 class ThemeInstaller:
     """
-    Handles the installation of themes by copying files and applying color schemes.
+    Handles the installation of themes by rendering the prepared theme with color schemes.
+
+    The prepared theme is compiled into a template on the first installation
+    and recompiled only if files in the source folder have changed.
     """
 
     def __init__(self, theme_type: str, source_folder: str, destination_folder: str,
-                 logger_factory: LoggerFactory, color_applier: ThemeColorApplier, path_provider: ThemePathProvider):
+                 logger_factory: LoggerFactory, color_applier: ThemeColorApplier, path_provider: ThemePathProvider,
+                 file_system: FileSystem | None = None):
         """
         :param theme_type: type of the theme (e.g., gnome-shell, gtk)
         :param source_folder: folder containing the theme files (e.g. temp folder)
         :param destination_folder: folder where the theme will be installed
+        :param file_system: file system where the source folder is stored (disk by default)
         """
         self.theme_type = theme_type
         self.source_folder = source_folder
@@ -25,31 +35,66 @@ class ThemeInstaller:
         self.logger_factory = logger_factory
         self.color_applier = color_applier
         self.path_provider = path_provider
+        self.file_system = file_system or LocalFileSystem()
+
+        self._template: ThemeTemplate | None = None
+        self._template_signature = None
+        self._template_lock = threading.Lock()
 
-    def install(self, theme_color: InstallationColor, name: str, custom_destination: str = None):
+    def install(self, theme_color: InstallationColor, name: str, custom_destination: str = None) -> RenderStats:
         """
-        Install theme and generate theme with specified accent color
+        Install theme and generate theme with specified accent color.
+        Only files which differ from the already installed ones are written.
         :param theme_color: object containing color and modes
         :param name: theme name
         :param custom_destination: optional custom destination folder
+        :return: number of written and skipped files
         """
         logger = InstallationLogger(name, theme_color.modes, self.logger_factory)
 
         try:
-            self._perform_installation(theme_color, name, custom_destination=custom_destination)
-            logger.success()
+            stats = self._perform_installation(theme_color, name, custom_destination=custom_destination)
+            logger.success(stats)
+            return stats
         except Exception as err:
             logger.error(str(err))
             raise
 
-    def _perform_installation(self, theme_color, name, custom_destination=None):
+    def _perform_installation(self, theme_color, name, custom_destination=None) -> RenderStats:
+        template = self._get_template()
+        stats = RenderStats()
+
         for mode in theme_color.modes:
             destination = (custom_destination or
                     self.path_provider.get_theme_path(
                         self.destination_folder, name, mode, self.theme_type))
 
-            copy_files(self.source_folder, destination)
-            self.color_applier.apply(theme_color, destination, mode)
+            stats += self.color_applier.render(template, theme_color, destination, mode)
+
+        return stats
+
+    def compile_template(self) -> ThemeTemplate:
+        """
+        Compile the source folder into a template ahead of installation.
+        Useful before forking worker processes, so they share the compiled template.
+        """
+        return self._get_template()
+
+    def _get_template(self) -> ThemeTemplate:
+        """Compile the source folder once and reuse it while its files stay the same"""
+        with self._template_lock:
+            signature = self._get_source_signature()
+            if self._template is None or signature != self._template_signature:
+                self._template = ThemeTemplate.compile(self.source_folder, self.color_applier.keywords,
+                                                       self.file_system)
+                self._template_signature = signature
+            return self._template
+
+    def _get_source_signature(self) -> tuple:
+        return tuple(sorted(
+            (relative_path, self.file_system.stat(os.path.join(self.source_folder, relative_path)))
+            for relative_path in self.file_system.walk_files(self.source_folder)
+        ))
 
 
 class InstallationLogger:
@@ -68,8 +113,12 @@ class InstallationLogger:
         self.formatted_modes = Console.format(joint_modes, color=Color.GRAY)
         self.logger.update(f"Creating {self.formatted_name} {self.formatted_modes} theme...")
 
-    def success(self):
-        self.logger.success(f"{self.formatted_name} {self.formatted_modes} theme created successfully.")
+    def success(self, stats: RenderStats | None = None):
+        message = f"{self.formatted_name} {self.formatted_modes} theme created successfully."
+        if stats is not None and stats.skipped:
+            files = Console.format(f"({stats.written} files written, {stats.skipped} unchanged)", color=Color.GRAY)
+            message = f"{message[:-1]} {files}"
+        self.logger.success(message)
 
     def error(self, error_message: str):
         self.logger.error(f"Error installing {self.formatted_name} theme: {error_message}")
\ No newline at end of file
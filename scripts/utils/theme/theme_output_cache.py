@@ -0,0 +1,125 @@
+import hashlib
+import json
+import os
+import shutil
+import uuid
+
+from scripts.utils.theme.theme_template import RenderStats
+from scripts.utils.write_if_changed import copy_file_if_changed
+
+
+class ThemeOutputCache:
+    """
+    Persistent cache of rendered theme variants.
+
+    Every entry is a copy of one installed theme folder, stored under a key
+    which is a hash of everything that affects the rendered files.
+    Entries are evicted from the least recently used once the cache exceeds its size limit.
+
+    Example:
+        cache = ThemeOutputCache("~/.cache/marble/themes", max_size=128 * 1024 * 1024)
+        key = ThemeOutputCache.get_key(build_digest, hue, sat, mode)
+        if not cache.restore(key, destination):
+            render(destination)
+            cache.store(key, destination)
+    """
+
+    def __init__(self, cache_folder: str, max_size: int):
+        """
+        :param cache_folder: folder where cached variants are stored
+        :param max_size: maximum total size of cached files in bytes
+        """
+        self.cache_folder = os.path.expanduser(cache_folder)
+        self.max_size = max_size
+
+    @staticmethod
+    def get_key(*parts) -> str:
+        """
+        Generate cache key from JSON-serializable parts
+        :param parts: values which affect the rendered theme
+        """
+        serialized = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def contains(self, key: str) -> bool:
+        return os.path.isdir(self._get_entry_path(key))
+
+    def restore(self, key: str, destination: str) -> RenderStats | None:
+        """
+        Copy cached variant to the destination folder.
+        Files which are already up to date are not rewritten
+        and existing folders are left untouched, so file watchers are not triggered.
+        :return: number of written and skipped files or None if the variant is not cached
+        """
+        entry = self._get_entry_path(key)
+        if not os.path.isdir(entry):
+            return None
+
+        stats = RenderStats()
+        destination = os.path.expanduser(destination)
+        for root, _, files in os.walk(entry):
+            target_root = os.path.join(destination, os.path.relpath(root, entry))
+            os.makedirs(target_root, exist_ok=True)
+            for file in files:
+                if copy_file_if_changed(os.path.join(root, file), os.path.join(target_root, file)):
+                    stats += RenderStats(written=1)
+                else:
+                    stats += RenderStats(skipped=1)
+
+        os.utime(entry)
+        return stats
+
+    def store(self, key: str, source: str):
+        """
+        Copy rendered variant to the cache and evict the least recently used entries.
+        The entry is copied under a unique name first, so readers never see a partially written entry.
+        :param key: cache key of the variant
+        :param source: folder with the rendered variant
+        """
+        entry = self._get_entry_path(key)
+        if os.path.isdir(entry):
+            os.utime(entry)
+            return
+
+        os.makedirs(self.cache_folder, exist_ok=True)
+        temp_entry = os.path.join(self.cache_folder, f".{key}.{uuid.uuid4().hex}")
+        try:
+            shutil.copytree(os.path.expanduser(source), temp_entry)
+            os.rename(temp_entry, entry)
+        except OSError:
+            # entry was stored concurrently or copying failed, caching is optional anyway
+            shutil.rmtree(temp_entry, ignore_errors=True)
+            return
+
+        self._evict()
+
+    def clear(self):
+        shutil.rmtree(self.cache_folder, ignore_errors=True)
+
+    def _get_entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_folder, key)
+
+    def _evict(self):
+        entries = []
+        for name in os.listdir(self.cache_folder):
+            path = os.path.join(self.cache_folder, name)
+            if name.startswith(".") or not os.path.isdir(path):
+                continue
+            try:
+                entries.append((os.stat(path).st_mtime, self._get_folder_size(path), path))
+            except OSError:
+                continue
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total_size -= size
+
+    @staticmethod
+    def _get_folder_size(path: str) -> int:
+        size = 0
+        for root, _, files in os.walk(path):
+            size += sum(os.path.getsize(os.path.join(root, file)) for file in files)
+        return size
@@ -25,6 +25,10 @@ class ThemePreparation:
     def combined_styles_location(self):
         return self.style_manager.output_file
 
+    @property
+    def file_system(self):
+        return self.file_manager.file_system
+
     def __add__(self, content: str) -> "ThemePreparation":
         """Append additional styles to the main styles file."""
         self.style_manager.append_content(content)
@@ -40,6 +44,14 @@ class ThemePreparation:
         self.style_manager.prepend_content(content)
         return self
 
+    def replace_keywords(self, *args: tuple[str, str]) -> "ThemePreparation":
+        """
+        Replace keywords in the main styles file.
+        :param args: (keyword, replacement), (...), ...
+        """
+        self.style_manager.replace_keywords(*args)
+        return self
+
     def add_from_file(self, content) -> "ThemePreparation":
         """
         Adds content from a file to the main styles file.
@@ -57,16 +69,31 @@ class ThemePreparation:
         self.style_manager.generate_combined_styles(self.sources_location, self.temp_folder)
         self.file_manager.cleanup()
 
+    def prepare_from(self, prepared: "ThemePreparation"):
+        """
+        Copy already prepared theme instead of preparing it from the source folder again.
+        Combined styles of the prepared theme are copied as combined styles of this theme.
+        :param prepared: preparation which was already prepared
+        """
+        for relative_path in prepared.file_system.walk_files(prepared.temp_folder):
+            source = os.path.join(prepared.temp_folder, relative_path)
+            destination = os.path.join(self.temp_folder, relative_path)
+            if source == prepared.combined_styles_location:
+                destination = self.combined_styles_location
+
+            self.file_system.write_bytes(destination, prepared.file_system.read_bytes(source))
+
     def replace_filled_keywords(self):
         """
         Replace keywords in the theme files for filled mode.
         This method is deprecated and will be removed in future versions.
         """
-        for apply_file in os.listdir(f"{self.temp_folder}/"):
+        for apply_file in self.file_system.listdir(f"{self.temp_folder}/"):
             replace_keywords(f"{self.temp_folder}/{apply_file}",
                              ("BUTTON-COLOR", "ACCENT-FILLED-COLOR"),
                              ("BUTTON_HOVER", "ACCENT-FILLED_HOVER"),
                              ("BUTTON_ACTIVE", "ACCENT-FILLED_ACTIVE"),
                              ("BUTTON_INSENSITIVE", "ACCENT-FILLED_INSENSITIVE"),
                              ("BUTTON-TEXT-COLOR", "TEXT-BLACK-COLOR"),
-                             ("BUTTON-TEXT_SECONDARY", "TEXT-BLACK_SECONDARY"))
+                             ("BUTTON-TEXT_SECONDARY", "TEXT-BLACK_SECONDARY"),
+                             file_system=self.file_system)
@@ -1,14 +1,21 @@
 import os
-import shutil
+
+from scripts.utils.file_system.file_system import FileSystem
+from scripts.utils.file_system.local_file_system import LocalFileSystem
 
 
 class ThemeTempManager:
     """
     Manages operations with temp folder for Theme class
     """
-    def __init__(self, temp_folder: str):
+    def __init__(self, temp_folder: str, file_system: FileSystem | None = None):
+        """
+        :param temp_folder: path to the temporary folder
+        :param file_system: file system where the temporary folder is stored (disk by default)
+        """
         self.temp_folder = temp_folder
-        os.makedirs(self.temp_folder, exist_ok=True)
+        self.file_system = file_system or LocalFileSystem()
+        self.file_system.makedirs(self.temp_folder)
 
     def copy_to_temp(self, content: str):
         """
@@ -18,12 +25,12 @@ class ThemeTempManager:
         """
         if os.path.isfile(content):
             final_path = os.path.join(self.temp_folder, os.path.basename(content))
-            shutil.copy(content, final_path)
+            self.file_system.copy_from_disk(content, final_path)
         else:
-            shutil.copytree(content, self.temp_folder, dirs_exist_ok=True)
+            self.file_system.copy_from_disk(content, self.temp_folder)
         return self
 
     def cleanup(self):
         """Remove temporary folders"""
-        shutil.rmtree(f"{self.temp_folder}/.css/", ignore_errors=True)
-        shutil.rmtree(f"{self.temp_folder}/.versions/", ignore_errors=True)
\ No newline at end of file
+        self.file_system.remove_tree(f"{self.temp_folder}/.css/")
+        self.file_system.remove_tree(f"{self.temp_folder}/.versions/")
@@ -0,0 +1,106 @@
+import os
+from dataclasses import dataclass
+from typing import Iterable
+
+from scripts.utils.file_system.file_system import FileSystem
+from scripts.utils.file_system.local_file_system import LocalFileSystem
+from scripts.utils.keywords_replacer import KeywordsReplacer, compile_keywords_pattern
+from scripts.utils.write_if_changed import write_if_changed
+
+
+@dataclass(frozen=True)
+class RenderStats:
+    """Number of rendered files which were written or skipped because they were already up to date"""
+    written: int = 0
+    skipped: int = 0
+
+    def __add__(self, other: "RenderStats") -> "RenderStats":
+        return RenderStats(self.written + other.written, self.skipped + other.skipped)
+
+
+@dataclass(frozen=True)
+class TemplateFile:
+    """
+    Single file of the compiled theme.
+
+    Text files are stored as parts, where even indexes are literal segments
+    and odd indexes are keyword slots. Other files are stored as raw content.
+    """
+    relative_path: str
+    parts: tuple[str, ...] | None = None
+    content: bytes | None = None
+
+    @property
+    def is_text(self) -> bool:
+        return self.parts is not None
+
+    def render(self, replacements: dict[str, str]) -> bytes:
+        """Fill keyword slots with replacements and return the file content"""
+        if not self.is_text:
+            return self.content
+
+        segments = list(self.parts)
+        for i in range(1, len(segments), 2):
+            keyword = segments[i]
+            segments[i] = replacements.get(keyword, keyword)
+        return "".join(segments).encode("utf-8")
+
+
+class ThemeTemplate:
+    """
+    Prepared theme compiled once and rendered for every color.
+
+    Rendering only fills keyword slots and writes the result straight
+    to the destination, so source files are not copied and rescanned for each variant.
+
+    Example:
+        template = ThemeTemplate.compile("/tmp/marble/gnome-shell", ["ACCENT-COLOR"])
+        template.render("~/.themes/Marble-red-dark/gnome-shell", {"ACCENT-COLOR": "rgba(...)"})
+    """
+
+    def __init__(self, files: list[TemplateFile]):
+        self.files = files
+
+    @classmethod
+    def compile(cls, source_folder: str, keywords: Iterable[str],
+                file_system: FileSystem | None = None) -> "ThemeTemplate":
+        """
+        Read all files from the source folder and split text files by keywords.
+        :param source_folder: folder with the prepared theme
+        :param keywords: keywords that will be replaced during rendering
+        :param file_system: file system where the source folder is stored (disk by default)
+        """
+        file_system = file_system or LocalFileSystem()
+        pattern = compile_keywords_pattern(keywords)
+        files = []
+
+        for relative_path in sorted(file_system.walk_files(source_folder)):
+            file_path = os.path.join(source_folder, relative_path)
+
+            if relative_path.lower().endswith(KeywordsReplacer.supported_extensions):
+                content = file_system.read_text(file_path)
+                parts = pattern.split(content) if pattern else [content]
+                files.append(TemplateFile(relative_path, parts=tuple(parts)))
+            else:
+                files.append(TemplateFile(relative_path, content=file_system.read_bytes(file_path)))
+
+        return cls(files)
+
+    def render(self, destination: str, replacements: dict[str, str]) -> RenderStats:
+        """
+        Render all files with replacements into the destination folder.
+        Files which already have the rendered content are not rewritten, so their mtimes stay the same.
+        :param destination: folder where rendered files will be written
+        :param replacements: keyword -> replacement
+        """
+        destination = os.path.expanduser(destination)
+        written = 0
+
+        for template_file in self.files:
+            file_path = os.path.join(destination, template_file.relative_path)
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+            if write_if_changed(file_path, template_file.render(replacements)):
+                written += 1
+
+        return RenderStats(written, len(self.files) - written)
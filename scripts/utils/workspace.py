@@ -0,0 +1,40 @@
+import shutil
+import tempfile
+from tempfile import gettempdir
+
+from scripts import config
+
+
+class Workspace:
+    """
+    Unique temporary folder of a single run.
+
+    The folder is created with owner-only permissions and set as config.temp_folder
+    while the workspace is active, so concurrent runs never share temporary files.
+    Only this folder is removed on exit.
+
+    Example:
+        with Workspace() as temp_folder:
+            main()
+    """
+
+    def __init__(self, base_folder: str | None = None, prefix: str = "marble-"):
+        """
+        :param base_folder: folder where the workspace is created (system temp folder by default)
+        :param prefix: prefix of the workspace folder name
+        """
+        self.base_folder = base_folder or gettempdir()
+        self.prefix = prefix
+        self.path: str | None = None
+        self._previous_temp_folder: str | None = None
+
+    def __enter__(self) -> str:
+        self.path = tempfile.mkdtemp(prefix=self.prefix, dir=self.base_folder)
+        self._previous_temp_folder = config.temp_folder
+        config.temp_folder = self.path
+        return self.path
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        config.temp_folder = self._previous_temp_folder
+        shutil.rmtree(self.path, ignore_errors=True)
+        self.path = None
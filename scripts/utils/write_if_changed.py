@@ -0,0 +1,59 @@
+import os
+import shutil
+
+
+def write_if_changed(file: str, content: bytes) -> bool:
+    """
+    Write content to the file only if it differs from the existing one.
+    Sizes are compared first, so most changed files are detected without reading them.
+    :param file: path to the file
+    :param content: new file content
+    :return: True if the file was written
+    """
+    if _has_content(file, content):
+        return False
+
+    with open(file, "wb") as f:
+        f.write(content)
+    return True
+
+
+def copy_if_changed(source: str, destination: str) -> str:
+    """
+    Copy the file only if the destination content differs.
+    Can be used as copy_function for shutil.copytree.
+    :return: destination path
+    """
+    copy_file_if_changed(source, destination)
+    return destination
+
+
+def copy_file_if_changed(source: str, destination: str) -> bool:
+    """
+    Copy the file only if the destination content differs.
+    :return: True if the file was copied
+    """
+    try:
+        same_size = os.path.getsize(source) == os.path.getsize(destination)
+    except OSError:
+        same_size = False
+
+    if same_size and _files_equal(source, destination):
+        return False
+    shutil.copy2(source, destination)
+    return True
+
+
+def _has_content(file: str, content: bytes) -> bool:
+    try:
+        if os.path.getsize(file) != len(content):
+            return False
+        with open(file, "rb") as f:
+            return f.read() == content
+    except OSError:
+        return False
+
+
+def _files_equal(first: str, second: str) -> bool:
+    with open(first, "rb") as f:
+        return _has_content(second, f.read())
@@ -0,0 +1,51 @@
+import contextlib
+import io
+import unittest
+
+from scripts.install.arguments_definer import ArgumentsDefiner
+
+COLORS = {"red": {"h": 0}, "blue": {"h": 240}}
+
+
+class ArgumentsDefinerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.definer = ArgumentsDefiner(COLORS)
+
+    def _assert_parse_error(self, args: list[str]):
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            self.definer.parse(args)
+
+    def test_gdm_output_is_required_for_several_colors(self):
+        self._assert_parse_error(["--gdm", "--all"])
+        self._assert_parse_error(["--gdm", "--red", "--blue"])
+
+    def test_gdm_output_is_not_required_for_single_color_or_removal(self):
+        self.assertTrue(self.definer.parse(["--gdm", "--red"]).red)
+        self.assertTrue(self.definer.parse(["--gdm", "--all", "--remove"]).remove)
+        self.assertTrue(self.definer.parse(["--all"]).all)
+
+    def test_gdm_output_is_accepted_for_several_colors(self):
+        args = self.definer.parse(["--gdm", "--all", "--gdm-output", "/tmp/marble-gdm"])
+
+        self.assertEqual("/tmp/marble-gdm", args.gdm_output)
+
+    def test_processes_must_be_positive(self):
+        self._assert_parse_error(["--all", "--processes", "0"])
+        self._assert_parse_error(["--all", "--processes", "-1"])
+        self._assert_parse_error(["--all", "--processes", "many"])
+
+        self.assertEqual(2, self.definer.parse(["--all", "--processes", "2"]).processes)
+        self.assertGreaterEqual(self.definer.parse(["--all", "--processes"]).processes, 1)
+
+    def test_gdm_activate_must_be_one_of_selected_colors(self):
+        definer = ArgumentsDefiner({**COLORS, "green": {"h": 120}})
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            definer.parse(["--gdm", "--red", "--blue", "--gdm-output", "/tmp/marble-gdm", "--gdm-activate", "green"])
+
+        args = self.definer.parse(["--gdm", "--all", "--gdm-output", "/tmp/marble-gdm", "--gdm-activate", "blue"])
+        self.assertEqual("blue", args.gdm_activate)
+
+    def test_gdm_activate_requires_gdm_and_several_colors(self):
+        self._assert_parse_error(["--all", "--gdm-activate", "blue"])
+        self._assert_parse_error(["--gdm", "--blue", "--gdm-activate", "blue"])
+        self._assert_parse_error(["--gdm", "--hue", "100", "--gdm-activate", "blue"])
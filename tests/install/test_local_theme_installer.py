@@ -0,0 +1,61 @@
+import argparse
+import multiprocessing
+import os
+import shutil
+import unittest
+
+from scripts import config
+from scripts.install.local_theme_installer import LocalThemeInstaller
+from scripts.utils.theme.theme_template import RenderStats
+from .._helpers import create_dummy_file
+
+
+class DummyTheme:
+    """Theme which renders a file with the color and the pid of the rendering process"""
+    modes = ["dark"]
+
+    def __init__(self, destination_folder: str):
+        self.destination_folder = destination_folder
+        self.compiled = False
+
+    def compile(self):
+        self.compiled = True
+
+    def install(self, hue: int, name: str, sat: int | None = None) -> RenderStats:
+        create_dummy_file(os.path.join(self.destination_folder, f"{name}.css"), f"{hue} {sat} {os.getpid()}")
+        return RenderStats(written=1)
+
+
+@unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "fork is not supported")
+class LocalThemeInstallerProcessesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.destination_folder = os.path.join(config.temp_tests_folder, "local_theme_installer")
+        self.theme = DummyTheme(self.destination_folder)
+
+        # theme sources are not needed to render in processes
+        self.installer = LocalThemeInstaller.__new__(LocalThemeInstaller)
+        self.installer.args = argparse.Namespace(processes=2)
+        self.installer.theme = self.theme
+
+    def tearDown(self):
+        shutil.rmtree(self.destination_folder, ignore_errors=True)
+
+    def _read(self, name: str) -> list[str]:
+        with open(os.path.join(self.destination_folder, name)) as file:
+            return file.read().split()
+
+    def test_colors_are_rendered_in_forked_processes(self):
+        self.installer._run_concurrent_installation([(0, "red", None), (240, "blue", 50)])
+
+        red_hue, red_sat, red_pid = self._read("red.css")
+        blue_hue, blue_sat, blue_pid = self._read("blue.css")
+        self.assertEqual(("0", "None"), (red_hue, red_sat))
+        self.assertEqual(("240", "50"), (blue_hue, blue_sat))
+        self.assertNotIn(str(os.getpid()), (red_pid, blue_pid))
+        self.assertTrue(self.theme.compiled)
+
+    def test_error_of_failed_color_is_raised(self):
+        self.theme.install = lambda hue, name, sat=None: 1 / 0
+
+        with self.assertRaises(ZeroDivisionError):
+            self.installer._run_concurrent_installation([(0, "red", None), (240, "blue", None)])
@@ -0,0 +1,60 @@
+import unittest
+
+from scripts.types.palette import Palette, ColorDefinition
+
+
+class PaletteTestCase(unittest.TestCase):
+    def setUp(self):
+        self.replacers = {
+            "BUTTON-COLOR": {"_comment": "Buttons", "default": "ACCENT-COLOR"},
+            "ACCENT-COLOR": {
+                "light": {"s": 52, "l": 67, "a": 1},
+                "dark": {"s": 42, "l": 26, "a": 0.5},
+            },
+        }
+
+    def test_from_replacers_keeps_elements_order(self):
+        palette = Palette.from_replacers(self.replacers)
+
+        self.assertEqual(("BUTTON-COLOR", "ACCENT-COLOR"), palette.elements)
+
+    def test_from_replacers_resolves_default_aliases(self):
+        palette = Palette.from_replacers(self.replacers)
+
+        dark = palette.get_definitions("dark")
+        self.assertEqual(ColorDefinition(saturation=0.42, lightness=0.26, alpha=0.5), dark[0])
+        self.assertEqual(dark[1], dark[0])
+
+    def test_get_definitions_with_unknown_mode_raises_key_error(self):
+        palette = Palette.from_replacers(self.replacers)
+
+        with self.assertRaises(KeyError):
+            palette.get_definitions("not_existent_mode")
+
+    def test_mode_not_defined_for_every_element_is_not_available(self):
+        self.replacers["ACCENT_HOVER"] = {"light": {"s": 50, "l": 60, "a": 1}}
+
+        palette = Palette.from_replacers(self.replacers)
+
+        palette.get_definitions("light")
+        with self.assertRaises(KeyError):
+            palette.get_definitions("dark")
+
+    def test_palette_is_immutable(self):
+        palette = Palette.from_replacers(self.replacers)
+
+        with self.assertRaises(AttributeError):
+            # noinspection PyDataclass
+            palette.elements = ()
+        with self.assertRaises(TypeError):
+            # noinspection PyUnresolvedReferences
+            palette.definitions["dark"] = ()
+
+    def test_equal_definitions_have_equal_keys(self):
+        palette = Palette.from_replacers(self.replacers)
+        same_palette = Palette.from_replacers(dict(self.replacers))
+        self.replacers["ACCENT-COLOR"]["dark"]["l"] = 30
+        other_palette = Palette.from_replacers(self.replacers)
+
+        self.assertEqual(palette.key, same_palette.key)
+        self.assertNotEqual(palette.key, other_palette.key)
@@ -1,6 +1,7 @@
 import unittest
+from unittest.mock import patch
 
-from scripts.utils.color_converter.color_converter_impl import ColorConverterImpl
+from scripts.utils.color_converter.color_converter_impl import ColorConverterImpl, numpy
 
 
 class ColorConverterImplTestCase(unittest.TestCase):
@@ -61,4 +62,36 @@ class ColorConverterImplTestCase(unittest.TestCase):
         lightness = -2
 
         with self.assertRaises(ValueError):
-            self.converter.hsl_to_rgb(hue, saturation, lightness)
\ No newline at end of file
+            self.converter.hsl_to_rgb(hue, saturation, lightness)
+
+    def test_hsl_to_rgb_many_matches_hsl_to_rgb(self):
+        colors = [(hue, saturation / 10, lightness / 10)
+                  for hue in range(0, 361, 45)
+                  for saturation in range(0, 11, 5)
+                  for lightness in range(0, 11, 5)]
+
+        result = self.converter.hsl_to_rgb_many(colors)
+
+        self.assertEqual([self.converter.hsl_to_rgb(*color) for color in colors], result)
+
+    def test_hsl_to_rgb_many_is_invalid(self):
+        with self.assertRaises(ValueError):
+            self.converter.hsl_to_rgb_many([(0, 0.5, 0.5), (400, 0.5, 0.5)])
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_hsl_to_rgb_many_with_numpy_matches_hsl_to_rgb(self):
+        colors = [(hue, saturation / 20, lightness / 20)
+                  for hue in range(0, 361, 5)
+                  for saturation in range(0, 21)
+                  for lightness in range(0, 21)]
+
+        with patch.object(ColorConverterImpl, "numpy_threshold", 0):
+            result = self.converter.hsl_to_rgb_many(colors)
+
+        self.assertEqual([self.converter.hsl_to_rgb(*color) for color in colors], result)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_hsl_to_rgb_many_with_numpy_is_invalid(self):
+        with patch.object(ColorConverterImpl, "numpy_threshold", 0):
+            with self.assertRaises(ValueError):
+                self.converter.hsl_to_rgb_many([(0, 0.5, 0.5), (0, 0.5, -1)])
@@ -0,0 +1,112 @@
+import os
+import shutil
+import unittest
+
+from scripts import config
+from scripts.utils.file_system.memory_file_system import MemoryFileSystem
+from ..._helpers import create_dummy_file
+
+
+class MemoryFileSystemTestCase(unittest.TestCase):
+    def setUp(self):
+        self.file_system = MemoryFileSystem()
+        self.folder = "/marble/theme"
+        self.disk_folder = os.path.join(config.temp_tests_folder, "memory_file_system")
+
+    def tearDown(self):
+        shutil.rmtree(self.disk_folder, ignore_errors=True)
+
+    def test_write_and_read_text(self):
+        file = os.path.join(self.folder, "styles.css")
+
+        self.file_system.write_text(file, "a { color: red; }")
+
+        self.assertEqual("a { color: red; }", self.file_system.read_text(file))
+        self.assertTrue(self.file_system.is_file(file))
+        self.assertTrue(self.file_system.exists(self.folder))
+
+    def test_write_does_not_touch_disk(self):
+        file = os.path.join(self.disk_folder, "styles.css")
+
+        self.file_system.write_text(file, "content")
+
+        self.assertFalse(os.path.exists(file))
+
+    def test_read_not_existing_file_raises_error(self):
+        with self.assertRaises(FileNotFoundError):
+            self.file_system.read_text("/marble/missing.css")
+
+    def test_append_text(self):
+        file = os.path.join(self.folder, "styles.css")
+        self.file_system.write_text(file, "first")
+
+        self.file_system.append_text(file, "\nsecond")
+
+        self.assertEqual("first\nsecond", self.file_system.read_text(file))
+
+    def test_append_to_not_existing_file_raises_error(self):
+        with self.assertRaises(FileNotFoundError):
+            self.file_system.append_text("/marble/missing.css", "content")
+
+    def test_listdir_returns_direct_children(self):
+        self.file_system.write_text(os.path.join(self.folder, "styles.css"), "")
+        self.file_system.write_text(os.path.join(self.folder, ".css", "part.css"), "")
+
+        self.assertCountEqual(["styles.css", ".css"], self.file_system.listdir(self.folder))
+
+    def test_walk_files_returns_relative_paths(self):
+        self.file_system.write_text(os.path.join(self.folder, "styles.css"), "")
+        self.file_system.write_text(os.path.join(self.folder, "icons", "icon.svg"), "")
+
+        self.assertCountEqual(["styles.css", os.path.join("icons", "icon.svg")],
+                              self.file_system.walk_files(self.folder))
+
+    def test_stat_changes_after_write(self):
+        file = os.path.join(self.folder, "styles.css")
+        self.file_system.write_text(file, "abc")
+        first_stat = self.file_system.stat(file)
+
+        self.file_system.write_text(file, "abc")
+
+        self.assertEqual(3, first_stat[0])
+        self.assertNotEqual(first_stat, self.file_system.stat(file))
+
+    def test_rename_moves_file(self):
+        source = os.path.join(self.folder, "icon.svg")
+        destination = os.path.join(self.folder, "icon-dark.svg")
+        self.file_system.write_text(source, "svg")
+
+        self.file_system.rename(source, destination)
+
+        self.assertFalse(self.file_system.exists(source))
+        self.assertEqual("svg", self.file_system.read_text(destination))
+
+    def test_remove_tree_removes_folder_with_content(self):
+        self.file_system.write_text(os.path.join(self.folder, ".css", "part.css"), "")
+        self.file_system.write_text(os.path.join(self.folder, "styles.css"), "")
+
+        self.file_system.remove_tree(os.path.join(self.folder, ".css"))
+
+        self.assertEqual(["styles.css"], self.file_system.listdir(self.folder))
+
+    def test_copy_from_disk_merges_folder(self):
+        create_dummy_file(os.path.join(self.disk_folder, "icon.svg"), "svg")
+        create_dummy_file(os.path.join(self.disk_folder, ".css", "part.css"), "css")
+
+        self.file_system.copy_from_disk(self.disk_folder, self.folder)
+
+        self.assertEqual("svg", self.file_system.read_text(os.path.join(self.folder, "icon.svg")))
+        self.assertEqual("css", self.file_system.read_text(os.path.join(self.folder, ".css", "part.css")))
+
+    def test_copy_from_disk_copies_file(self):
+        source = os.path.join(self.disk_folder, "icon.svg")
+        create_dummy_file(source, "svg")
+        destination = os.path.join(self.folder, "icon.svg")
+
+        self.file_system.copy_from_disk(source, destination)
+
+        self.assertEqual("svg", self.file_system.read_text(destination))
+
+    def test_copy_from_disk_not_existing_source_raises_error(self):
+        with self.assertRaises(FileNotFoundError):
+            self.file_system.copy_from_disk(os.path.join(self.disk_folder, "missing"), self.folder)
@@ -66,6 +66,49 @@ class GDMTestCase(TestCase):
 
         self.installer.install.assert_called_once()
 
+    def test_is_up_to_date_requires_installed_theme(self):
+        self.installer.is_installed.return_value = False
+        self.installer.is_up_to_date.return_value = True
+
+        self.assertFalse(self.gdm.is_up_to_date("abc"))
+
+    def test_is_up_to_date_checks_build_id_of_installed_theme(self):
+        self.installer.is_installed.return_value = True
+        self.installer.is_up_to_date.return_value = True
+
+        self.assertTrue(self.gdm.is_up_to_date("abc"))
+        self.installer.is_up_to_date.assert_called_once_with("abc")
+
+    def test_with_build_id_passes_build_id_to_installer(self):
+        self.gdm.with_build_id("abc")
+
+        self.assertEqual("abc", self.installer.build_id)
+
+    def test_install_batch_compiles_colors_without_installing(self):
+        colors = [(0, "red", None), (240, "blue", None)]
+        self.installer.compile_batch.return_value = {"red": "red.gresource", "blue": "blue.gresource"}
+
+        result = self.gdm.install_batch(colors, "output")
+
+        self.installer.compile_batch.assert_called_once_with(self.gdm.themes, colors, "output")
+        self.installer.install.assert_not_called()
+        self.assertEqual({"red": "red.gresource", "blue": "blue.gresource"}, result)
+
+    def test_install_batch_installs_active_color(self):
+        self.installer.is_installed.return_value = False
+        self.installer.compile_batch.return_value = {"red": "red.gresource", "blue": "blue.gresource"}
+
+        self.gdm.install_batch([(0, "red", None), (240, "blue", None)], "output", active_color="blue")
+
+        self.installer.backup.assert_called_once()
+        self.installer.install.assert_called_once_with("blue.gresource")
+
+    def test_install_batch_raises_error_for_unknown_active_color(self):
+        with self.assertRaises(ValueError):
+            self.gdm.install_batch([(0, "red", None)], "output", active_color="blue")
+
+        self.installer.compile_batch.assert_not_called()
+
     def test_remove_calls_installer_remove_if_installed(self):
         self.installer.is_installed.return_value = True
 
@@ -56,6 +56,23 @@ class GDMBuilderTestCase(TestCase):
         builder = self.builder.with_remover(remover)
         self.assertEqual(builder._remover, remover)
 
+    def test_with_stock_cache_sets_specified_cache(self):
+        stock_cache = Mock()
+        builder = self.builder.with_stock_cache(stock_cache)
+        self.assertEqual(builder._stock_cache, stock_cache)
+
+    def test_resolve_stock_cache_initializes_cache(self):
+        self.builder._resolve_stock_cache()
+
+        self.assertIsNotNone(self.builder._stock_cache)
+
+    def test_resolve_stock_cache_keeps_disabled_cache(self):
+        self.builder.with_stock_cache(None)
+
+        self.builder._resolve_stock_cache()
+
+        self.assertIsNone(self.builder._stock_cache)
+
     def test_resolve_logger_factory_initializes_logger_factory(self):
         self.builder._logger_factory = None
 
@@ -71,6 +88,27 @@ class GDMBuilderTestCase(TestCase):
 
         self.assertIsNotNone(self.builder._gresource)
 
+    def test_resolve_gresource_does_not_prune_resources_by_default(self):
+        self.builder._logger_factory = Mock()
+
+        self.builder._resolve_gresource()
+
+        self.assertFalse(self.builder._gresource.prune_unused)
+
+    def test_with_resource_pruning_enables_pruning_of_gresource(self):
+        self.builder._logger_factory = Mock()
+
+        self.builder.with_resource_pruning()._resolve_gresource()
+
+        self.assertTrue(self.builder._gresource.prune_unused)
+
+    def test_with_extract_jobs_sets_extract_jobs_of_gresource(self):
+        self.builder._logger_factory = Mock()
+
+        self.builder.with_extract_jobs(3)._resolve_gresource()
+
+        self.assertEqual(3, self.builder._gresource.extract_jobs)
+
     def test_builder_supports_chaining(self):
         theme = self.builder.with_mode("dark").with_filled(True).build()
 
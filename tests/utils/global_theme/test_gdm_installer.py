@@ -1,9 +1,12 @@
 import os.path
+import shutil
+import threading
 from unittest import TestCase
 from unittest.mock import MagicMock
 
 from scripts import config
 from scripts.utils.global_theme.gdm_installer import GDMThemeInstaller
+from ..._helpers import create_dummy_file
 
 
 class GDMInstallerTestCase(TestCase):
@@ -11,6 +14,7 @@ class GDMInstallerTestCase(TestCase):
         self.temp_folder = os.path.join(config.temp_tests_folder, "gdm_installer")
         self.gresource = MagicMock()
         self.gresource.temp_folder = self.temp_folder
+        self.output_folder = os.path.join(config.temp_tests_folder, "gdm_installer_output")
 
         self.alternatives_updater = MagicMock()
 
@@ -19,6 +23,10 @@ class GDMInstallerTestCase(TestCase):
             alternatives_updater=self.alternatives_updater
         )
 
+    def tearDown(self):
+        shutil.rmtree(self.temp_folder, ignore_errors=True)
+        shutil.rmtree(self.output_folder, ignore_errors=True)
+
     def test_is_installed_return_the_same_value_as_gresource(self):
         self.gresource.has_trigger.return_value = True
 
@@ -45,18 +53,31 @@ class GDMInstallerTestCase(TestCase):
 
         theme_prepare.label_theme.assert_called_once()
 
-    def test_compile_calls_removes_keywords_and_properties_and_prepends_source_styles(self):
+    def test_compile_prepends_source_styles(self):
         theme_prepare = MagicMock()
-        theme_prepare.remove_keywords = MagicMock()
-        theme_prepare.remove_properties = MagicMock()
         theme_prepare.prepend_source_styles = MagicMock()
 
         self.gdm_installer.compile(themes=[theme_prepare], hue=0, color="red", sat=None)
 
-        theme_prepare.remove_keywords.assert_called_once()
-        theme_prepare.remove_properties.assert_called_once()
         theme_prepare.prepend_source_styles.assert_called_once()
 
+    def test_compile_prepends_build_trigger_if_build_id_is_set(self):
+        theme_prepare = MagicMock()
+        self.gdm_installer.build_id = "abc"
+
+        self.gdm_installer.compile(themes=[theme_prepare], hue=0, color="red", sat=None)
+
+        trigger = theme_prepare.prepend_source_styles.call_args[0][0]
+        self.assertEqual("\n/* Marble theme */\n/* Marble build: abc */\n", trigger)
+
+    def test_is_up_to_date_looks_for_build_trigger(self):
+        self.gresource.has_trigger.return_value = True
+
+        result = self.gdm_installer.is_up_to_date("abc")
+
+        self.assertTrue(result)
+        self.gresource.has_trigger.assert_called_once_with("/* Marble build: abc */\n")
+
     def test_compile_installs_themes_with_correct_parameters(self):
         theme_prepare = MagicMock()
         theme_prepare.install = MagicMock()
@@ -68,7 +89,130 @@ class GDMInstallerTestCase(TestCase):
         self.gdm_installer.compile(themes, hue, color, sat)
 
         theme_prepare.install.assert_called_once()
-        theme_prepare.install.assert_called_with(hue, color, sat, destination=self.temp_folder)
+        args, kwargs = theme_prepare.install.call_args
+        self.assertEqual((hue, color, sat), args)
+        self.assertNotEqual(self.temp_folder, kwargs["destination"])
+
+    def test_compile_moves_generated_files_to_gresource_folder(self):
+        themes = [self._mock_theme_prepare({"gnome-shell-dark.css": "dark", "icons/toggle.svg": "<svg/>"}),
+                  self._mock_theme_prepare({"gnome-shell-light.css": "light"})]
+
+        self.gdm_installer.compile(themes, 0, "red")
+
+        self.assertEqual("dark", self._read("gnome-shell-dark.css"))
+        self.assertEqual("<svg/>", self._read("icons/toggle.svg"))
+        self.assertEqual("light", self._read("gnome-shell-light.css"))
+        staging_folders = [name for name in os.listdir(config.temp_tests_folder) if name.startswith(".staging-")]
+        self.assertEqual([], staging_folders)
+
+    def test_compile_keeps_files_of_the_last_theme_if_themes_generate_the_same_file(self):
+        themes = [self._mock_theme_prepare({"gnome-shell-dark.css": str(i)}) for i in range(5)]
+
+        self.gdm_installer.compile(themes, 0, "red")
+
+        self.assertEqual("4", self._read("gnome-shell-dark.css"))
+
+    def test_compile_generates_themes_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+        self.gdm_installer.jobs = 2
+        themes = [MagicMock(), MagicMock()]
+        for theme_prepare in themes:
+            theme_prepare.install.side_effect = lambda *args, **kwargs: barrier.wait()
+
+        self.gdm_installer.compile(themes, 0, "red")
+
+        self.assertFalse(barrier.broken)
+
+    def test_compile_raises_error_of_failed_theme(self):
+        failed_theme = MagicMock()
+        failed_theme.install.side_effect = RuntimeError("failed")
+
+        with self.assertRaises(RuntimeError):
+            self.gdm_installer.compile([MagicMock(), failed_theme], 0, "red")
+
+        self.gresource.compile.assert_not_called()
+
+    def test_compile_batch_compiles_every_color_into_own_file(self):
+        self._mock_gresource_compile()
+        create_dummy_file(os.path.join(self.temp_folder, "stock.svg"), "<svg/>")
+        theme_prepare = MagicMock()
+        theme_prepare.install.side_effect = lambda hue, color, sat, destination: create_dummy_file(
+            os.path.join(destination, "gnome-shell-dark.css"), color)
+        red_file = os.path.join(self.output_folder, "gnome-shell-theme-red.gresource")
+        blue_file = os.path.join(self.output_folder, "gnome-shell-theme-blue.gresource")
+
+        files = self.gdm_installer.compile_batch([theme_prepare], [(0, "red", None), (240, "blue", None)],
+                                                 self.output_folder)
+
+        self.assertEqual({"red": red_file, "blue": blue_file}, files)
+        self.assertEqual("gnome-shell-dark.css:red\nstock.svg:<svg/>", self._read(red_file))
+        self.assertEqual("gnome-shell-dark.css:blue\nstock.svg:<svg/>", self._read(blue_file))
+        self.assertFalse(os.path.exists(os.path.join(self.temp_folder, "gnome-shell-dark.css")))
+        batch_folders = [name for name in os.listdir(config.temp_tests_folder) if name.startswith(".batch-")]
+        self.assertEqual([], batch_folders)
+
+    def test_compile_batch_prepares_sources_once(self):
+        self._mock_gresource_compile()
+        theme_prepare = MagicMock()
+        theme_prepare.label = "dark"
+
+        self.gdm_installer.compile_batch([theme_prepare], [(0, "red", None), (240, "blue", None)],
+                                         self.output_folder)
+
+        theme_prepare.label_theme.assert_called_once()
+        theme_prepare.prepend_source_styles.assert_called_once()
+        self.assertEqual(2, theme_prepare.install.call_count)
+
+    def test_compile_batch_compiles_colors_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+        self.gdm_installer.jobs = 2
+        self._mock_gresource_compile()
+        compile_files = self.gresource.compile.side_effect
+        self.gresource.compile.side_effect = lambda *args: (barrier.wait(), compile_files(*args))
+
+        self.gdm_installer.compile_batch([MagicMock()], [(0, "red", None), (240, "blue", None)],
+                                         self.output_folder)
+
+        self.assertFalse(barrier.broken)
+
+    def test_compile_batch_does_not_leave_partial_file_if_compilation_fails(self):
+        self.gresource.gresource_file = "gnome-shell-theme.gresource"
+        def fail(source_folder, target_file):
+            create_dummy_file(target_file, "partial")
+            raise RuntimeError("failed")
+        self.gresource.compile.side_effect = fail
+
+        with self.assertRaises(RuntimeError):
+            self.gdm_installer.compile_batch([MagicMock()], [(0, "red", None)], self.output_folder)
+
+        self.assertEqual([], os.listdir(self.output_folder))
+
+    def _mock_gresource_compile(self):
+        """Gresource which compiles files of the source folder into a list of their names and content"""
+        def compile_files(source_folder, target_file):
+            lines = []
+            for root, _, files in os.walk(source_folder):
+                for file in files:
+                    with open(os.path.join(root, file)) as f:
+                        lines.append(f"{os.path.relpath(os.path.join(root, file), source_folder)}:{f.read()}")
+            create_dummy_file(target_file, "\n".join(sorted(lines)))
+
+        self.gresource.gresource_file = "gnome-shell-theme.gresource"
+        self.gresource.compile.side_effect = compile_files
+
+    def _mock_theme_prepare(self, files: dict[str, str]) -> MagicMock:
+        """Theme which writes files to the destination on installation"""
+        def install(*args, destination):
+            for name, content in files.items():
+                create_dummy_file(os.path.join(destination, name), content)
+
+        theme_prepare = MagicMock()
+        theme_prepare.install.side_effect = install
+        return theme_prepare
+
+    def _read(self, name: str) -> str:
+        with open(os.path.join(self.temp_folder, name)) as file:
+            return file.read()
 
     def test_compile_calls_gresource_compile(self):
         self.gdm_installer.compile([], 0, "red", None)
@@ -84,4 +228,9 @@ class GDMInstallerTestCase(TestCase):
         self.gdm_installer.install()
 
         self.gresource.move.assert_called_once()
-        self.alternatives_updater.install_and_set.assert_called_once()
\ No newline at end of file
+        self.alternatives_updater.install_and_set.assert_called_once()
+
+    def test_install_moves_given_gresource_file(self):
+        self.gdm_installer.install("gnome-shell-theme-red.gresource")
+
+        self.gresource.move.assert_called_once_with("gnome-shell-theme-red.gresource")
\ No newline at end of file
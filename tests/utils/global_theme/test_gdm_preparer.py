@@ -6,6 +6,8 @@ from unittest.mock import MagicMock, patch
 from scripts import config
 from scripts.types.theme_base import ThemeBase
 from scripts.utils.global_theme.gdm_preparer import GDMThemePreparer
+from scripts.utils.theme.theme_output_cache import ThemeOutputCache
+from ..._helpers import create_dummy_file
 
 
 class DummyTheme(ThemeBase):
@@ -17,6 +19,9 @@ class DummyTheme(ThemeBase):
     def prepare(self):
         pass
 
+    def prepare_from(self, prepared):
+        pass
+
     def install(self, hue: int, name: str, sat: float | None = None):
         pass
 
@@ -32,6 +37,11 @@ class TestGDMThemePreparer(unittest.TestCase):
         self.logger_factory = MagicMock()
         self.logger_factory.create_logger.return_value = self.mock_logger
 
+        # stock styles are mocked by os.listdir, so they can't be cleaned
+        patcher = patch("scripts.utils.global_theme.gdm_preparer.filter_styles")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
         self.preparer = GDMThemePreparer(
             temp_folder=self.temp_folder,
             default_mode="light",
@@ -122,3 +132,60 @@ class TestGDMThemePreparer(unittest.TestCase):
         self.theme_builder.with_theme_name.assert_any_call("gnome-shell-dark")
         self.theme_builder.with_theme_name.assert_any_call("gnome-shell")
 
+    @patch("os.listdir")
+    def test_preparer_prepares_marble_theme_only_once(self, mock_listdir):
+        mock_listdir.return_value = ["gnome-shell-dark.css", "gnome-shell-light.css", "gnome-shell.css"]
+        themes = [MagicMock(), MagicMock(), MagicMock()]
+        self.theme_builder.build.side_effect = themes
+
+        self.preparer.prepare()
+
+        themes[0].prepare.assert_called_once()
+        for theme in themes[1:]:
+            theme.prepare.assert_not_called()
+            theme.prepare_from.assert_called_once_with(themes[0])
+
+    @patch("scripts.utils.global_theme.gdm_preparer.filter_styles")
+    def test_preparer_cleans_only_stock_styles(self, mock_filter_styles):
+        create_dummy_file(os.path.join(self.temp_folder, "gnome-shell.css"))
+        create_dummy_file(os.path.join(self.temp_folder, "other.css"))
+
+        self.preparer.prepare()
+
+        stock_file = os.path.join(self.temp_folder, "gnome-shell.css")
+        mock_filter_styles.assert_called_once_with(stock_file, keywords=GDMThemePreparer.stock_keywords,
+                                                   properties=GDMThemePreparer.stock_properties)
+
+    def test_preparer_restores_cleaned_stock_theme_from_cache(self):
+        self._use_stock_cache()
+
+        self.preparer.prepare()
+        shutil.rmtree(self.temp_folder)
+        themes = self.preparer.prepare()
+
+        self.gresource.extract.assert_called_once()
+        self.assertEqual(1, len(themes))
+        self.assertTrue(os.path.exists(os.path.join(self.temp_folder, "gnome-shell.css")))
+
+    def test_preparer_extracts_again_when_source_gresource_changes(self):
+        source_gresource = self._use_stock_cache()
+
+        self.preparer.prepare()
+        create_dummy_file(source_gresource, "updated stock gresource")
+        self.preparer.prepare()
+
+        self.assertEqual(2, self.gresource.extract.call_count)
+
+    def _use_stock_cache(self) -> str:
+        """Enable stock cache and make extraction create stock styles. Returns path to the source gresource"""
+        stock_cache = ThemeOutputCache(os.path.join(config.temp_tests_folder, "gdm_preparer_cache"), 1024 * 1024)
+        self.addCleanup(stock_cache.clear)
+        source_gresource = os.path.join(config.temp_tests_folder, "gdm_preparer_source.gresource")
+        create_dummy_file(source_gresource, "stock gresource")
+        self.addCleanup(os.remove, source_gresource)
+
+        self.gresource.source_gresource = source_gresource
+        self.gresource.extract.side_effect = lambda: create_dummy_file(
+            os.path.join(self.temp_folder, "gnome-shell.css"), "stage {}")
+        self.preparer.stock_cache = stock_cache
+        return source_gresource
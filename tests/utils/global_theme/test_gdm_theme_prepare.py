@@ -45,45 +45,6 @@ class GDMThemePrepareTestCase(TestCase):
         with self.assertRaises(ValueError):
             self.theme_prepare.label_theme()
 
-    def test_remove_keywords_removes_destination_keywords(self):
-        try_remove_file(self.main_styles_destination)
-        expected_content = "body { background-color: #000; }"
-        create_dummy_file(self.main_styles_destination, "body {keyword1 background-color: #000 !important; }")
-        keywords = ["keyword1", " !important"]
-
-        self.theme_prepare.remove_keywords(*keywords)
-
-        with open(self.main_styles_destination, 'r') as file:
-            content = file.read()
-            self.assertEqual(content, expected_content)
-        try_remove_file(self.main_styles_destination)
-
-    def test_remove_properties_removes_destination_properties(self):
-        try_remove_file(self.main_styles_destination)
-        expected_content = "body {\n}\n"
-        create_dummy_file(self.main_styles_destination, "body {\nbackground-color: #000;\n}")
-        properties = ["background-color"]
-
-        self.theme_prepare.remove_properties(*properties)
-
-        with open(self.main_styles_destination, 'r') as file:
-            actual_content = file.read()
-            self.assertEqual(expected_content, actual_content)
-        try_remove_file(self.main_styles_destination)
-
-    def test_remove_properties_removes_one_line_properties(self):
-        try_remove_file(self.main_styles_destination)
-        expected_content = ""
-        create_dummy_file(self.main_styles_destination, "body { background-color: #000; }")
-        properties = ["background-color"]
-
-        self.theme_prepare.remove_properties(*properties)
-
-        with open(self.main_styles_destination, 'r') as file:
-            actual_content = file.read()
-            self.assertEqual(expected_content, actual_content)
-        try_remove_file(self.main_styles_destination)
-
     def test_prepend_source_styles_prepends_destination_styles(self):
         try_remove_file(self.main_styles_destination)
         expected_content = "body { background-color: #000; }\n"
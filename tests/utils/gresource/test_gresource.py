@@ -5,6 +5,7 @@ from unittest.mock import patch
 
 from scripts import config
 from scripts.utils.gresource.gresource import Gresource
+from scripts.utils.gresource.gresource_pruner import GresourcePruner
 from ..._helpers import create_dummy_file, try_remove_file
 from ..._helpers.dummy_logger_factory import DummyLoggerFactory
 from ..._helpers.dummy_runner import DummyRunner
@@ -62,7 +63,8 @@ class GresourceTestCase(unittest.TestCase):
                 self.gresource._active_source_gresource,
                 self.temp_folder,
                 logger_factory=self.logger,
-                runner=self.runner
+                runner=self.runner,
+                jobs=None
             )
             mock_extractor_instance.extract.assert_called_once()
 
@@ -77,10 +79,19 @@ class GresourceTestCase(unittest.TestCase):
                 self.temp_folder,
                 self.gresource._temp_gresource,
                 logger_factory=self.logger,
-                runner=self.runner
+                runner=self.runner,
+                policy=None,
+                pruner=None
             )
             mock_compiler_instance.compile.assert_called_once()
 
+    def test_compile_with_pruning(self):
+        self.gresource.prune_unused = True
+        with patch('scripts.utils.gresource.gresource.GresourceCompiler') as mock_compiler_class:
+            self.gresource.compile()
+
+            self.assertIsInstance(mock_compiler_class.call_args.kwargs["pruner"], GresourcePruner)
+
     def test_backup(self):
         create_dummy_file(self.destination_file)
 
@@ -1,12 +1,14 @@
 import os
 import shutil
 import unittest
+from unittest.mock import patch
 
 import pytest
 
 from scripts import config
 from scripts.utils.gresource import GresourceBackupNotFoundError
 from scripts.utils.gresource.gresource_backuper import GresourceBackuperManager, GresourceBackuper
+from scripts.utils.gresource.gresource_writer import GresourceWriter
 from ..._helpers import create_dummy_file, try_remove_file
 from ..._helpers.dummy_logger_factory import DummyLoggerFactory
 
@@ -97,4 +99,45 @@ class GresourceBackuperTestCase(unittest.TestCase):
         self.backuper.restore()
 
         assert os.path.exists(self.destination_file)
-        assert not os.path.exists(self.backup_file)
\ No newline at end of file
+        assert not os.path.exists(self.backup_file)
+
+    def test_has_trigger_finds_trigger_in_compressed_theme_styles(self):
+        self._write_gresource(b"stage {}\n/* Marble theme */\n", compressed=True)
+
+        assert self.backuper.has_trigger("\n/* Marble theme */\n")
+
+    def test_has_trigger_ignores_trigger_outside_theme_styles(self):
+        GresourceWriter({
+            "/org/gnome/shell/theme/gnome-shell.css": b"stage {}",
+            "/org/gnome/shell/theme/other.css": b"/* Marble theme */",
+        }).write(self.destination_file)
+
+        assert not self.backuper.has_trigger("/* Marble theme */")
+
+    def test_has_trigger_searches_whole_file_if_it_is_not_gresource(self):
+        self.backuper.chunk_size = 4
+        create_dummy_file(self.destination_file, "some content /* Marble theme */ more content")
+
+        assert self.backuper.has_trigger("/* Marble theme */")
+        assert not self.backuper.has_trigger("/* Other theme */")
+
+    def test_has_trigger_caches_result_while_file_is_unchanged(self):
+        self._write_gresource(b"/* Marble theme */")
+
+        with patch.object(self.backuper, "_find_trigger_in_styles", return_value=True) as mock_find:
+            self.backuper.has_trigger("/* Marble theme */")
+            self.backuper.has_trigger("/* Marble theme */")
+
+            mock_find.assert_called_once()
+
+    def test_has_trigger_checks_file_again_after_it_changes(self):
+        self._write_gresource(b"/* Marble theme */")
+        assert self.backuper.has_trigger("/* Marble theme */")
+
+        self._write_gresource(b"stage {}")
+
+        assert not self.backuper.has_trigger("/* Marble theme */")
+
+    def _write_gresource(self, styles: bytes, compressed: bool = False):
+        resource = "/org/gnome/shell/theme/gnome-shell.css"
+        GresourceWriter({resource: styles}, compressed=[resource] if compressed else []).write(self.destination_file)
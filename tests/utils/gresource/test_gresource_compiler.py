@@ -9,6 +9,10 @@ import pytest
 from scripts import config
 from scripts.utils.gresource import MissingDependencyError
 from scripts.utils.gresource.gresource_compiler import GresourceCompiler
+from scripts.utils.gresource.gresource_policy import GresourcePolicy
+from scripts.utils.gresource.gresource_pruner import GresourcePruner
+from scripts.utils.gresource.gresource_reader import GresourceReader
+from ..._helpers import create_dummy_file
 from ..._helpers.dummy_logger_factory import DummyLoggerFactory
 from ..._helpers.dummy_runner import DummyRunner
 
@@ -30,6 +34,7 @@ class GresourceCompilerTestCase(unittest.TestCase):
 
     def test_compile_calls_correct_methods(self):
         """Test that compile calls the right methods in sequence."""
+        self.compiler.use_cli = True
         with (
             patch.object(self.compiler, '_create_gresource_xml') as mock_create_xml,
             patch.object(self.compiler, '_compile_resources') as mock_compile
@@ -40,6 +45,27 @@ class GresourceCompilerTestCase(unittest.TestCase):
             mock_create_xml.assert_called_once()
             mock_compile.assert_called_once()
 
+    def test_compile_writes_gresource_without_external_tools(self):
+        self.__create_dummy_files_in_temp()
+
+        with patch.object(self.runner, "run") as mock_run:
+            self.compiler.compile()
+
+            mock_run.assert_not_called()
+        with GresourceReader(self.target_file) as reader:
+            self.assertEqual(["/org/gnome/shell/theme/file1.css", "/org/gnome/shell/theme/subdir/file2.css"],
+                             reader.list_resources())
+            self.assertEqual(b"test content", reader.read("/org/gnome/shell/theme/subdir/file2.css"))
+
+    def test_compile_skips_target_file_in_source_folder(self):
+        self.__create_dummy_files_in_temp()
+        self.compiler.compile()
+
+        self.compiler.compile()
+
+        with GresourceReader(self.target_file) as reader:
+            self.assertEqual(2, len(reader.list_resources()))
+
     def test_create_gresource_xml(self):
         """Test that _create_gresource_xml creates the XML file with correct content."""
         with (
@@ -75,8 +101,71 @@ class GresourceCompilerTestCase(unittest.TestCase):
         result = self.compiler._get_files_to_include()
 
         assert len(result) == 2
-        assert "<file>file1.css</file>" in result
-        assert "<file>subdir/file2.css</file>" in result
+        assert '<file compressed="true">file1.css</file>' in result
+        assert '<file compressed="true">subdir/file2.css</file>' in result
+
+    def test_get_files_to_include_adds_policy_attributes(self):
+        create_dummy_file(os.path.join(self.temp_folder, "icon.svg"), "<svg/>")
+        create_dummy_file(os.path.join(self.temp_folder, "background.png"), "png")
+
+        result = self.compiler._get_files_to_include()
+
+        self.assertIn('<file compressed="true" preprocess="xml-stripblanks">icon.svg</file>', result)
+        self.assertIn('<file>background.png</file>', result)
+
+    def test_compile_applies_policy(self):
+        svg = "<svg>\n  <rect/>\n</svg>"
+        create_dummy_file(os.path.join(self.temp_folder, "icon.svg"), svg)
+        create_dummy_file(os.path.join(self.temp_folder, "gnome-shell.css"), "stage { color: red; }\n" * 50)
+
+        self.compiler.compile()
+
+        with GresourceReader(self.target_file) as reader:
+            self.assertEqual(b"<svg><rect/></svg>", reader.read("/org/gnome/shell/theme/icon.svg"))
+            self.assertEqual(b"stage { color: red; }\n" * 50, reader.read("/org/gnome/shell/theme/gnome-shell.css"))
+        self.assertLess(os.path.getsize(self.target_file), 50 * 22)
+
+    def test_compile_without_policy_options_stores_files_as_is(self):
+        svg = "<svg>\n  <rect/>\n</svg>"
+        create_dummy_file(os.path.join(self.temp_folder, "icon.svg"), svg)
+        self.compiler.policy = GresourcePolicy({})
+
+        self.compiler.compile()
+
+        with GresourceReader(self.target_file) as reader:
+            self.assertEqual(svg.encode(), reader.read("/org/gnome/shell/theme/icon.svg"))
+
+    def test_compile_leaves_out_unused_resources(self):
+        create_dummy_file(os.path.join(self.temp_folder, "gnome-shell.css"), "a { background: url(used.svg); }")
+        create_dummy_file(os.path.join(self.temp_folder, "used.svg"), "<svg/>")
+        create_dummy_file(os.path.join(self.temp_folder, "unused.svg"), "<svg/>")
+        self.compiler.pruner = GresourcePruner()
+
+        self.compiler.compile()
+
+        with GresourceReader(self.target_file) as reader:
+            self.assertEqual(["/org/gnome/shell/theme/gnome-shell.css", "/org/gnome/shell/theme/used.svg"],
+                             reader.list_resources())
+
+    def test_get_files_to_include_leaves_out_unused_resources(self):
+        create_dummy_file(os.path.join(self.temp_folder, "gnome-shell.css"), "a {}")
+        create_dummy_file(os.path.join(self.temp_folder, "unused.svg"), "<svg/>")
+        self.compiler.pruner = GresourcePruner()
+
+        result = self.compiler._get_files_to_include()
+
+        self.assertEqual(['<file compressed="true">gnome-shell.css</file>'], result)
+
+    def test_compile_reports_sizes(self):
+        self.__create_dummy_files_in_temp()
+        logger = MagicMock()
+        self.compiler.logger_factory = MagicMock()
+        self.compiler.logger_factory.create_logger.return_value = logger
+
+        self.compiler.compile()
+
+        message = logger.success.call_args[0][0]
+        self.assertRegex(message, r"\(0\.0 KiB -> \d+\.\d KiB\)")
 
     def __create_dummy_files_in_temp(self):
         os.makedirs(self.temp_folder, exist_ok=True)
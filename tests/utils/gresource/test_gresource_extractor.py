@@ -1,12 +1,15 @@
 import os
 import shutil
+import subprocess
+import threading
+import time
 import unittest
 from unittest.mock import patch, MagicMock
 
 import pytest
 
 from scripts import config
-from scripts.utils.gresource import MissingDependencyError
+from scripts.utils.gresource import MissingDependencyError, GresourceExtractionError
 from scripts.utils.gresource.gresource_extractor import GresourceExtractor
 from ..._helpers.dummy_logger_factory import DummyLoggerFactory
 from ..._helpers.dummy_runner import DummyRunner
@@ -90,10 +93,53 @@ class GresourceExtractorTestCase(unittest.TestCase):
 
             assert mock_makedirs.call_count == 2
             assert mock_run.call_count == 2
-            for i, resource in enumerate(test_resources):
-                args_list = mock_run.call_args_list[i][0][0]
+            extracted = []
+            for call in mock_run.call_args_list:
+                args_list = call[0][0]
                 assert args_list[1] == "extract"
-                assert args_list[3] == resource
+                extracted.append(args_list[3])
+            assert sorted(extracted) == test_resources
+
+    def test_extract_resources_runs_concurrently_up_to_jobs(self):
+        resources = [f"/org/gnome/shell/theme/file{i}.css" for i in range(8)]
+        extractor = GresourceExtractor(self.gresource_file, self.temp_folder,
+                                       logger_factory=self.logger, runner=self.runner, jobs=2)
+        lock = threading.Lock()
+        running = []
+        max_running = []
+
+        def run(*args, **kwargs):
+            with lock:
+                running.append(1)
+                max_running.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.pop()
+
+        with patch.object(self.runner, "run", side_effect=run):
+            extractor._extract_resources(resources)
+
+        self.assertEqual(2, max(max_running))
+
+    def test_extract_resources_reports_all_failed_resources(self):
+        resources = ["/org/gnome/shell/theme/ok.css",
+                     "/org/gnome/shell/theme/broken1.css",
+                     "/org/gnome/shell/theme/broken2.css"]
+
+        def run(command, **kwargs):
+            if "broken" in command[3]:
+                raise subprocess.CalledProcessError(1, command)
+
+        with (
+            patch.object(self.runner, "run", side_effect=run),
+            patch.object(self.extractor, "_get_resources_list", return_value=resources)
+        ):
+            with pytest.raises(GresourceExtractionError) as error:
+                self.extractor.extract()
+
+        self.assertEqual({resources[1], resources[2]}, set(error.value.errors))
+        self.assertIn("broken1.css", str(error.value))
+        self.assertTrue(os.path.exists(os.path.join(self.temp_folder, "ok.css")))
 
     def test_extract_resources_file_not_found(self):
         with (
@@ -119,5 +165,29 @@ class GresourceExtractorTestCase(unittest.TestCase):
             expected_path = os.path.join(self.temp_folder, "file.css")
             mock_open.assert_called_once_with(expected_path, 'wb')
 
+    def test_extract_reads_resources_without_gresource_tool(self):
+        gresource_path = os.path.join(os.path.dirname(__file__), "data", "test-theme.gresource")
+        extractor = GresourceExtractor(gresource_path, self.temp_folder,
+                                       logger_factory=self.logger, runner=self.runner)
+
+        with patch.object(self.runner, "run") as mock_run:
+            extractor.extract()
+
+            mock_run.assert_not_called()
+        with open(os.path.join(self.temp_folder, "gnome-shell.css"), "rb") as f:
+            self.assertEqual(b"stage { color: red; }\n/* Marble theme */\n", f.read())
+        self.assertTrue(os.path.exists(os.path.join(self.temp_folder, "icons", "scalable", "checkbox.svg")))
+
+    def test_extract_falls_back_to_gresource_tool_for_unsupported_file(self):
+        with (
+            patch.object(self.extractor, '_get_resources_list') as mock_get_list,
+            patch.object(self.extractor, '_extract_resources') as mock_extract
+        ):
+            mock_get_list.return_value = ["resource1"]
+
+            self.extractor.extract()
+
+            mock_extract.assert_called_once_with(["resource1"])
+
     def test_empty_resource_list(self):
         self.extractor._extract_resources([])
\ No newline at end of file
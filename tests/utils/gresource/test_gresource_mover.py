@@ -48,4 +48,35 @@ class GresourceMoverTestCase(unittest.TestCase):
 
         with patch('os.chmod', side_effect=PermissionError):
             with self.assertRaises(PermissionError):
-                self.mover.move()
\ No newline at end of file
+                self.mover.move()
+
+    def test_move_skips_copy_if_destination_has_same_content(self):
+        create_dummy_file(self.source_file, "compiled")
+        self.mover.move()
+
+        with patch('shutil.copyfile') as mock_copyfile:
+            moved = self.mover.move()
+
+        self.assertFalse(moved)
+        mock_copyfile.assert_not_called()
+
+    def test_move_copies_if_destination_content_differs(self):
+        create_dummy_file(self.source_file, "compiled")
+        create_dummy_file(self.destination_file, "compiles")
+        os.chmod(self.destination_file, 0o644)
+
+        moved = self.mover.move()
+
+        self.assertTrue(moved)
+        with open(self.destination_file) as f:
+            self.assertEqual("compiled", f.read())
+
+    def test_move_fixes_permissions_of_same_destination(self):
+        create_dummy_file(self.source_file, "compiled")
+        create_dummy_file(self.destination_file, "compiled")
+        os.chmod(self.destination_file, 0o600)
+
+        moved = self.mover.move()
+
+        self.assertTrue(moved)
+        self.assertEqual("644", oct(os.stat(self.destination_file).st_mode)[-3:])
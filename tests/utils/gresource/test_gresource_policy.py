@@ -0,0 +1,42 @@
+import unittest
+
+from scripts.utils.gresource.gresource_policy import GresourcePolicy, ResourceOptions
+
+
+class GresourcePolicyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.policy = GresourcePolicy()
+
+    def test_default_policy_compresses_styles_and_svgs(self):
+        self.assertTrue(self.policy.get_options("gnome-shell.css").compressed)
+        self.assertTrue(self.policy.get_options("icons/CHECKBOX.SVG").compressed)
+        self.assertEqual(ResourceOptions(), self.policy.get_options("background.png"))
+
+    def test_custom_policy_replaces_defaults(self):
+        policy = GresourcePolicy({".png": ResourceOptions(compressed=True)})
+
+        self.assertTrue(policy.get_options("background.png").compressed)
+        self.assertFalse(policy.get_options("gnome-shell.css").compressed)
+
+    def test_preprocess_strips_indentation_between_tags(self):
+        content = b'<?xml version="1.0"?>\n<svg>\n  <g>\n    <rect width="1"/>\n  </g>\n</svg>\n'
+
+        result = self.policy.preprocess("icon.svg", content)
+
+        self.assertEqual(b'<?xml version="1.0"?><svg><g><rect width="1"/></g></svg>\n', result)
+
+    def test_preprocess_keeps_documents_with_text(self):
+        content = b"<svg>\n  <text>a</text>\n  <text>b</text>\n</svg>"
+
+        self.assertEqual(content, self.policy.preprocess("icon.svg", content))
+
+    def test_preprocess_keeps_files_without_preprocessing(self):
+        content = b"stage {\n  color: red;\n}"
+
+        self.assertEqual(content, self.policy.preprocess("gnome-shell.css", content))
+
+    def test_unsupported_preprocessing_raises_error(self):
+        policy = GresourcePolicy({".json": ResourceOptions(preprocess="json-stripblanks")})
+
+        with self.assertRaises(ValueError):
+            policy.preprocess("data.json", b"{}")
@@ -0,0 +1,66 @@
+import unittest
+
+from scripts.utils.gresource.gresource_pruner import GresourcePruner
+
+
+class GresourcePrunerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.pruner = GresourcePruner()
+        self.read_paths = []
+
+    def _get_unused(self, resources: dict[str, bytes], pruner: GresourcePruner | None = None) -> set[str]:
+        def read(path: str) -> bytes:
+            self.read_paths.append(path)
+            return resources[path]
+
+        return (pruner or self.pruner).get_unused(resources, read)
+
+    def test_resources_referenced_by_styles_are_kept(self):
+        resources = {
+            "gnome-shell.css": b"a { background: url(toggle-on.svg); }\nb { background: url('icons/c.svg'); }",
+            "toggle-on.svg": b"<svg/>",
+            "icons/c.svg": b"<svg/>",
+            "toggle-off.svg": b"<svg/>",
+        }
+
+        self.assertEqual({"toggle-off.svg"}, self._get_unused(resources))
+
+    def test_resource_uris_are_resolved(self):
+        resources = {
+            "gnome-shell.css": b'a { background: url("resource:///org/gnome/shell/theme/checkbox.svg"); }',
+            "checkbox.svg": b"<svg/>",
+        }
+
+        self.assertEqual(set(), self._get_unused(resources))
+
+    def test_references_are_followed_transitively_and_relative_to_the_file(self):
+        resources = {
+            "gnome-shell.css": b"a { background: url(assets/a.svg); }",
+            "assets/a.svg": b'<svg><image href="../b.png#frame"/></svg>',
+            "b.png": b"png",
+            "c.png": b"png",
+        }
+
+        self.assertEqual({"c.png"}, self._get_unused(resources))
+
+    def test_allowlisted_resources_are_kept(self):
+        resources = {"gnome-shell-high-contrast.css": b"", "process-working.svg": b"<svg/>", "old.svg": b"<svg/>"}
+
+        self.assertEqual({"old.svg"}, self._get_unused(resources))
+        self.assertEqual({"process-working.svg"},
+                         self._get_unused(resources, GresourcePruner(allowlist=["*.css", "old.svg"])))
+
+    def test_external_and_fragment_urls_are_ignored(self):
+        resources = {
+            "gnome-shell.css": b"a { background: url(file:///tmp/x.svg); } b { fill: url(#gradient); }",
+            "x.svg": b"<svg/>",
+        }
+
+        self.assertEqual({"x.svg"}, self._get_unused(resources))
+
+    def test_only_reachable_styles_and_svgs_are_read(self):
+        resources = {"gnome-shell.css": b"", "background.png": b"png", "unused.svg": b"<svg/>"}
+
+        self._get_unused(resources)
+
+        self.assertEqual(["gnome-shell.css"], self.read_paths)
@@ -0,0 +1,87 @@
+import os
+import shutil
+import unittest
+
+from scripts import config
+from scripts.utils.gresource import GresourceFormatError
+from scripts.utils.gresource.gresource_reader import GresourceReader
+from ..._helpers import create_dummy_file
+
+# Validated with `gresource list` and `gresource extract`.
+# gnome-shell-high-contrast.css and checkbox.svg are zlib compressed.
+test_gresource = os.path.join(os.path.dirname(__file__), "data", "test-theme.gresource")
+
+
+class GresourceReaderTestCase(unittest.TestCase):
+    def setUp(self):
+        self.temp_folder = os.path.join(config.temp_tests_folder, "gresource_reader")
+        os.makedirs(self.temp_folder, exist_ok=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_folder, ignore_errors=True)
+
+    def test_list_resources_returns_full_paths(self):
+        with GresourceReader(test_gresource) as reader:
+            resources = reader.list_resources()
+
+        self.assertEqual([
+            "/org/gnome/shell/theme/gnome-shell-high-contrast.css",
+            "/org/gnome/shell/theme/gnome-shell.css",
+            "/org/gnome/shell/theme/icons/scalable/checkbox.svg",
+            "/org/gnome/shell/theme/process-working.svg",
+        ], resources)
+
+    def test_read_returns_uncompressed_resource_without_trailing_zero(self):
+        with GresourceReader(test_gresource) as reader:
+            content = reader.read("/org/gnome/shell/theme/gnome-shell.css")
+
+        self.assertEqual(b"stage { color: red; }\n/* Marble theme */\n", content)
+
+    def test_read_decompresses_compressed_resource(self):
+        with GresourceReader(test_gresource) as reader:
+            content = reader.read("/org/gnome/shell/theme/icons/scalable/checkbox.svg")
+
+        self.assertEqual(b"<svg xmlns=\"http://www.w3.org/2000/svg\"/>\n", content)
+
+    def test_read_raises_key_error_for_missing_resource(self):
+        with GresourceReader(test_gresource) as reader:
+            with self.assertRaises(KeyError):
+                reader.read("/org/gnome/shell/theme/missing.css")
+
+    def test_resources_returns_every_resource(self):
+        with GresourceReader(test_gresource) as reader:
+            resources = dict(reader.resources())
+
+        self.assertEqual(4, len(resources))
+        self.assertEqual(b"stage { color: black; }\n",
+                         resources["/org/gnome/shell/theme/gnome-shell-high-contrast.css"])
+
+    def test_open_raises_format_error_for_invalid_file(self):
+        file = os.path.join(self.temp_folder, "invalid.gresource")
+        create_dummy_file(file, "not a gresource file, but long enough to contain a header")
+
+        with self.assertRaises(GresourceFormatError):
+            GresourceReader(file).open()
+
+    def test_open_raises_format_error_for_empty_file(self):
+        file = os.path.join(self.temp_folder, "empty.gresource")
+        create_dummy_file(file, "")
+
+        with self.assertRaises(GresourceFormatError):
+            GresourceReader(file).open()
+
+    def test_open_raises_format_error_for_truncated_file(self):
+        file = os.path.join(self.temp_folder, "truncated.gresource")
+        with open(test_gresource, "rb") as f:
+            content = f.read()
+        with open(file, "wb") as f:
+            f.write(content[:100])
+
+        with self.assertRaises(GresourceFormatError):
+            GresourceReader(file).open()
+
+    def test_read_requires_opened_file(self):
+        reader = GresourceReader(test_gresource)
+
+        with self.assertRaises(ValueError):
+            reader.list_resources()
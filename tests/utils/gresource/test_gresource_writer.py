@@ -0,0 +1,67 @@
+import os
+import shutil
+import subprocess
+import unittest
+
+from scripts import config
+from scripts.utils.gresource.gresource_reader import GresourceReader
+from scripts.utils.gresource.gresource_writer import GresourceWriter
+
+
+class GresourceWriterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.temp_folder = os.path.join(config.temp_tests_folder, "gresource_writer")
+        self.target_file = os.path.join(self.temp_folder, "test.gresource")
+        os.makedirs(self.temp_folder, exist_ok=True)
+
+        self.resources = {
+            "/org/gnome/shell/theme/gnome-shell.css": b"stage { color: red; }" * 10,
+            "/org/gnome/shell/theme/icons/scalable/checkbox.svg": b"<svg/>",
+            "/org/gnome/shell/theme/empty.css": b"",
+        }
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_folder, ignore_errors=True)
+
+    def test_written_resources_can_be_read(self):
+        GresourceWriter(self.resources).write(self.target_file)
+
+        with GresourceReader(self.target_file) as reader:
+            self.assertEqual(self.resources, dict(reader.resources()))
+
+    def test_compressed_resources_can_be_read(self):
+        GresourceWriter(self.resources, compressed=self.resources).write(self.target_file)
+
+        with GresourceReader(self.target_file) as reader:
+            self.assertEqual(self.resources, dict(reader.resources()))
+
+    def test_compression_reduces_size(self):
+        plain = GresourceWriter(self.resources).serialize()
+        compressed = GresourceWriter(self.resources,
+                                     compressed=["/org/gnome/shell/theme/gnome-shell.css"]).serialize()
+
+        self.assertLess(len(compressed), len(plain))
+
+    def test_resources_which_do_not_shrink_are_stored_uncompressed(self):
+        resources = {"/org/gnome/shell/theme/checkbox.svg": b"<svg/>"}
+
+        plain = GresourceWriter(resources).serialize()
+        compressed = GresourceWriter(resources, compressed=resources).serialize()
+
+        self.assertEqual(plain, compressed)
+
+    @unittest.skipIf(shutil.which("gresource") is None, "gresource tool is not installed")
+    def test_written_file_is_readable_by_gresource_tool(self):
+        GresourceWriter(self.resources, compressed=["/org/gnome/shell/theme/gnome-shell.css"]).write(self.target_file)
+
+        listed = subprocess.run(["gresource", "list", self.target_file],
+                                capture_output=True, text=True, check=True).stdout.split()
+        extracted = subprocess.run(["gresource", "extract", self.target_file, "/org/gnome/shell/theme/gnome-shell.css"],
+                                   capture_output=True, check=True).stdout
+
+        self.assertEqual(sorted(self.resources), sorted(listed))
+        self.assertEqual(self.resources["/org/gnome/shell/theme/gnome-shell.css"], extracted)
+
+    def test_invalid_resource_path_raises_error(self):
+        with self.assertRaises(ValueError):
+            GresourceWriter({"relative/path.css": b""})
@@ -0,0 +1,84 @@
+import subprocess
+import unittest
+from unittest.mock import patch
+
+from scripts.utils.alternatives_updater import AlternativesUpdater, AlternativeState
+
+QUERY_OUTPUT = """Name: gdm-theme.gresource
+Link: /usr/share/gnome-shell/gdm-theme.gresource
+Slaves:
+ gdm-theme.gresource.1.gz /usr/share/man/man1/gdm.1.gz
+Status: manual
+Best: /usr/share/gnome-shell/theme/Yaru/gnome-shell-theme.gresource
+Value: /usr/share/gnome-shell/gnome-shell-theme.gresource
+
+Alternative: /usr/share/gnome-shell/gnome-shell-theme.gresource
+Priority: 0
+
+Alternative: /usr/share/gnome-shell/theme/Yaru/gnome-shell-theme.gresource
+Priority: 15
+"""
+
+LINK = "/usr/share/gnome-shell/gdm-theme.gresource"
+NAME = "gdm-theme.gresource"
+PATH = "/usr/share/gnome-shell/gnome-shell-theme.gresource"
+
+
+class AlternativesUpdaterTestCase(unittest.TestCase):
+    def test_parse_reads_link_value_status_and_priorities(self):
+        state = AlternativeState.parse(QUERY_OUTPUT)
+
+        self.assertEqual(LINK, state.link)
+        self.assertEqual(PATH, state.value)
+        self.assertEqual("manual", state.status)
+        self.assertEqual({PATH: 0, "/usr/share/gnome-shell/theme/Yaru/gnome-shell-theme.gresource": 15},
+                         state.priorities)
+
+    def test_state_checks_installation_and_selection(self):
+        state = AlternativeState.parse(QUERY_OUTPUT)
+
+        self.assertTrue(state.is_installed(LINK, PATH.encode(), 0))
+        self.assertFalse(state.is_installed(LINK, PATH, 10))
+        self.assertTrue(state.is_set(PATH))
+        self.assertFalse(AlternativeState(value=PATH, status="auto").is_set(PATH))
+
+    @patch("subprocess.run")
+    def test_query_returns_none_for_unknown_alternative(self, mock_run):
+        mock_run.return_value = subprocess.CompletedProcess([], 2, stdout="")
+
+        self.assertIsNone(AlternativesUpdater.query(NAME))
+
+    @patch("subprocess.run", side_effect=FileNotFoundError("No such file: 'update-alternatives'"))
+    def test_query_returns_none_without_update_alternatives(self, _):
+        self.assertIsNone(AlternativesUpdater.query(NAME))
+
+    @patch.object(AlternativesUpdater, "set")
+    @patch.object(AlternativesUpdater, "install")
+    @patch.object(AlternativesUpdater, "query")
+    def test_install_and_set_skips_steps_which_are_done(self, mock_query, mock_install, mock_set):
+        mock_query.return_value = AlternativeState.parse(QUERY_OUTPUT)
+
+        AlternativesUpdater.install_and_set(LINK, NAME, PATH, 0)
+
+        mock_install.assert_not_called()
+        mock_set.assert_not_called()
+
+    @patch.object(AlternativesUpdater, "set")
+    @patch.object(AlternativesUpdater, "install")
+    @patch.object(AlternativesUpdater, "query")
+    def test_install_and_set_sets_alternative_selected_automatically(self, mock_query, mock_install, mock_set):
+        mock_query.return_value = AlternativeState(link=LINK, value=PATH, status="auto", priorities={PATH: 0})
+
+        AlternativesUpdater.install_and_set(LINK, NAME, PATH, 0)
+
+        mock_install.assert_not_called()
+        mock_set.assert_called_once_with(NAME, PATH)
+
+    @patch.object(AlternativesUpdater, "set")
+    @patch.object(AlternativesUpdater, "install")
+    @patch.object(AlternativesUpdater, "query", return_value=None)
+    def test_install_and_set_runs_all_steps_for_new_alternative(self, _, mock_install, mock_set):
+        AlternativesUpdater.install_and_set(LINK, NAME, PATH, 0)
+
+        mock_install.assert_called_once_with(LINK, NAME, PATH, 0)
+        mock_set.assert_called_once_with(NAME, PATH)
@@ -0,0 +1,53 @@
+import os
+import shutil
+import unittest
+
+from scripts import config
+from scripts.utils.filter_styles import filter_styles, filter_styles_content
+from .._helpers import create_dummy_file
+
+
+class FilterStylesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.temp_folder = os.path.join(config.temp_tests_folder, "filter_styles")
+        self.file = os.path.join(self.temp_folder, "gnome-shell.css")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_folder, ignore_errors=True)
+
+    def test_filter_styles_content_without_filters_returns_content(self):
+        content = "stage { color: red !important; }"
+
+        self.assertEqual(content, filter_styles_content(content))
+
+    def test_filter_styles_content_removes_keywords(self):
+        result = filter_styles_content("stage { color: red !important; }", keywords=[" !important"])
+
+        self.assertEqual("stage { color: red; }", result)
+
+    def test_filter_styles_content_removes_longest_keyword_first(self):
+        result = filter_styles_content("a { b: c !important-ish; }", keywords=[" !important", " !important-ish"])
+
+        self.assertEqual("a { b: c; }", result)
+
+    def test_filter_styles_content_removes_declarations_and_keeps_closing_brace(self):
+        content = "stage {\n  font-size: 10pt;\n  color: red; }\n#panel {\n  color: blue;\n}"
+
+        result = filter_styles_content(content, properties=["color"])
+
+        self.assertEqual("stage {\n  font-size: 10pt; }\n#panel {\n}", result)
+
+    def test_filter_styles_content_applies_keywords_and_properties(self):
+        content = "stage {\n  color: red !important;\n  spacing: 2px !important;\n}"
+
+        result = filter_styles_content(content, keywords=[" !important"], properties=["color"])
+
+        self.assertEqual("stage {\n  spacing: 2px;\n}", result)
+
+    def test_filter_styles_rewrites_file_once_with_all_filters(self):
+        create_dummy_file(self.file, "stage {\n  color: red;\n  spacing: 2px !important;\n}")
+
+        filter_styles(self.file, keywords=[" !important"], properties=["color"])
+
+        with open(self.file) as f:
+            self.assertEqual("stage {\n  spacing: 2px;\n}", f.read())
@@ -0,0 +1,45 @@
+import os
+import shutil
+import unittest
+
+from scripts import config
+from scripts.utils.hash_files import hash_file, hash_files
+from .._helpers import create_dummy_file
+
+
+class HashFilesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.temp_folder = os.path.join(config.temp_tests_folder, "hash_files")
+        self.folder = os.path.join(self.temp_folder, "folder")
+        self.file = os.path.join(self.folder, "file.css")
+        create_dummy_file(self.file, "a { color: red; }")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_folder, ignore_errors=True)
+
+    def test_hash_file_depends_on_content(self):
+        first = hash_file(self.file)
+        create_dummy_file(self.file, "a { color: blue; }")
+
+        self.assertNotEqual(first, hash_file(self.file))
+
+    def test_hash_files_is_stable(self):
+        self.assertEqual(hash_files(self.folder), hash_files(self.folder))
+
+    def test_hash_files_depends_on_file_names(self):
+        first = hash_files(self.folder)
+        os.rename(self.file, os.path.join(self.folder, "other.css"))
+
+        self.assertNotEqual(first, hash_files(self.folder))
+
+    def test_hash_files_depends_on_nested_files(self):
+        first = hash_files(self.folder)
+        create_dummy_file(os.path.join(self.folder, "nested", "file.svg"), "<svg/>")
+
+        self.assertNotEqual(first, hash_files(self.folder))
+
+    def test_hash_files_skips_python_caches(self):
+        first = hash_files(self.folder)
+        create_dummy_file(os.path.join(self.folder, "__pycache__", "module.pyc"), "cache")
+
+        self.assertEqual(first, hash_files(self.folder))
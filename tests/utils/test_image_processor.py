@@ -0,0 +1,144 @@
+import os
+import shutil
+import unittest
+from unittest.mock import patch
+
+from scripts import config
+from scripts.utils.image_processor import (CachedImageProcessor, ImageEffects, ImageProcessor,
+                                           MagickImageProcessor, PillowImageProcessor, get_cover_scale,
+                                           get_image_processor)
+from scripts.utils.theme.theme_output_cache import ThemeOutputCache
+from .._helpers import create_dummy_file
+from .._helpers.dummy_runner import DummyRunner
+
+
+class CountingImageProcessor(ImageProcessor):
+    name = "counting"
+
+    def __init__(self):
+        self.calls = 0
+
+    def process(self, source: str, destination: str, effects: ImageEffects):
+        self.calls += 1
+        with open(source) as f:
+            create_dummy_file(destination, f"{f.read()} blurred {effects.blur}")
+
+
+class ImageProcessorTestCase(unittest.TestCase):
+    def setUp(self):
+        self.temp_folder = os.path.join(config.temp_tests_folder, "image_processor")
+        self.source = os.path.join(self.temp_folder, "wallpaper.jpg")
+        self.destination = os.path.join(self.temp_folder, "out", "gdm-image.jpg")
+        create_dummy_file(self.source, "image")
+        os.makedirs(os.path.dirname(self.destination), exist_ok=True)
+
+        self.processor = CountingImageProcessor()
+        self.cache = ThemeOutputCache(os.path.join(self.temp_folder, "cache"), 1024 * 1024)
+        self.cached_processor = CachedImageProcessor(self.processor, self.cache)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_folder, ignore_errors=True)
+
+    def _read_destination(self) -> str:
+        with open(self.destination) as f:
+            return f.read()
+
+    def test_effects_are_empty_without_values(self):
+        self.assertFalse(ImageEffects())
+        self.assertFalse(ImageEffects(blur=0))
+        self.assertTrue(ImageEffects(blur=10))
+
+    def test_cached_processor_processes_image_once(self):
+        self.cached_processor.process(self.source, self.destination, ImageEffects(blur=10))
+        os.remove(self.destination)
+        self.cached_processor.process(self.source, self.destination, ImageEffects(blur=10))
+
+        self.assertEqual(1, self.processor.calls)
+        self.assertEqual("image blurred 10", self._read_destination())
+        self.assertTrue(self.cached_processor.is_cached(self.source, self.destination, ImageEffects(blur=10)))
+        self.assertFalse(self.processor.is_cached(self.source, self.destination, ImageEffects(blur=10)))
+
+    def test_cached_processor_processes_again_with_other_effects(self):
+        self.cached_processor.process(self.source, self.destination, ImageEffects(blur=10))
+        self.cached_processor.process(self.source, self.destination, ImageEffects(blur=20))
+
+        self.assertEqual(2, self.processor.calls)
+        self.assertEqual("image blurred 20", self._read_destination())
+
+    def test_cached_processor_processes_again_when_image_changes(self):
+        self.cached_processor.process(self.source, self.destination, ImageEffects(blur=10))
+        create_dummy_file(self.source, "other image")
+        self.cached_processor.process(self.source, self.destination, ImageEffects(blur=10))
+
+        self.assertEqual(2, self.processor.calls)
+        self.assertEqual("other image blurred 10", self._read_destination())
+
+    def test_magick_processor_runs_blur_command(self):
+        runner = DummyRunner()
+
+        with patch.object(runner, "run") as mock_run:
+            MagickImageProcessor(runner).process(self.source, self.destination, ImageEffects(blur=40))
+
+        mock_run.assert_called_once_with(["magick", self.source, "-auto-orient", "-blur", "0x40",
+                                          "-strip", "-quality", "90", self.destination], check=True)
+
+    def test_magick_processor_runs_resize_command(self):
+        runner = DummyRunner()
+
+        with patch.object(runner, "run") as mock_run:
+            MagickImageProcessor(runner).process(self.source, self.destination,
+                                                 ImageEffects(resolution=(1920, 1080)))
+
+        mock_run.assert_called_once_with(["magick", self.source, "-auto-orient", "-resize", "1920x1080^>",
+                                          "-strip", "-quality", "90", self.destination], check=True)
+
+    def test_cover_scale_downscales_to_cover_resolution(self):
+        self.assertEqual(0.5, get_cover_scale((6000, 4000), (1920, 2000)))
+        self.assertEqual(0.32, get_cover_scale((6000, 4000), (1920, 1080)))
+
+    def test_cover_scale_never_upscales(self):
+        self.assertEqual(1, get_cover_scale((1280, 720), (1920, 1080)))
+        self.assertEqual(1, get_cover_scale((6000, 4000), None))
+
+    @patch.object(MagickImageProcessor, "is_available", return_value=True)
+    @patch.object(PillowImageProcessor, "is_available", return_value=False)
+    def test_get_image_processor_falls_back_to_magick(self, _, __):
+        self.assertIsInstance(get_image_processor(), MagickImageProcessor)
+
+    @patch.object(MagickImageProcessor, "is_available", return_value=False)
+    @patch.object(PillowImageProcessor, "is_available", return_value=False)
+    def test_get_image_processor_returns_none_without_tools(self, _, __):
+        self.assertIsNone(get_image_processor())
+
+    @unittest.skipUnless(PillowImageProcessor.is_available(), "Pillow is not installed")
+    def test_pillow_processor_blurs_image(self):
+        from PIL import Image
+        source = os.path.join(self.temp_folder, "source.png")
+        destination = os.path.join(self.temp_folder, "blurred.png")
+        image = Image.new("RGB", (20, 20), "black")
+        image.putpixel((10, 10), (255, 255, 255))
+        image.save(source)
+
+        PillowImageProcessor().process(source, destination, ImageEffects(blur=2))
+
+        with Image.open(destination) as blurred:
+            self.assertEqual((20, 20), blurred.size)
+            self.assertLess(blurred.getpixel((10, 10))[0], 255)
+            self.assertGreater(blurred.getpixel((11, 10))[0], 0)
+
+    @unittest.skipUnless(PillowImageProcessor.is_available(), "Pillow is not installed")
+    def test_pillow_processor_downscales_image_and_strips_metadata(self):
+        from PIL import Image
+        source = os.path.join(self.temp_folder, "source.jpg")
+        destination = os.path.join(self.temp_folder, "downscaled.jpg")
+        image = Image.new("RGB", (400, 200), "blue")
+        exif = Image.Exif()
+        exif[0x010F] = "Camera"
+        image.save(source, exif=exif)
+
+        processor = PillowImageProcessor()
+        processor.process(source, destination, ImageEffects(resolution=(100, 100)))
+
+        self.assertEqual((200, 100), processor.get_size(destination))
+        with Image.open(destination) as downscaled:
+            self.assertEqual(0, len(downscaled.getexif()))
@@ -0,0 +1,71 @@
+import os
+import shutil
+import unittest
+
+from scripts import config
+from scripts.utils.keywords_replacer import KeywordsReplacer
+from .._helpers import create_dummy_file
+
+
+class KeywordsReplacerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.temp_folder = os.path.join(config.temp_tests_folder, "keywords_replacer")
+        os.makedirs(self.temp_folder, exist_ok=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_folder, ignore_errors=True)
+
+    def test_replace_replaces_all_keywords(self):
+        replacer = KeywordsReplacer(("ACCENT-COLOR", "red"), ("BACKGROUND-COLOR", "black"))
+
+        result = replacer.replace("a { color: ACCENT-COLOR; background: BACKGROUND-COLOR; border: ACCENT-COLOR; }")
+
+        self.assertEqual("a { color: red; background: black; border: red; }", result)
+
+    def test_replace_prefers_longest_keyword(self):
+        replacer = KeywordsReplacer(("ACCENT-COLOR", "red"), ("ACCENT-COLOR-SECONDARY", "blue"))
+
+        result = replacer.replace("ACCENT-COLOR ACCENT-COLOR-SECONDARY")
+
+        self.assertEqual("red blue", result)
+
+    def test_replace_does_not_replace_inside_replacements(self):
+        replacer = KeywordsReplacer(("BUTTON-COLOR", "ACCENT-COLOR"), ("ACCENT-COLOR", "red"))
+
+        result = replacer.replace("BUTTON-COLOR ACCENT-COLOR")
+
+        self.assertEqual("ACCENT-COLOR red", result)
+
+    def test_replace_uses_first_replacement_for_repeated_keyword(self):
+        replacer = KeywordsReplacer(("ACCENT-COLOR", "red"), ("ACCENT-COLOR", "blue"))
+
+        result = replacer.replace("ACCENT-COLOR")
+
+        self.assertEqual("red", result)
+
+    def test_replace_without_replacements_returns_content(self):
+        replacer = KeywordsReplacer()
+
+        result = replacer.replace("ACCENT-COLOR")
+
+        self.assertEqual("ACCENT-COLOR", result)
+
+    def test_replace_in_file_rewrites_styles(self):
+        file = os.path.join(self.temp_folder, "file.css")
+        create_dummy_file(file, "a { color: ACCENT-COLOR; }")
+        replacer = KeywordsReplacer(("ACCENT-COLOR", "red"))
+
+        replacer.replace_in_file(file)
+
+        with open(file, "r") as f:
+            self.assertEqual("a { color: red; }", f.read())
+
+    def test_replace_in_file_skips_unsupported_files(self):
+        file = os.path.join(self.temp_folder, "file.png")
+        create_dummy_file(file, "ACCENT-COLOR")
+        replacer = KeywordsReplacer(("ACCENT-COLOR", "red"))
+
+        replacer.replace_in_file(file)
+
+        with open(file, "r") as f:
+            self.assertEqual("ACCENT-COLOR", f.read())
@@ -0,0 +1,39 @@
+import os
+import shutil
+import unittest
+
+from scripts import config
+from scripts.utils.monitors import get_largest_monitor_resolution, parse_resolution
+from .._helpers import create_dummy_file
+
+
+class MonitorsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.drm_folder = os.path.join(config.temp_tests_folder, "drm")
+
+    def tearDown(self):
+        shutil.rmtree(self.drm_folder, ignore_errors=True)
+
+    def _create_connector(self, name: str, status: str, modes: str):
+        create_dummy_file(os.path.join(self.drm_folder, name, "status"), status + "\n")
+        create_dummy_file(os.path.join(self.drm_folder, name, "modes"), modes)
+
+    def test_largest_connected_monitor_is_returned(self):
+        self._create_connector("card0-eDP-1", "connected", "1920x1200\n1920x1080\n")
+        self._create_connector("card0-DP-1", "connected", "3840x2160\n2560x1440\n")
+        self._create_connector("card0-DP-2", "disconnected", "")
+        self._create_connector("card1-HDMI-A-1", "disconnected", "7680x4320\n")
+
+        self.assertEqual((3840, 2160), get_largest_monitor_resolution(self.drm_folder))
+
+    def test_none_is_returned_without_connected_monitors(self):
+        self._create_connector("card0-DP-1", "disconnected", "")
+
+        self.assertIsNone(get_largest_monitor_resolution(self.drm_folder))
+        self.assertIsNone(get_largest_monitor_resolution(os.path.join(self.drm_folder, "missing")))
+
+    def test_parse_resolution(self):
+        self.assertEqual((1920, 1080), parse_resolution("1920x1080"))
+        self.assertEqual((1920, 1080), parse_resolution("1920X1080i"))
+        self.assertIsNone(parse_resolution("original"))
+        self.assertIsNone(parse_resolution("0x1080"))
@@ -4,6 +4,7 @@ import unittest
 from unittest.mock import patch
 
 from scripts import config
+from scripts.utils.file_system.memory_file_system import MemoryFileSystem
 from scripts.utils.style_manager import StyleManager
 from .._helpers import create_dummy_file
 
@@ -77,4 +78,17 @@ class StyleManagerTestCase(unittest.TestCase):
             assert first_css in split_content
             assert second_css in split_content
         os.remove(self.output_file)
-        shutil.rmtree(source_folder, ignore_errors=True)
\ No newline at end of file
+        shutil.rmtree(source_folder, ignore_errors=True)
+
+    def test_manager_with_memory_file_system_does_not_touch_disk(self):
+        file_system = MemoryFileSystem()
+        manager = StyleManager(output_file=self.output_file, file_system=file_system)
+        file_system.write_text(self.output_file, "body { color: BACKGROUND-COLOR; }")
+
+        manager.prepend_content("h1 { color: red; }")
+        manager.append_content("h2 { color: blue; }")
+        manager.replace_keywords(("BACKGROUND-COLOR", "BACKGROUND-OPAQUE-COLOR"))
+
+        self.assertFalse(os.path.exists(self.output_file))
+        self.assertEqual("h1 { color: red; }\nbody { color: BACKGROUND-OPAQUE-COLOR; }\nh2 { color: blue; }",
+                         file_system.read_text(self.output_file))
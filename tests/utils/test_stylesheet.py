@@ -0,0 +1,87 @@
+import unittest
+
+from scripts.utils.stylesheet import CssDeclaration, Stylesheet, tokenize_css
+
+
+class StylesheetTestCase(unittest.TestCase):
+    def test_tokenize_css_keeps_punctuation_inside_comments_strings_and_urls(self):
+        content = '/* a { b; } */ a { content: "};"; background: url(data:x;base64,{}); }'
+
+        tokens = list(tokenize_css(content))
+
+        self.assertEqual(content, "".join(text for _, text in tokens))
+        self.assertEqual(["{", ";", ";", "}"], [text for kind, text in tokens if kind == "punct"])
+
+    def test_serialize_returns_original_content(self):
+        contents = [
+            "stage { color: red; }\n",
+            "/* header */\n@import url(\"a.css\");\n#panel{color:red;spacing:2px}",
+            "@media (min-width: 10px) {\n  a { color: red; }\n}\n",
+            "a { color: red; } }\nb { unclosed: 1",
+        ]
+
+        for content in contents:
+            self.assertEqual(content, Stylesheet.parse(content).serialize())
+
+    def test_parse_builds_nested_rules(self):
+        stylesheet = Stylesheet.parse("@media (x) { a { color: red; spacing: 2px } }")
+
+        preludes = [rule.prelude.strip() for rule in stylesheet.rules()]
+        self.assertEqual(["@media (x)", "a"], preludes)
+        declarations = stylesheet.children[0].children[0].children
+        self.assertEqual(["color", "spacing"], [declaration.name for declaration in declarations])
+        self.assertFalse(declarations[-1].terminated)
+
+    def test_declaration_name_ignores_comments_and_case(self):
+        self.assertEqual("color", CssDeclaration("\n  /* accent */ COLOR : red").name)
+        self.assertEqual("", CssDeclaration(" keyword").name)
+
+    def test_remove_properties_compares_exact_names(self):
+        stylesheet = Stylesheet.parse("a {\n  color: red;\n  background-color: blue;\n  border-color: red;\n}")
+
+        stylesheet.remove_properties("color")
+
+        self.assertEqual("a {\n  background-color: blue;\n  border-color: red;\n}", stylesheet.serialize())
+
+    def test_remove_properties_keeps_selectors_which_contain_property_names(self):
+        stylesheet = Stylesheet.parse(".color-picker { color: red; spacing: 2px; }")
+
+        stylesheet.remove_properties("color")
+
+        self.assertEqual(".color-picker { spacing: 2px; }", stylesheet.serialize())
+
+    def test_remove_properties_handles_multiline_declarations(self):
+        stylesheet = Stylesheet.parse("a {\n  box-shadow: 0 0 1px red,\n    0 0 2px blue;\n  spacing: 2px;\n}")
+
+        stylesheet.remove_properties("box-shadow")
+
+        self.assertEqual("a {\n  spacing: 2px;\n}", stylesheet.serialize())
+
+    def test_remove_properties_in_nested_rules(self):
+        stylesheet = Stylesheet.parse("@media (x) { a { color: red; } }")
+
+        stylesheet.remove_properties("color")
+
+        self.assertEqual("@media (x) { a { } }", stylesheet.serialize())
+
+    def test_remove_keywords_skips_comments_and_strings(self):
+        stylesheet = Stylesheet.parse('/* !important */ a { color: red !important; content: "!important"; }')
+
+        stylesheet.remove_keywords(" !important")
+
+        self.assertEqual('/* !important */ a { color: red; content: "!important"; }', stylesheet.serialize())
+
+    def test_remove_keywords_from_selectors(self):
+        stylesheet = Stylesheet.parse("KEYWORD a { color: red; }")
+
+        stylesheet.remove_keywords("KEYWORD ")
+
+        self.assertEqual("a { color: red; }", stylesheet.serialize())
+
+    def test_prepend_and_append_add_parsed_styles(self):
+        stylesheet = Stylesheet.parse("b { color: red; }")
+
+        stylesheet.prepend("a { color: red; }\n").append("\nc { color: red; }")
+        stylesheet.remove_properties("color")
+
+        self.assertEqual("a { }\nb { }\nc { }", stylesheet.serialize())
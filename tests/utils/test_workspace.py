@@ -0,0 +1,52 @@
+import os
+import shutil
+import stat
+import unittest
+
+from scripts import config
+from scripts.utils.workspace import Workspace
+
+
+class WorkspaceTestCase(unittest.TestCase):
+    def setUp(self):
+        self.base_folder = os.path.join(config.temp_tests_folder, "workspace")
+        os.makedirs(self.base_folder, exist_ok=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.base_folder, ignore_errors=True)
+
+    def test_workspace_is_set_as_temp_folder(self):
+        previous_temp_folder = config.temp_folder
+
+        with Workspace(self.base_folder) as temp_folder:
+            self.assertEqual(temp_folder, config.temp_folder)
+
+        self.assertEqual(previous_temp_folder, config.temp_folder)
+
+    def test_workspaces_are_unique(self):
+        with Workspace(self.base_folder) as first, Workspace(self.base_folder) as second:
+            self.assertNotEqual(first, second)
+
+    def test_workspace_is_private(self):
+        with Workspace(self.base_folder) as temp_folder:
+            mode = stat.S_IMODE(os.stat(temp_folder).st_mode)
+
+        self.assertEqual(0o700, mode)
+
+    def test_exit_removes_only_own_workspace(self):
+        other_folder = os.path.join(self.base_folder, "other-run")
+        os.makedirs(other_folder)
+
+        with Workspace(self.base_folder) as temp_folder:
+            with open(os.path.join(temp_folder, "file.css"), "w") as f:
+                f.write("content")
+
+        self.assertFalse(os.path.exists(temp_folder))
+        self.assertTrue(os.path.exists(other_folder))
+
+    def test_exit_removes_workspace_on_error(self):
+        with self.assertRaises(ValueError):
+            with Workspace(self.base_folder) as temp_folder:
+                raise ValueError()
+
+        self.assertFalse(os.path.exists(temp_folder))
@@ -0,0 +1,64 @@
+import os
+import shutil
+import unittest
+
+from scripts import config
+from scripts.utils.write_if_changed import write_if_changed, copy_if_changed, copy_file_if_changed
+from .._helpers import create_dummy_file
+
+
+class WriteIfChangedTestCase(unittest.TestCase):
+    def setUp(self):
+        self.temp_folder = os.path.join(config.temp_tests_folder, "write_if_changed")
+        self.file = os.path.join(self.temp_folder, "file.css")
+        create_dummy_file(self.file, "a { color: red; }")
+        os.utime(self.file, (1, 1))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_folder, ignore_errors=True)
+
+    def test_write_if_changed_skips_same_content(self):
+        written = write_if_changed(self.file, b"a { color: red; }")
+
+        self.assertFalse(written)
+        self.assertEqual(1, os.stat(self.file).st_mtime)
+
+    def test_write_if_changed_writes_content_of_same_size(self):
+        written = write_if_changed(self.file, b"a { color: tan; }")
+
+        self.assertTrue(written)
+        with open(self.file) as f:
+            self.assertEqual("a { color: tan; }", f.read())
+
+    def test_write_if_changed_creates_missing_file(self):
+        file = os.path.join(self.temp_folder, "new.css")
+
+        written = write_if_changed(file, b"content")
+
+        self.assertTrue(written)
+        self.assertTrue(os.path.exists(file))
+
+    def test_copy_if_changed_skips_same_file(self):
+        source = os.path.join(self.temp_folder, "source.css")
+        create_dummy_file(source, "a { color: red; }")
+
+        copy_if_changed(source, self.file)
+
+        self.assertEqual(1, os.stat(self.file).st_mtime)
+
+    def test_copy_if_changed_copies_different_file(self):
+        source = os.path.join(self.temp_folder, "source.css")
+        create_dummy_file(source, "a { color: blue; }")
+
+        copy_if_changed(source, self.file)
+
+        with open(self.file) as f:
+            self.assertEqual("a { color: blue; }", f.read())
+
+    def test_copy_file_if_changed_reports_whether_file_was_copied(self):
+        source = os.path.join(self.temp_folder, "source.css")
+        create_dummy_file(source, "a { color: red; }")
+
+        self.assertFalse(copy_file_if_changed(source, self.file))
+        create_dummy_file(source, "a { color: blue; }")
+        self.assertTrue(copy_file_if_changed(source, self.file))
@@ -1,10 +1,14 @@
+import copy
 import os.path
 import unittest
+from unittest.mock import Mock
 
 from scripts.install.colors_definer import ColorsDefiner
 from scripts.types.installation_color import InstallationColor, InstallationMode
+from scripts.types.palette import Palette
 from scripts.utils.color_converter.color_converter_impl import ColorConverterImpl
 from scripts.utils.theme.color_replacement_generator import ColorReplacementGenerator
+from scripts.utils.theme.replacements_cache import ReplacementsCache
 
 class ColorReplacementGeneratorTestCase(unittest.TestCase):
     def setUp(self):
@@ -76,4 +80,44 @@ class ColorReplacementGeneratorTestCase(unittest.TestCase):
                 (value for name, value in actual_output if name == expected_name), None
             )
             self.assertIsNotNone(actual_value)
-            self.assertEqual(expected_value, actual_value)
\ No newline at end of file
+            self.assertEqual(expected_value, actual_value)
+
+    def test_convert_many_returns_replacements_for_each_variant(self):
+        red = InstallationColor(hue=0, saturation=None, modes=[])
+        gray = InstallationColor(hue=0, saturation=0, modes=[])
+
+        actual_output = self.generator.convert_many([("dark", red), ("light", gray)])
+
+        self.assertEqual(2, len(actual_output))
+        self._assert_expected_and_actual_replacers_match(self._get_expected_output(red, "dark"), actual_output[0])
+        self._assert_expected_and_actual_replacers_match(self._get_expected_output(gray, "light"), actual_output[1])
+
+    def test_convert_many_without_variants_returns_empty_list(self):
+        self.assertEqual([], self.generator.convert_many([]))
+
+    def test_convert_with_same_color_uses_cached_table(self):
+        cache = ReplacementsCache()
+        color_converter = Mock(wraps=self.color_converter)
+        generator = ColorReplacementGenerator(self.colors_provider, color_converter, cache=cache)
+        theme_color = InstallationColor(hue=0, saturation=None, modes=[])
+
+        first_output = generator.convert("dark", theme_color)
+        second_output = generator.convert("dark", theme_color)
+
+        self.assertEqual(first_output, second_output)
+        color_converter.hsl_to_rgb_many.assert_called_once()
+        self.assertEqual(1, cache.stats().hits)
+
+    def test_generators_with_different_colors_do_not_share_tables(self):
+        cache = ReplacementsCache()
+        other_replacers = copy.deepcopy(self.colors_provider.replacers)
+        other_replacers["ACCENT-COLOR"]["dark"]["l"] = 90
+        other_colors = Mock(palette=Palette.from_replacers(other_replacers))
+        generator = ColorReplacementGenerator(self.colors_provider, self.color_converter, cache=cache)
+        other_generator = ColorReplacementGenerator(other_colors, self.color_converter, cache=cache)
+        theme_color = InstallationColor(hue=0, saturation=None, modes=[])
+
+        output = generator.convert("dark", theme_color)
+        other_output = other_generator.convert("dark", theme_color)
+
+        self.assertNotEqual(output, other_output)
@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import Mock
 import os
 
+from scripts.utils.file_system.memory_file_system import MemoryFileSystem
 from scripts.utils.theme.gnome_shell_theme_builder import GnomeShellThemeBuilder
 
 
@@ -73,4 +74,14 @@ class GnomeShellThemeBuilderTestCase(unittest.TestCase):
         self.assertFalse(self.builder.is_filled)
 
         self.builder.filled(True)
-        self.assertTrue(self.builder.is_filled)
\ No newline at end of file
+        self.assertTrue(self.builder.is_filled)
+
+    def test_build_shares_injected_file_system(self):
+        file_system = MemoryFileSystem()
+        self.builder.with_file_system(file_system)
+
+        self.builder.build()
+
+        self.assertIs(file_system, self.builder.preparation.file_system)
+        self.assertIs(file_system, self.builder.installer.file_system)
+        self.assertTrue(file_system.exists(self.builder.temp_folder))
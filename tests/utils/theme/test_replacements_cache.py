@@ -0,0 +1,56 @@
+import unittest
+
+from scripts.utils.theme.replacements_cache import ReplacementsCache
+
+
+class ReplacementsCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.cache = ReplacementsCache(max_size=2)
+        self.table = [("ACCENT-COLOR", "rgba(255, 0, 0, 1)")]
+
+    def test_get_returns_stored_table(self):
+        self.cache.put("red", self.table)
+
+        self.assertEqual(self.table, self.cache.get("red"))
+
+    def test_get_returns_copy_of_table(self):
+        self.cache.put("red", self.table)
+
+        self.cache.get("red").clear()
+
+        self.assertEqual(self.table, self.cache.get("red"))
+
+    def test_get_counts_hits_and_misses(self):
+        self.cache.put("red", self.table)
+
+        self.cache.get("red")
+        self.cache.get("green")
+
+        stats = self.cache.stats()
+        self.assertEqual(1, stats.hits)
+        self.assertEqual(1, stats.misses)
+
+    def test_put_evicts_least_recently_used_table(self):
+        self.cache.put("red", self.table)
+        self.cache.put("green", self.table)
+        self.cache.get("red")
+
+        self.cache.put("blue", self.table)
+
+        self.assertIsNotNone(self.cache.get("red"))
+        self.assertIsNone(self.cache.get("green"))
+        self.assertEqual(1, self.cache.stats().evictions)
+        self.assertEqual(2, self.cache.stats().size)
+
+    def test_clear_removes_tables_and_resets_counters(self):
+        self.cache.put("red", self.table)
+        self.cache.get("red")
+
+        self.cache.clear()
+
+        self.assertEqual((0, 0, 0, 0), (self.cache.stats().hits, self.cache.stats().misses,
+                                        self.cache.stats().evictions, self.cache.stats().size))
+
+    def test_not_positive_size_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            ReplacementsCache(max_size=0)
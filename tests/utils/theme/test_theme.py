@@ -66,6 +66,23 @@ class ThemeTestCase(unittest.TestCase):
 
         self.mock_preparation.prepare.assert_called_once()
 
+    def test_prepare_from_copies_prepared_theme(self):
+        prepared_theme = Theme(MagicMock(), MagicMock())
+
+        self.theme.prepare_from(prepared_theme)
+
+        self.mock_preparation.prepare_from.assert_called_once_with(prepared_theme._preparation)
+        self.mock_preparation.prepare.assert_not_called()
+
+    def test_prepare_from_replaces_filled_keywords_only_if_prepared_theme_is_not_filled(self):
+        filled_theme = Theme(self.mock_preparation, self.mock_installer, is_filled=True)
+
+        filled_theme.prepare_from(Theme(MagicMock(), MagicMock(), is_filled=True))
+        self.mock_preparation.replace_filled_keywords.assert_not_called()
+
+        filled_theme.prepare_from(Theme(MagicMock(), MagicMock()))
+        self.mock_preparation.replace_filled_keywords.assert_called_once()
+
     def test_install_without_optional_params_called_correctly(self):
         self.theme.install(200, "Green")
 
@@ -88,3 +105,8 @@ class ThemeTestCase(unittest.TestCase):
         self.assertEqual(theme_color.modes, ['light', 'dark'])
         self.assertEqual(args[1], "Blue")
         self.assertEqual(args[2], "/custom/dest")
+
+    def test_compile_compiles_installer_template(self):
+        self.theme.compile()
+
+        self.mock_installer.compile_template.assert_called_once()
@@ -5,6 +5,7 @@ from unittest.mock import Mock
 
 from scripts import config
 from scripts.utils.theme.theme_color_applier import ThemeColorApplier
+from scripts.utils.theme.theme_template import ThemeTemplate
 from ..._helpers import create_dummy_file
 
 
@@ -49,4 +50,13 @@ class ThemeColorApplierTestCase(unittest.TestCase):
             content = file.read()
             replaced = self.second_css
             replaced = replaced.replace("BACKGROUND-COLOR", "rgba(0, 0, 0, 1)")
-            assert content == replaced
\ No newline at end of file
+            assert content == replaced
+
+    def test_render_writes_colored_template_to_destination(self):
+        destination = os.path.join(self.temp_folder, "rendered")
+        template = ThemeTemplate.compile(self.temp_folder, ["ACCENT-COLOR", "ACCENT_HOVER", "BACKGROUND-COLOR"])
+
+        self.color_applier.render(template, Mock(), destination, "dark")
+
+        with open(os.path.join(destination, "file2.css"), "r") as file:
+            assert file.read() == "body { background-color: rgba(0, 0, 0, 1); }"
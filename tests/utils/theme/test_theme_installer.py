@@ -1,11 +1,13 @@
 import os
 import shutil
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, ANY
 
 from scripts import config
+from scripts.utils.theme.theme_color_applier import ThemeColorApplier
 from scripts.utils.theme.theme_installer import ThemeInstaller
 from scripts.utils.theme.theme_path_provider import ThemePathProvider
+from scripts.utils.theme.theme_template import RenderStats
 from ..._helpers import create_dummy_file
 
 
@@ -18,6 +20,8 @@ class ThemeInstallerTestCase(unittest.TestCase):
 
         self.logger_factory = Mock()
         self.color_applier = Mock()
+        self.color_applier.keywords = ["ACCENT-COLOR", "ACCENT_HOVER", "BACKGROUND-COLOR"]
+        self.color_applier.render.return_value = RenderStats()
         self.path_provider = ThemePathProvider()
         self.path_provider.get_theme_path = Mock(return_value=self.destination_folder)
 
@@ -57,7 +61,7 @@ class ThemeInstallerTestCase(unittest.TestCase):
         self.path_provider.get_theme_path.assert_called_once_with(
             self.destination_folder, name, "light", self.theme_type
         )
-        self.color_applier.apply.assert_called_once_with(theme_color, self.destination_folder, "light")
+        self.color_applier.render.assert_called_once_with(ANY, theme_color, self.destination_folder, "light")
 
     def test_install_with_custom_destination_calls_get_theme_path_and_apply_methods_with_correct_parameters(self):
         theme_color = Mock()
@@ -69,7 +73,7 @@ class ThemeInstallerTestCase(unittest.TestCase):
 
         # noinspection PyUnresolvedReferences
         self.path_provider.get_theme_path.assert_not_called()
-        self.color_applier.apply.assert_called_once_with(theme_color, self.custom_destination_folder, "light")
+        self.color_applier.render.assert_called_once_with(ANY, theme_color, self.custom_destination_folder, "light")
 
     def test_install_with_multiple_modes_calls_get_theme_path_and_apply_methods_for_each_mode(self):
         theme_color = Mock()
@@ -80,13 +84,13 @@ class ThemeInstallerTestCase(unittest.TestCase):
 
         # noinspection PyUnresolvedReferences
         self.assertEqual(self.path_provider.get_theme_path.call_count, 2)
-        self.assertEqual(self.color_applier.apply.call_count, 2)
+        self.assertEqual(self.color_applier.render.call_count, 2)
 
     def test_install_raises_exception_and_logs_error(self):
         theme_color = Mock()
         theme_color.modes = ["light"]
         name = "test-theme"
-        self.color_applier.apply.side_effect = Exception("Test error")
+        self.color_applier.render.side_effect = Exception("Test error")
 
         with self.assertRaises(Exception):
             self.theme_installer.install(theme_color, name)
@@ -100,10 +104,65 @@ class ThemeInstallerTestCase(unittest.TestCase):
         name = "test-theme"
         destination = os.path.join(self.destination_folder, "actual_destination")
         self.path_provider.get_theme_path.return_value = destination
+        self.theme_installer.color_applier = self._create_color_applier()
 
         self.theme_installer.install(theme_color, name)
 
         first_file_exists = os.path.exists(os.path.join(destination, "file1.css"))
         second_file_exists = os.path.exists(os.path.join(destination, "file2.css"))
         self.assertTrue(first_file_exists)
-        self.assertTrue(second_file_exists)
\ No newline at end of file
+        self.assertTrue(second_file_exists)
+
+    def test_install_renders_colors_into_destination(self):
+        theme_color = Mock()
+        theme_color.modes = ["light"]
+        destination = os.path.join(self.destination_folder, "actual_destination")
+        self.path_provider.get_theme_path.return_value = destination
+        self.theme_installer.color_applier = self._create_color_applier()
+
+        self.theme_installer.install(theme_color, "test-theme")
+
+        with open(os.path.join(destination, "file1.css")) as file:
+            self.assertEqual("body { background-color: rgba(255, 0, 0, 1); color: ACCENT_HOVER; }", file.read())
+
+    def test_install_skips_files_which_are_already_installed(self):
+        theme_color = Mock()
+        theme_color.modes = ["light"]
+        destination = os.path.join(self.destination_folder, "actual_destination")
+        self.path_provider.get_theme_path.return_value = destination
+        self.theme_installer.color_applier = self._create_color_applier()
+
+        first_stats = self.theme_installer.install(theme_color, "test-theme")
+        second_stats = self.theme_installer.install(theme_color, "test-theme")
+
+        self.assertEqual(RenderStats(written=2, skipped=0), first_stats)
+        self.assertEqual(RenderStats(written=0, skipped=2), second_stats)
+
+    def test_install_reuses_template_while_source_is_unchanged(self):
+        theme_color = Mock()
+        theme_color.modes = ["light", "dark"]
+
+        self.theme_installer.install(theme_color, "test-theme")
+
+        first_template = self.color_applier.render.call_args_list[0][0][0]
+        second_template = self.color_applier.render.call_args_list[1][0][0]
+        self.assertIs(first_template, second_template)
+
+    def test_install_recompiles_template_when_source_changes(self):
+        theme_color = Mock()
+        theme_color.modes = ["light"]
+        self.theme_installer.install(theme_color, "test-theme")
+        create_dummy_file(os.path.join(self.source_folder, "file3.css"), "new content")
+
+        self.theme_installer.install(theme_color, "test-theme")
+
+        first_template = self.color_applier.render.call_args_list[0][0][0]
+        second_template = self.color_applier.render.call_args_list[1][0][0]
+        self.assertIsNot(first_template, second_template)
+
+    @staticmethod
+    def _create_color_applier():
+        color_replacement_generator = Mock()
+        color_replacement_generator.keywords = ["ACCENT-COLOR"]
+        color_replacement_generator.convert.return_value = [("ACCENT-COLOR", "rgba(255, 0, 0, 1)")]
+        return ThemeColorApplier(color_replacement_generator)
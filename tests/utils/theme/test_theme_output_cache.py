@@ -0,0 +1,111 @@
+import os
+import shutil
+import unittest
+
+from scripts import config
+from scripts.utils.theme.theme_output_cache import ThemeOutputCache
+from scripts.utils.theme.theme_template import RenderStats
+from ..._helpers import create_dummy_file
+
+
+class ThemeOutputCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.temp_folder = os.path.join(config.temp_tests_folder, "theme_output_cache")
+        self.cache_folder = os.path.join(self.temp_folder, "cache")
+        self.source = os.path.join(self.temp_folder, "source")
+        self.destination = os.path.join(self.temp_folder, "destination")
+        create_dummy_file(os.path.join(self.source, "gnome-shell.css"), "a { color: red; }")
+        create_dummy_file(os.path.join(self.source, "assets", "icon.svg"), "<svg/>")
+
+        self.cache = ThemeOutputCache(self.cache_folder, max_size=1024)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_folder, ignore_errors=True)
+
+    def test_get_key_is_stable(self):
+        first = ThemeOutputCache.get_key("digest", 0, 100, "dark")
+        second = ThemeOutputCache.get_key("digest", 0, 100, "dark")
+
+        self.assertEqual(first, second)
+
+    def test_get_key_depends_on_every_part(self):
+        key = ThemeOutputCache.get_key("digest", 0, 100, "dark")
+
+        self.assertNotEqual(key, ThemeOutputCache.get_key("digest", 0, 100, "light"))
+        self.assertNotEqual(key, ThemeOutputCache.get_key("digest", 0, None, "dark"))
+        self.assertNotEqual(key, ThemeOutputCache.get_key("other", 0, 100, "dark"))
+
+    def test_restore_returns_none_for_missing_entry(self):
+        self.assertIsNone(self.cache.restore("missing", self.destination))
+        self.assertFalse(os.path.exists(self.destination))
+
+    def test_restore_copies_stored_entry(self):
+        self.cache.store("red", self.source)
+
+        restored = self.cache.restore("red", self.destination)
+
+        self.assertTrue(restored)
+        with open(os.path.join(self.destination, "gnome-shell.css")) as f:
+            self.assertEqual("a { color: red; }", f.read())
+        self.assertTrue(os.path.exists(os.path.join(self.destination, "assets", "icon.svg")))
+
+    def test_restore_reports_written_and_skipped_files(self):
+        self.cache.store("red", self.source)
+        create_dummy_file(os.path.join(self.destination, "gnome-shell.css"), "a { color: red; }")
+
+        stats = self.cache.restore("red", self.destination)
+
+        self.assertEqual(RenderStats(written=1, skipped=1), stats)
+
+    def test_restore_leaves_existing_folders_untouched(self):
+        self.cache.store("red", self.source)
+        self.cache.restore("red", self.destination)
+        assets_folder = os.path.join(self.destination, "assets")
+        os.utime(assets_folder, (0, 0))
+        os.utime(self.destination, (0, 0))
+
+        stats = self.cache.restore("red", self.destination)
+
+        self.assertEqual(RenderStats(skipped=2), stats)
+        self.assertEqual(0, os.stat(assets_folder).st_mtime)
+        self.assertEqual(0, os.stat(self.destination).st_mtime)
+
+    def test_store_keeps_entry_independent_from_source(self):
+        self.cache.store("red", self.source)
+        shutil.rmtree(self.source)
+
+        self.assertTrue(self.cache.restore("red", self.destination))
+
+    def test_store_does_not_leave_temporary_entries(self):
+        self.cache.store("red", self.source)
+        self.cache.store("red", self.source)
+
+        self.assertEqual(["red"], os.listdir(self.cache_folder))
+
+    def test_store_evicts_least_recently_used_entries(self):
+        cache = ThemeOutputCache(self.cache_folder, max_size=30)
+        cache.store("red", self.source)
+        os.utime(os.path.join(self.cache_folder, "red"), (1, 1))
+        cache.store("green", self.source)
+
+        self.assertFalse(cache.contains("red"))
+        self.assertTrue(cache.contains("green"))
+
+    def test_restore_marks_entry_as_recently_used(self):
+        cache = ThemeOutputCache(self.cache_folder, max_size=50)
+        cache.store("red", self.source)
+        os.utime(os.path.join(self.cache_folder, "red"), (1, 1))
+        cache.restore("red", self.destination)
+        cache.store("green", self.source)
+        os.utime(os.path.join(self.cache_folder, "green"), (2, 2))
+        cache.store("blue", self.source)
+
+        self.assertTrue(cache.contains("red"))
+        self.assertFalse(cache.contains("green"))
+
+    def test_clear_removes_all_entries(self):
+        self.cache.store("red", self.source)
+
+        self.cache.clear()
+
+        self.assertFalse(self.cache.contains("red"))
@@ -0,0 +1,45 @@
+import os
+import shutil
+import unittest
+
+from scripts import config
+from scripts.utils.style_manager import StyleManager
+from scripts.utils.theme.theme_preparation import ThemePreparation
+from scripts.utils.theme.theme_temp_manager import ThemeTempManager
+from ..._helpers import create_dummy_file
+
+
+class ThemePreparationTestCase(unittest.TestCase):
+    def setUp(self):
+        self.temp_folder = os.path.join(config.temp_tests_folder, "theme_preparation")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_folder, ignore_errors=True)
+
+    def _create_preparation(self, name: str) -> ThemePreparation:
+        temp_folder = os.path.join(self.temp_folder, name)
+        return ThemePreparation("sources",
+                                file_manager=ThemeTempManager(temp_folder),
+                                style_manager=StyleManager(os.path.join(temp_folder, f"{name}.css")))
+
+    def test_prepare_from_copies_files_and_renames_combined_styles(self):
+        prepared = self._create_preparation("gnome-shell-dark")
+        create_dummy_file(prepared.combined_styles_location, "stage {}")
+        create_dummy_file(os.path.join(prepared.temp_folder, "icons", "toggle.svg"), "<svg/>")
+        preparation = self._create_preparation("gnome-shell-light")
+
+        preparation.prepare_from(prepared)
+
+        self.assertEqual(["gnome-shell-light.css", os.path.join("icons", "toggle.svg")],
+                         sorted(preparation.file_system.walk_files(preparation.temp_folder)))
+        self.assertEqual("stage {}", preparation.file_system.read_text(preparation.combined_styles_location))
+
+    def test_prepare_from_does_not_change_prepared_theme(self):
+        prepared = self._create_preparation("gnome-shell-dark")
+        create_dummy_file(prepared.combined_styles_location, "stage {}")
+        preparation = self._create_preparation("gnome-shell-light")
+
+        preparation.prepare_from(prepared)
+        preparation.add_to_start("#panel {}")
+
+        self.assertEqual("stage {}", prepared.file_system.read_text(prepared.combined_styles_location))
@@ -0,0 +1,90 @@
+import os
+import shutil
+import unittest
+
+from scripts import config
+from scripts.utils.theme.theme_template import RenderStats, ThemeTemplate
+from ..._helpers import create_dummy_file
+
+
+class ThemeTemplateTestCase(unittest.TestCase):
+    def setUp(self):
+        self.source_folder = os.path.join(config.temp_tests_folder, "theme_template_source")
+        self.destination = os.path.join(config.temp_tests_folder, "theme_template_destination")
+        self.keywords = ["ACCENT-COLOR", "ACCENT-COLOR-SECONDARY", "BACKGROUND-COLOR"]
+
+        create_dummy_file(os.path.join(self.source_folder, "styles.css"),
+                          "a { color: ACCENT-COLOR; border: ACCENT-COLOR-SECONDARY; }")
+        create_dummy_file(os.path.join(self.source_folder, "icons", "icon.svg"),
+                          "<svg fill=\"BACKGROUND-COLOR\"/>")
+        create_dummy_file(os.path.join(self.source_folder, "image.png"), "ACCENT-COLOR")
+
+    def tearDown(self):
+        shutil.rmtree(self.source_folder, ignore_errors=True)
+        shutil.rmtree(self.destination, ignore_errors=True)
+
+    def test_compile_splits_text_files_into_literals_and_slots(self):
+        template = ThemeTemplate.compile(self.source_folder, self.keywords)
+
+        styles = next(file for file in template.files if file.relative_path == "styles.css")
+        self.assertEqual(
+            ("a { color: ", "ACCENT-COLOR", "; border: ", "ACCENT-COLOR-SECONDARY", "; }"),
+            styles.parts)
+
+    def test_compile_keeps_other_files_as_raw_content(self):
+        template = ThemeTemplate.compile(self.source_folder, self.keywords)
+
+        image = next(file for file in template.files if file.relative_path == "image.png")
+        self.assertFalse(image.is_text)
+        self.assertEqual(b"ACCENT-COLOR", image.content)
+
+    def test_render_writes_replaced_files_to_destination(self):
+        template = ThemeTemplate.compile(self.source_folder, self.keywords)
+
+        template.render(self.destination, {
+            "ACCENT-COLOR": "red",
+            "ACCENT-COLOR-SECONDARY": "blue",
+            "BACKGROUND-COLOR": "black",
+        })
+
+        self.assertEqual("a { color: red; border: blue; }", self._read("styles.css"))
+        self.assertEqual("<svg fill=\"black\"/>", self._read(os.path.join("icons", "icon.svg")))
+        self.assertEqual("ACCENT-COLOR", self._read("image.png"))
+
+    def test_render_keeps_keywords_without_replacement(self):
+        template = ThemeTemplate.compile(self.source_folder, self.keywords)
+
+        template.render(self.destination, {"ACCENT-COLOR": "red"})
+
+        self.assertEqual("a { color: red; border: ACCENT-COLOR-SECONDARY; }", self._read("styles.css"))
+
+    def test_render_skips_unchanged_files(self):
+        template = ThemeTemplate.compile(self.source_folder, self.keywords)
+        template.render(self.destination, {"ACCENT-COLOR": "red"})
+        styles = os.path.join(self.destination, "styles.css")
+        os.utime(styles, (1, 1))
+
+        stats = template.render(self.destination, {"ACCENT-COLOR": "red"})
+
+        self.assertEqual(RenderStats(written=0, skipped=3), stats)
+        self.assertEqual(1, os.stat(styles).st_mtime)
+
+    def test_render_writes_only_changed_files(self):
+        template = ThemeTemplate.compile(self.source_folder, self.keywords)
+        template.render(self.destination, {"ACCENT-COLOR": "red"})
+
+        stats = template.render(self.destination, {"ACCENT-COLOR": "green"})
+
+        self.assertEqual(RenderStats(written=1, skipped=2), stats)
+
+    def test_template_can_be_rendered_multiple_times(self):
+        template = ThemeTemplate.compile(self.source_folder, self.keywords)
+
+        template.render(self.destination, {"ACCENT-COLOR": "red"})
+        template.render(self.destination, {"ACCENT-COLOR": "green"})
+
+        self.assertIn("color: green;", self._read("styles.css"))
+
+    def _read(self, relative_path: str) -> str:
+        with open(os.path.join(self.destination, relative_path)) as file:
+            return file.read()
@@ -1,9 +1,13 @@
 import os.path
 import shutil
 import subprocess
-from argparse import ArgumentParser
+from argparse import ArgumentParser, ArgumentTypeError
 from scripts import config
+from scripts.utils.image_processor import (CachedImageProcessor, ImageEffects, ImageProcessor,
+                                           get_image_processor)
 from scripts.utils.is_photo import is_photo, NotSupportedPhotoExtension
+from scripts.utils.monitors import get_largest_monitor_resolution, parse_resolution
+from scripts.utils.theme.theme_output_cache import ThemeOutputCache
 
 def define_arguments(parser: ArgumentParser):
     gdm_args = parser.add_argument_group("GDM tweaks")
@@ -11,11 +15,15 @@ def define_arguments(parser: ArgumentParser):
     gdm_args.add_argument("--gdm-blur", type=int, nargs="?", help="Blur GDM background image (px)")
     gdm_args.add_argument("--gdm-darken", type=int, choices=range(0, 100), help="Darken GDM background image (%%)", metavar="(0 - 100)")
     gdm_args.add_argument("--gdm-lighten",  type=int, choices=range(0, 100), help="Lighten GDM background image", metavar="(0 - 100)")
+    gdm_args.add_argument("--gdm-image-resolution", type=_parse_resolution_argument,
+                          help="Downscale GDM background image to cover the resolution "
+                               "(largest connected monitor by default)", metavar="(WIDTHxHEIGHT | original)")
 
 
 def apply_tweak(args, theme, colors):
     if args.gdm_image:
-        gdm_image = GDMImage(args.gdm_image, config.temp_folder, args.gdm_blur)
+        gdm_image = GDMImage(args.gdm_image, config.temp_folder, args.gdm_blur,
+                             processor=_get_image_processor(args), resolution=_get_image_resolution(args))
 
         destination_dir = os.path.join(config.temp_folder, config.gdm_folder, config.raw_theme_folder)
         os.makedirs(destination_dir, exist_ok=True)
@@ -32,6 +40,32 @@ def apply_tweak(args, theme, colors):
         """
 
 
+def _parse_resolution_argument(value: str) -> tuple[int, int] | str:
+    if value == "original":
+        return value
+    resolution = parse_resolution(value)
+    if resolution is None:
+        raise ArgumentTypeError(f"invalid resolution {value}, use WIDTHxHEIGHT or original")
+    return resolution
+
+
+def _get_image_resolution(args) -> tuple[int, int] | None:
+    """Resolution the image is downscaled to, None to keep the original size"""
+    resolution = getattr(args, "gdm_image_resolution", None)
+    if resolution == "original":
+        return None
+    return resolution or get_largest_monitor_resolution()
+
+
+def _get_image_processor(args) -> ImageProcessor | None:
+    """Processed images are cached, so the same image is processed only once"""
+    processor = get_image_processor()
+    if processor is None or getattr(args, "no_cache", False):
+        return processor
+    return CachedImageProcessor(processor, ThemeOutputCache(config.gdm_image_cache_folder,
+                                                            config.gdm_image_cache_size))
+
+
 class GDMImage:
     """
     Class to apply effects to GDM background image
@@ -39,48 +73,83 @@ class GDMImage:
 
     image_name: str
 
-    def __init__(self, path: str, temp_folder: str, blur: int = None):
+    def __init__(self, path: str, temp_folder: str, blur: int = None, processor: ImageProcessor | None = None,
+                 resolution: tuple[int, int] | None = None):
+        """
+        :param processor: processor which applies effects (the best available one if None)
+        :param resolution: (width, height) the image is downscaled to cover, None to keep the original size
+        """
         self.path = path
+        self.processor = processor
 
         extension = path.split(".")[-1]
         if not is_photo(extension):
             raise NotSupportedPhotoExtension(extension)
+        if extension.lower() == "svg":
+            # vector images are rendered at the screen size anyway
+            resolution = None
 
         self.image_name = f"gdm-image.{extension}"
         self.destination_dir = temp_folder
         self.destination_file = os.path.join(self.destination_dir, self.image_name)
 
         if not os.path.exists(self.destination_file):
-            self._create_file()
-            self._magick_tweaks(blur)
+            self._create_file(ImageEffects(blur=blur, resolution=resolution))
 
     def copy_image(self, destination: str):
         dest_path = os.path.join(destination, self.image_name)
         shutil.copyfile(self.destination_file, dest_path)
 
-    def _create_file(self):
+    def _create_file(self, effects: ImageEffects):
         os.makedirs(self.destination_dir, exist_ok=True)
-        shutil.copyfile(self.path, self.destination_file)
+        if not effects or not self._apply_effects(effects):
+            shutil.copyfile(self.path, self.destination_file)
 
-    def _magick_tweaks(self, blur: int = None):
-        if not shutil.which("magick"):
-            print("Warning: ImageMagick not found. Image effects will be skipped.")
-            return
-
-        file = self.destination_file
+    def _apply_effects(self, effects: ImageEffects) -> bool:
+        """
+        Write the image with effects to the destination file
+        :return: False if effects were not applied
+        """
+        processor = self.processor or get_image_processor()
+        if processor is None:
+            print("Warning: Neither Pillow nor ImageMagick found. Image effects and downscaling will be skipped.")
+            return False
 
-        modified = False
-        command = ["magick", file]
+        if not processor.is_cached(self.path, self.destination_file, effects):
+            print("Applying image filters... This may take a while.")
+        try:
+            processor.process(self.path, self.destination_file, effects)
+        except (OSError, ValueError, subprocess.CalledProcessError):
+            print(f"Error: Failed to apply image effects to {self.path}")
+            return False
 
-        if blur:
-            command.extend(["-blur", f"0x{blur}"])
-            modified = True
+        self._report_savings(processor, effects)
+        return True
 
-        if modified:
-            print("Applying image filters... This may take a while.")
-            output_file = file
-            command.append(output_file)
-            try:
-                subprocess.run(command, check=True)
-            except subprocess.CalledProcessError:
-                print(f"Error: Failed to apply image effects to {file}")
\ No newline at end of file
+    def _report_savings(self, processor: ImageProcessor, effects: ImageEffects):
+        """
+        Print how much smaller the image is.
+        Decoding time is proportional to the number of pixels, so it is estimated from the dimensions.
+        """
+        source_bytes = os.path.getsize(self.path)
+        result_bytes = os.path.getsize(self.destination_file)
+        source_size = processor.get_size(self.path)
+        result_size = processor.get_size(self.destination_file)
+
+        if not effects.blur and source_size == result_size and result_bytes >= source_bytes:
+            # nothing to downscale and re-encoding didn't help
+            shutil.copyfile(self.path, self.destination_file)
+            result_bytes = source_bytes
+
+        report = f"GDM image: {self._format_bytes(source_bytes)} -> {self._format_bytes(result_bytes)}"
+        if source_bytes:
+            report += f" ({100 - result_bytes * 100 // source_bytes}% smaller)"
+        if source_size and result_size:
+            pixels_ratio = (source_size[0] * source_size[1]) / (result_size[0] * result_size[1])
+            report += (f", {source_size[0]}x{source_size[1]} -> {result_size[0]}x{result_size[1]}"
+                       f" (~{pixels_ratio:.1f}x faster to decode)")
+        print(report)
+
+    @staticmethod
+    def _format_bytes(size: int) -> str:
+        return f"{size / 1024 / 1024:.1f} MiB"
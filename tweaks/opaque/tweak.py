@@ -8,8 +8,4 @@ def define_arguments(parser):
 
 def apply_tweak(args, theme: Theme, colors):
     if args.opaque:
-        with open(theme.main_styles, "r") as file:
-            content = file.read()
-        with open(theme.main_styles, "w") as file:
-            replaced_content = content.replace("BACKGROUND-COLOR", "BACKGROUND-OPAQUE-COLOR")
-            file.write(replaced_content)
\ No newline at end of file
+        theme.replace_keywords(("BACKGROUND-COLOR", "BACKGROUND-OPAQUE-COLOR"))